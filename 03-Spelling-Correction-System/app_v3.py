@@ -1,8 +1,8 @@
 import streamlit as st
-import time
-import re
 
-from spelling_sys.SpellCheckerHybridNGram_v3 import detect_and_suggest_corrections, plot_doc_cat_dis, plot_doc_length_hist, plot_top_n_most_frequent_words, plot_word_cloud
+from spelling_sys import profiling
+from spelling_sys import tokenizer
+from spelling_sys.registry import ENGINES, DEFAULT_ENGINE, load_engine, loaded_engines
 
 def main_app():
 
@@ -31,12 +31,9 @@ def main_app():
         if st.session_state["remaining_errors"]:
             current_word = st.session_state["remaining_errors"][st.session_state["current_index"]]
             
-            # Use regex to find and replace the misspelled word while keeping punctuation
-            pattern = rf'\b{re.escape(current_word)}(\W*)'  # Matches word + optional punctuation
-            st.session_state["corrected_text"] = re.sub(
-                pattern, 
-                lambda m: selected_correction + m.group(1),  # Retains punctuation
-                st.session_state["corrected_text"]
+            # Replace the misspelled word by its token spans (whole words only, punctuation is kept)
+            st.session_state["corrected_text"] = tokenizer.replace_word(
+                st.session_state["corrected_text"], current_word, selected_correction
             )
             
             # Remove the corrected word from the error list
@@ -50,18 +47,14 @@ def main_app():
 
     # Function to highlight misspelled words dynamically
     def highlight_text(text, selected_word, misspelled_words):
-        def replacement(match):
-            word = match.group(0)  # Extract matched word
-            if word == selected_word:
-                return f"<span class='misspelled selected'>{word}</span>"
+        def replacement(token):
+            if token.text == selected_word:
+                return f"<span class='misspelled selected'>{token.text}</span>"
             else:
-                return f"<span class='misspelled'>{word}</span>"
+                return f"<span class='misspelled'>{token.text}</span>"
 
-        # Ensure the regex properly matches the last word without space issues
-        pattern = r'\b(' + '|'.join(re.escape(word) for word in misspelled_words) + r')(?!\w)'
-        text = re.sub(pattern, replacement, text)
-
-        return text
+        # Wrap the misspelled words using the (cached) token spans of the text
+        return tokenizer.render_tokens(text, misspelled_words, replacement)
         
     # Function to get the currently selected misspelled word & highlight text dynamically
     def get_highlight_word(misspelled_words):
@@ -155,9 +148,72 @@ def main_app():
     if "file_upload" not in st.session_state:
         st.session_state["file_upload"] = None
 
-    # Ensure loading session state exists
-    if "loading" not in st.session_state:
-        st.session_state["loading"] = False
+    # NOTE: Spell Checker Engine (loaded once per process and shared across sessions)
+    with st.sidebar:
+        st.subheader("Spell Checker Engine ⚙️")
+
+        versions = list(ENGINES)
+        version = st.selectbox("Engine Version:", versions, index=versions.index(DEFAULT_ENGINE),
+                               format_func=lambda v: ENGINES[v]["label"], key="engine_version")
+
+        try:
+            engine = load_engine(version)
+        except ImportError as e:
+            st.error(f"⚠️ Could not load {ENGINES[version]['label']}: {e}")
+            st.stop()
+
+        # Load time and memory of every engine loaded in this process
+        with st.expander("Loaded Engines"):
+            st.dataframe(loaded_engines(), hide_index=True, use_container_width=True)
+
+    # NOTE: Custom Dictionary (per user / organisation)
+    tenant = None
+
+    if engine.supports_tenants:
+        custom_dictionary = engine.module.custom_dictionary
+
+        with st.sidebar:
+            st.subheader("Custom Dictionary 📚")
+
+            # Select which user / organisation dictionary to check against
+            tenant = st.selectbox("Dictionary:", custom_dictionary.tenants(), key="tenant")
+
+            # Add words (tickers, company names, jargon) at runtime
+            new_words = st.text_input("Add words (comma separated):", key="new_words")
+
+            if st.button("Add to Dictionary") and new_words:
+                try:
+                    custom_dictionary.add_words(tenant, new_words.split(","))
+                    st.toast(f"Added to the '{tenant}' dictionary!", icon="✅")
+                except ValueError as e:
+                    st.error(f"⚠️ {e}")
+
+    # NOTE: Spell Check Runner
+
+    # Function to run the spell check, keeping this session's per-stage timings (when profiling is on)
+    def check_text(text, progress=None):
+        with profiling.request("detect_and_suggest_corrections") as record:
+            result = engine.check(text, tenant=tenant, progress=progress)
+
+        if record is not None:
+            st.session_state["last_request"] = record
+
+        return result
+
+    # Function to run the spell check with a progress bar driven by the checker's own stages
+    def run_spell_check(text, placeholder):
+        progress_bar = placeholder.progress(0.0, text="Checking for spelling errors...")
+
+        misspelled_words, corrections_dict = check_text(
+            text, progress=lambda fraction, message: progress_bar.progress(fraction, text=message)
+        )
+
+        placeholder.empty()
+
+        if len(text) > 0:
+            st.toast("Spelling Check Done!", icon="✅")
+
+        return misspelled_words, corrections_dict
 
     # NOTE: Input Section
 
@@ -174,20 +230,20 @@ def main_app():
     # Create column for "Analyze Text" and "Reset Text" buttons
     col1, col2, col3  = st.columns([1.1, 1, 4])
 
+    # Placeholder for the spell check progress bar (full width, below the buttons)
+    progress_placeholder = st.empty()
+
     with col1:
         # Click button and display output as expander
         if st.button("Analyze Text"):
             
             # NOTE: Text Analysis
-            misspelled_words, corrections_dict = detect_and_suggest_corrections(text_input)
+            misspelled_words, corrections_dict = run_spell_check(text_input, progress_placeholder)
 
             # Store results in session state
             st.session_state["misspelled_words"] = misspelled_words
             st.session_state["corrections_dict"] = corrections_dict
 
-            # Start loading
-            st.session_state["loading"] = True
-            
             # Mark that analyze button was clicked
             st.session_state["analyze_clicked"] = True
             st.session_state["expander_open"] = False
@@ -212,15 +268,6 @@ def main_app():
     # Only show the spelling check results if the "Analyze Text" button was clicked
     if st.session_state["analyze_clicked"] and len(text_input) > 0:
 
-        if st.session_state["loading"]:
-            # Add spinner
-            with st.spinner("Checking for spelling errors...", show_time=True):
-                time.sleep(1)
-                st.toast("Spelling Check Done!", icon="✅")
-
-        # Stop loading after the process completes
-        st.session_state["loading"] = False
-
         st.subheader("Spelling Check 🔍")
 
         with st.expander("Click here to view the spelling check results", expanded=st.session_state["expander_open"]):
@@ -253,7 +300,7 @@ def main_app():
                             replace_word(selected_correction)
 
                             # NOTE: Rerun Text Analysis Again (Taking correlation between words into consideration)
-                            misspelled_words, corrections_dict = detect_and_suggest_corrections(st.session_state["corrected_text"])
+                            misspelled_words, corrections_dict = check_text(st.session_state["corrected_text"])
 
                             # Store results in session state
                             st.session_state["misspelled_words"] = misspelled_words
@@ -288,6 +335,13 @@ def main_app():
                 # Download Text
                 st.download_button("Download Corrected Text (txt)", corrected_text, "corrected_text.txt")
 
+        # Per-stage timings of this session's last check (only when started with SPELLCHECK_PROFILE=1)
+        record = st.session_state.get("last_request")
+        if profiling.is_enabled() and record is not None:
+            with st.expander("Performance Breakdown ⏱️"):
+                st.write(f"**Total Time:** {record.total_ms:.1f} ms")
+                st.dataframe(record.to_rows(), hide_index=True, use_container_width=True)
+
 def about_app():
     st.title("About This App 📌")
     st.write("""
@@ -309,20 +363,24 @@ def about_app():
 
     st.subheader("About the Data")
     st.write()
+
+    # Reuters corpus plots come from the v3 engine (shared with the main page, not reloaded)
+    reuters_engine = load_engine("v3").module
+
     with st.expander("Word Frequency Distribution"):
-        plt = plot_top_n_most_frequent_words(20, (15,6))
+        plt = reuters_engine.plot_top_n_most_frequent_words(20, (15,6))
         st.pyplot(plt)
 
     with st.expander("Word Cloud"):
-        plt = plot_word_cloud(500, 150, (10, 5))
+        plt = reuters_engine.plot_word_cloud(500, 150, (10, 5))
         st.pyplot(plt)
 
     with st.expander("Document Categories Distribution"):
-        plt = plot_doc_cat_dis(5, (7, 7))
+        plt = reuters_engine.plot_doc_cat_dis(5, (7, 7))
         st.pyplot(plt)
 
     with st.expander("Document Length Distribution"):
-        plt = plot_doc_length_hist((15, 6), 50)
+        plt = reuters_engine.plot_doc_length_hist((15, 6), 50)
         st.pyplot(plt)
 
     st.subheader("Methodology 🛠️")
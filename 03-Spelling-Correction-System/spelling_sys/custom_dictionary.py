@@ -0,0 +1,156 @@
+import os
+import re
+import tempfile
+import threading
+import time
+
+# NOTE: Custom dictionaries (per user / organisation) layered over the base SpellChecker vocabulary
+# Each tenant has a plain text file "<tenant>.txt" in the dictionaries folder with one word per line
+# (tickers, company names, jargon, ...). Only the overlay words are kept per tenant; the base Reuters
+# vocabulary stays in the shared SpellChecker and is never copied. The "default" dictionary applies to everyone.
+
+DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionaries")
+DEFAULT_TENANT = "default"
+
+# Tenant names double as file names, so keep them simple
+TENANT_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+EMPTY_WORDS = frozenset()
+
+
+# Function to normalize a dictionary word the same way the checkers normalize input words
+def normalize_word(word):
+    return word.strip().lower().strip(".,!?-")
+
+
+class DictionaryOverlay:
+
+    def __init__(self, directory=DICTIONARY_DIR, poll_interval=2.0):
+        self.directory = directory
+        self.poll_interval = poll_interval
+
+        # tenant -> (file mtime, frozenset of words); replaced as a whole on every reload
+        self._snapshot = {}
+        self._last_poll = 0.0
+
+        # Serialises reloads and writes only, lookups never take the lock
+        self._lock = threading.Lock()
+        self._watcher = None
+
+        self.reload()
+
+    # NOTE: Loading & Hot Reload
+
+    # Function to read one dictionary file into a set of normalized words
+    @staticmethod
+    def _read_words(path):
+        with open(path, encoding="utf-8") as f:
+            words = (normalize_word(line) for line in f if not line.lstrip().startswith("#"))
+            return frozenset(word for word in words if word)
+
+    # Function to re-read changed dictionary files and swap them in atomically
+    def reload(self):
+        with self._lock:
+            current = self._snapshot
+            snapshot = {}
+
+            if os.path.isdir(self.directory):
+                for file_name in os.listdir(self.directory):
+                    tenant, ext = os.path.splitext(file_name)
+                    if ext != ".txt" or not TENANT_PATTERN.match(tenant):
+                        continue
+
+                    path = os.path.join(self.directory, file_name)
+                    try:
+                        mtime = os.stat(path).st_mtime_ns
+
+                        # Reuse the already loaded words if the file did not change
+                        if tenant in current and current[tenant][0] == mtime:
+                            snapshot[tenant] = current[tenant]
+                        else:
+                            snapshot[tenant] = (mtime, self._read_words(path))
+                    except OSError as e:
+                        print(f"Dictionary Error: {e} | File: '{path}'")
+                        if tenant in current:
+                            snapshot[tenant] = current[tenant]  # Keep serving the last good version
+
+            # Single reference swap, readers see either the old or the new snapshot, never a mix
+            self._snapshot = snapshot
+            self._last_poll = time.monotonic()
+
+    # Function to reload when the poll interval has passed (called on lookups)
+    def maybe_reload(self):
+        if self._watcher is None and time.monotonic() - self._last_poll >= self.poll_interval:
+            self.reload()
+
+    # Function to watch the dictionary folder in a background thread instead of polling on lookups
+    def start_watching(self):
+        if self._watcher is not None:
+            return
+
+        def watch():
+            while True:
+                time.sleep(self.poll_interval)
+                self.reload()
+
+        self._watcher = threading.Thread(target=watch, name="dictionary-watcher", daemon=True)
+        self._watcher.start()
+
+    # NOTE: Lookups
+
+    # Function to list the available tenant dictionaries
+    def tenants(self):
+        self.maybe_reload()
+        return sorted(set(self._snapshot) | {DEFAULT_TENANT})
+
+    # Function to get the overlay layers (default + tenant) without merging them
+    def layers(self, tenant=None):
+        self.maybe_reload()
+        snapshot = self._snapshot
+
+        default_words = snapshot.get(DEFAULT_TENANT, (None, EMPTY_WORDS))[1]
+        if not tenant or tenant == DEFAULT_TENANT:
+            return (default_words,)
+
+        return (default_words, snapshot.get(tenant, (None, EMPTY_WORDS))[1])
+
+    # Function to check whether a (normalized) word is in the tenant's overlay
+    def contains(self, word, tenant=None):
+        return any(word in layer for layer in self.layers(tenant))
+
+    # Function to drop words known to the tenant's overlay from a set of unknown words
+    def filter_unknown(self, unknown_words, tenant=None):
+        layers = self.layers(tenant)
+        return {word for word in unknown_words if not any(word in layer for layer in layers)}
+
+    # Function to get overlay words within one edit of a misspelled word
+    def candidates(self, word, spell, tenant=None):
+        layers = self.layers(tenant)
+        if not any(layers):
+            return set()
+
+        return {edit for edit in spell.edit_distance_1(word) if any(edit in layer for layer in layers)}
+
+    # NOTE: Updates
+
+    # Function to add words to a tenant's dictionary file (written atomically, then hot reloaded)
+    def add_words(self, tenant, new_words):
+        if not TENANT_PATTERN.match(tenant or ""):
+            raise ValueError(f"Invalid dictionary name: '{tenant}'. Use letters, digits, '_' or '-' only.")
+
+        new_words = {normalize_word(word) for word in new_words} - {""}
+        if not new_words:
+            return
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{tenant}.txt")
+            existing = self._read_words(path) if os.path.exists(path) else EMPTY_WORDS
+
+            # Write to a temp file in the same folder and rename, so readers never see a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(sorted(existing | new_words)) + "\n")
+            os.replace(tmp_path, path)
+
+        self.reload()
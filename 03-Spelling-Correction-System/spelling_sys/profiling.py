@@ -0,0 +1,206 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# NOTE: Opt-in hot-path instrumentation for the spell checker pipeline
+# Disabled by default. Turn it on with the environment variable SPELLCHECK_PROFILE=1 or by calling enable().
+# When disabled, stage() returns a shared no-op context manager so the checkers pay almost nothing.
+
+_enabled = os.environ.get("SPELLCHECK_PROFILE", "").lower() in ("1", "true", "yes")
+
+# Upper bounds (ms) of the latency histogram buckets
+HISTOGRAM_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, float("inf"))
+
+_NULL_CONTEXT = nullcontext()
+
+_local = threading.local()  # Holds the record of the request running on this thread
+_lock = threading.Lock()  # Guards the aggregated histograms
+
+_histograms = {}
+
+
+# Function to turn instrumentation on / off at runtime
+def enable():
+    global _enabled
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+
+# NOTE: Per-request records
+
+class RequestRecord:
+
+    def __init__(self, label=None):
+        self.label = label
+        self.total_ms = 0.0
+        # stage -> {"time_ms": float, "calls": int, "candidates": int}
+        self.stages = defaultdict(lambda: {"time_ms": 0.0, "calls": 0, "candidates": 0})
+
+    # Function to convert the record into rows for display (e.g. st.dataframe)
+    def to_rows(self):
+        return [{"stage": name, **values} for name, values in self.stages.items()]
+
+
+# Function to group all stages run inside it into one request record
+# The record is yielded to the caller (None when disabled), so each session keeps its own records
+@contextmanager
+def request(label=None):
+    if not _enabled or getattr(_local, "record", None) is not None:
+        # Disabled, or nested inside an outer request that already collects the stages
+        yield getattr(_local, "record", None)
+        return
+
+    record = RequestRecord(label)
+    _local.record = record
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record.total_ms = (time.perf_counter() - start) * 1000
+        _local.record = None
+
+
+# NOTE: Stage timing
+
+# Function to add one timing to the aggregated histogram of a stage
+def _observe(name, elapsed_ms):
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "buckets": [0] * len(HISTOGRAM_BUCKETS_MS)}
+
+        hist["count"] += 1
+        hist["total_ms"] += elapsed_ms
+        hist["max_ms"] = max(hist["max_ms"], elapsed_ms)
+
+        for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                hist["buckets"][i] += 1
+                break
+
+@contextmanager
+def _timed_stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _observe(name, elapsed_ms)
+
+        record = getattr(_local, "record", None)
+        if record is not None:
+            record.stages[name]["time_ms"] += elapsed_ms
+            record.stages[name]["calls"] += 1
+
+
+# Function to time a block of code as a named stage (wall time, call count)
+def stage(name):
+    if not _enabled:
+        return _NULL_CONTEXT
+    return _timed_stage(name)
+
+
+# Function to record how many candidates a stage produced for the current request
+def count(name, n):
+    if not _enabled:
+        return
+
+    record = getattr(_local, "record", None)
+    if record is not None:
+        record.stages[name]["candidates"] += n
+
+
+# Decorator to time a whole function as a stage
+# With new_request=True every call is also grouped into its own request record (used on the entry points)
+def instrument(name, new_request=False):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            if new_request:
+                with request(name), _timed_stage(name):
+                    return func(*args, **kwargs)
+            with _timed_stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# NOTE: Aggregated histograms
+
+# Function to get the aggregated per-stage latency histograms
+def histograms():
+    labels = [f"<={bound:g}ms" if bound != float("inf") else f">{HISTOGRAM_BUCKETS_MS[-2]:g}ms" for bound in HISTOGRAM_BUCKETS_MS]
+
+    with _lock:
+        return {
+            name: {
+                "count": hist["count"],
+                "total_ms": hist["total_ms"],
+                "mean_ms": hist["total_ms"] / hist["count"],
+                "max_ms": hist["max_ms"],
+                "buckets": dict(zip(labels, hist["buckets"])),
+            }
+            for name, hist in _histograms.items()
+        }
+
+# Function to clear the histograms
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+# NOTE: Profiler reports
+
+# Function to profile one call func(*args, **kwargs) (e.g. detect_and_suggest_corrections) and return the report as text
+# If output_file is given, the raw profile is also saved (.prof for cProfile / snakeviz, .html for pyinstrument)
+def profile_report(func, args=(), kwargs=None, backend="cprofile", sort="cumulative", limit=30, output_file=None):
+    kwargs = kwargs or {}
+
+    if backend == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ImportError("pyinstrument is not installed. Try `pip install pyinstrument` or use backend='cprofile'.")
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            func(*args, **kwargs)
+        finally:
+            profiler.stop()
+
+        if output_file:
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+        return profiler.output_text(unicode=True)
+
+    if backend != "cprofile":
+        raise ValueError(f"Unknown profiler backend: '{backend}'. Use 'cprofile' or 'pyinstrument'.")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        func(*args, **kwargs)
+    finally:
+        profiler.disable()
+
+    if output_file:
+        profiler.dump_stats(output_file)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
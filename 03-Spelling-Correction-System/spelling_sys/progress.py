@@ -0,0 +1,29 @@
+# NOTE: Progress reporting shared by the spell checker pipelines
+# Callers (e.g. a Streamlit progress bar) pass progress(fraction, message). Each update is a websocket
+# round-trip, so the pipelines report through progress_reporter(), which only fires when the whole percent
+# or the message changes, never once per token.
+
+# Share of the progress bar used by the per-token correction loop (detection stages report before it)
+TOKEN_LOOP_START = 0.3
+
+
+# Function to wrap the caller's progress callback, returns report(fraction, message)
+def progress_reporter(progress):
+    last = {"percent": None, "message": None}
+
+    def report(fraction, message):
+        fraction = min(fraction, 1.0)
+        percent = int(fraction * 100)
+
+        if progress is not None and (percent, message) != (last["percent"], last["message"]):
+            last["percent"], last["message"] = percent, message
+            progress(fraction, message)
+
+    return report
+
+
+# Function to walk through the tokens of a text, reporting the loop's progress from start to 1.0 (yields (index, token))
+def track_tokens(report, tokens, message, start=TOKEN_LOOP_START):
+    for i, token in enumerate(tokens):
+        report(start + (1.0 - start) * i / len(tokens), message)
+        yield i, token
@@ -0,0 +1,93 @@
+import streamlit as st
+
+import importlib
+import inspect
+import sys
+import time
+
+# NOTE: Process-wide registry of spell checker engines
+# Each checker module builds its model (Reuters corpus, n-grams, SpellChecker, BERT / LanguageTool) at import time.
+# Loading it through load_engine() keeps one instance per process in st.cache_resource, shared by all sessions
+# and reruns, and only loads the versions that are actually selected.
+
+ENGINES = {
+    "v1": {"module": "ss.SpellCheckerBigram_v1", "label": "v1 - Bigram"},
+    "v2": {"module": "ss.SpellCheckerBigram_BERT_v2", "label": "v2 - Bigram + BERT"},
+    "v3": {"module": "spelling_sys.SpellCheckerHybridNGram_v3", "label": "v3 - Hybrid N-Gram"},
+    "v4": {"module": "ss.SpellCheckerHybridNGram_LanguageToolPython_v4", "label": "v4 - Hybrid N-Gram + LanguageTool"},
+}
+
+DEFAULT_ENGINE = "v3"
+
+# version -> SpellEngine, filled as engines get loaded (used for the load time / memory report)
+_loaded_engines = {}
+
+
+# Function to get the resident memory of this process in MB
+def _memory_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak RSS (bytes on macOS, KB on Linux)
+        return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+    except ImportError:
+        return float("nan")  # Not available (e.g. Windows without psutil)
+
+
+class SpellEngine:
+
+    def __init__(self, version, module, load_time_s, memory_mb):
+        self.version = version
+        self.label = ENGINES[version]["label"]
+        self.module = module
+        self.load_time_s = load_time_s
+        self.memory_mb = memory_mb
+
+        # Check which optional arguments this version's pipeline understands
+        parameters = inspect.signature(module.detect_and_suggest_corrections).parameters
+        self.supports_tenants = "tenant" in parameters
+        self.supports_progress = "progress" in parameters
+
+    # Function to run the version's detect + suggest pipeline with the options it supports
+    def check(self, text, top_n=5, tenant=None, progress=None):
+        kwargs = {"top_n": top_n}
+        if self.supports_tenants:
+            kwargs["tenant"] = tenant
+        if self.supports_progress:
+            kwargs["progress"] = progress
+
+        return self.module.detect_and_suggest_corrections(text, **kwargs)
+
+
+# Function to load a spell checker engine once per process
+@st.cache_resource(show_spinner="Loading spell checker engine...")
+def load_engine(version):
+    if version not in ENGINES:
+        raise ValueError(f"Unknown spell checker engine: '{version}'. Choose one of {list(ENGINES)}.")
+
+    memory_before = _memory_mb()
+    start = time.perf_counter()
+
+    module = importlib.import_module(ENGINES[version]["module"])
+
+    engine = SpellEngine(version, module, time.perf_counter() - start, _memory_mb() - memory_before)
+    _loaded_engines[version] = engine
+
+    return engine
+
+
+# Function to report load time and memory of the engines loaded in this process
+def loaded_engines():
+    return [
+        {
+            "Engine": engine.label,
+            "Load Time (s)": round(engine.load_time_s, 2),
+            "Memory (MB)": round(engine.memory_mb, 1),
+        }
+        for version, engine in sorted(_loaded_engines.items())
+    ]
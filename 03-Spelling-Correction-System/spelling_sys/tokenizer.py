@@ -0,0 +1,49 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# NOTE: Shared tokenizer for the spell checkers and the apps
+# The text is scanned once with a precompiled pattern; every token keeps its character span, so detection,
+# suggestion, highlighting and replacement all work from the same tokens instead of re-scanning the text.
+
+# Words incl. contractions & hyphenated words (e.g. "didn't", "cutting-edge")
+WORD_PATTERN = re.compile(r"\b\w+['-]?\w*\b")
+
+# text: word as typed, norm: normalized for SpellChecker lookup, start / end: character span, index: word position
+Token = namedtuple("Token", ["text", "norm", "start", "end", "index"])
+
+
+# Function to normalize a word for SpellChecker lookup
+def normalize(word):
+    return word.lower().strip(".,!?-")
+
+
+# Function to split text into tokens with spans (cached, the apps re-tokenize the same text on every rerun)
+@lru_cache(maxsize=256)
+def tokenize(text):
+    return tuple(
+        Token(match.group(0), normalize(match.group(0)), match.start(), match.end(), i)
+        for i, match in enumerate(WORD_PATTERN.finditer(text))
+    )
+
+
+# Function to rebuild text with the selected tokens rendered differently (e.g. wrapped in HTML for highlighting)
+def render_tokens(text, words, render):
+    words = set(words)
+    parts = []
+    last_end = 0
+
+    for token in tokenize(text):
+        if token.text in words:
+            parts.append(text[last_end:token.start])
+            parts.append(render(token))
+            last_end = token.end
+
+    parts.append(text[last_end:])
+
+    return "".join(parts)
+
+
+# Function to replace every occurrence of a word (whole tokens only) while keeping the surrounding punctuation
+def replace_word(text, word, replacement):
+    return render_tokens(text, [word], lambda token: replacement)
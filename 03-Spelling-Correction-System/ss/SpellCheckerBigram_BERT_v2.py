@@ -15,6 +15,18 @@ from torch import Tensor
 from collections import Counter, defaultdict
 import re
 
+# Custom (user / organisation) dictionaries
+from spelling_sys.custom_dictionary import DictionaryOverlay
+
+# Opt-in hot-path instrumentation
+from spelling_sys import profiling
+
+# Shared tokenizer (precompiled pattern, tokens with spans)
+from spelling_sys.tokenizer import normalize, tokenize
+
+# Throttled progress reporting
+from spelling_sys.progress import progress_reporter, track_tokens
+
 # Ensure necessary downloads
 nltk.download("punkt")
 nltk.download("reuters")
@@ -79,27 +91,31 @@ for w1, w2 in bigrams(tokens):
 spell = SpellChecker()
 spell.word_frequency.load_words(list(word_freq.keys()))  # Load Reuters words
 
-# Add Custom Word List
-spell.word_frequency.load_words(["cutting-edge"])
+# Custom dictionaries layered over the Reuters vocabulary (hot reloaded from spelling_sys/dictionaries)
+custom_dictionary = DictionaryOverlay()
 
 # NOTE: Functions for Detections
 # Function to detect misspelled words while preserving original input formatting
-def detect_misspellings(text):
-    # Extract words while keeping their original form
-    words = re.findall(r"\b\w+['-]?\w*\b", text)  # Keeps contractions & hyphenated words
-
-    # Normalize words to lowercase for SpellChecker lookup
-    normalized_words = [word.lower().strip(".,!?") for word in words]
+@profiling.instrument("detect_misspellings")
+def detect_misspellings(text, tenant=None):
+    with profiling.stage("tokenize"):
+        # Extract words (original form + normalized form for SpellChecker lookup), keeps contractions & hyphenated words
+        tokens = tokenize(text)
 
     # Find misspelled words using normalized text
-    unknown_words = spell.unknown(normalized_words)
+    with profiling.stage("spell.unknown"):
+        unknown_words = spell.unknown([token.norm for token in tokens])
+
+    # Words in the user / organisation dictionary are not misspelled
+    unknown_words = custom_dictionary.filter_unknown(unknown_words, tenant)
 
     # Return original words from the input (not the normalized version)
-    misspelled_words = [words[i] for i, norm_word in enumerate(normalized_words) if norm_word in unknown_words]
+    misspelled_words = [token.text for token in tokens if token.norm in unknown_words]
 
     return misspelled_words
 
 # Function to detect context-based errors using BERT
+@profiling.instrument("is_real_word_error")
 def is_real_word_error(prev_word, word, next_word, full_text, threshold=0.2):
 
     bert_suggestions, confidence_scores = get_bert_suggestions(word, prev_word, next_word, full_text)
@@ -125,6 +141,7 @@ def is_real_word_error(prev_word, word, next_word, full_text, threshold=0.2):
 
 # NOTE: Function for Suggestions
 # Function to check for real-word spelling errors using BERT
+@profiling.instrument("get_bert_suggestions")
 def get_bert_suggestions(word, prev_word, next_word, full_text):
 
     if not prev_word or not next_word:
@@ -138,12 +155,14 @@ def get_bert_suggestions(word, prev_word, next_word, full_text):
     context_window = " ".join(words[max(0, word_idx - 3) : min(len(words), word_idx + 4)]).replace(word, "[MASK]")
 
     try:
-        predictions = bert_corrector(context_window)
+        with profiling.stage("bert"):
+            predictions = bert_corrector(context_window)
         bert_suggestions = [p['token_str'] for p in predictions[:3]]  # Top 3 predictions
         confidence_scores = [p['score'] for p in predictions[:3]]  # Corresponding confidence scores
 
         # Remove punctuation and symbols from suggestions
         bert_suggestions = [s for s in bert_suggestions if re.match(r"^[a-zA-Z'-]+$", s)]
+        profiling.count("bert", len(bert_suggestions))
 
         return bert_suggestions, confidence_scores
     except Exception as e:
@@ -151,37 +170,47 @@ def get_bert_suggestions(word, prev_word, next_word, full_text):
         return [], []
 
 # Function to suggest corrections using SpellChecker + Bigram + BERT
-def suggest_corrections(word, prev_word=None, next_word=None, full_text=None, top_n=5):
+@profiling.instrument("suggest_corrections")
+def suggest_corrections(word, prev_word=None, next_word=None, full_text=None, top_n=5, tenant=None):
 
-    word = word.lower().strip(".,!?")  # Normalize word for lookup
+    word = normalize(word)  # Normalize word for lookup
     
     # Get candidates from SpellChecker
-    try:
-        spell_candidates = spell.candidates(word)
-        
-        if spell_candidates is None:  # Handle None case explicitly
-            spell_candidates = []
+    with profiling.stage("spell.candidates"):
+        try:
+            spell_candidates = spell.candidates(word)
+            
+            if spell_candidates is None:  # Handle None case explicitly
+                spell_candidates = []
 
-        spell_candidates = list(spell_candidates)  # Convert to list safely
+            spell_candidates = list(spell_candidates)  # Convert to list safely
 
-    except Exception as e:
-        print(f"Error: {e} | Problematic word: '{word}'")
-        spell_candidates  = []  # Return an empty list instead of failing
+        except Exception as e:
+            print(f"Error: {e} | Problematic word: '{word}'")
+            spell_candidates  = []  # Return an empty list instead of failing
+
+    # Add user / organisation dictionary words within one edit of the misspelled word
+    custom_candidates = custom_dictionary.candidates(word, spell, tenant)
+    if custom_candidates:
+        spell_candidates = spell_candidates + sorted(custom_candidates.difference(spell_candidates))
+
+    profiling.count("spell.candidates", len(spell_candidates))
 
     # Remove punctuation & symbols from spellchecker suggestions
     spell_candidates = [w for w in spell_candidates if re.match(r"^[a-zA-Z'-]+$", w)]
 
     # If there's a previous word, rank suggestions using bigram probabilities
     if prev_word or next_word:
-        spell_candidates = sorted(
-            spell_candidates ,
-            key=lambda w: (
-                distance(word, w),
-                -word_freq.get(w, 0),  # Prioritize common words in Reuters
-                -bigram_counts.get((prev_word, w), 0) if prev_word else 0,
-                -bigram_counts.get((w, next_word), 0) if next_word else 0
-                )
-        )
+        with profiling.stage("ngram_scoring"):
+            spell_candidates = sorted(
+                spell_candidates ,
+                key=lambda w: (
+                    distance(word, w),
+                    -word_freq.get(w, 0),  # Prioritize common words in Reuters
+                    -bigram_counts.get((prev_word, w), 0) if prev_word else 0,
+                    -bigram_counts.get((w, next_word), 0) if next_word else 0
+                    )
+            )
 
     # Get **only highly relevant BERT-based corrections**
     if full_text is not None:
@@ -196,34 +225,37 @@ def suggest_corrections(word, prev_word=None, next_word=None, full_text=None, to
 
 # NOTE: Function for Detect + Suggestions
 # Function to detect and suggest corrections in one step
-def detect_and_suggest_corrections(text, top_n=5):
+@profiling.instrument("detect_and_suggest_corrections", new_request=True)
+def detect_and_suggest_corrections(text, top_n=5, tenant=None, progress=None):
+    report_progress = progress_reporter(progress)
 
-    # Extract original words as they appear in the input text
-    words_original = re.findall(r"\b\w+['-]?\w*\b", text)
-    
-    # Normalize words to lowercase for SpellChecker lookup
-    words_normalized = [word.lower().strip(".,!?") for word in words_original]
+    # Extract original words as they appear in the input text (tokens keep both the original and normalized word)
+    tokens = tokenize(text)
+    words_original = [token.text for token in tokens]
 
-    misspelled_words = detect_misspellings(text)  # Detect non-word spelling errors
+    report_progress(0.0, "Detecting misspelled words...")
+    misspelled_words = detect_misspellings(text, tenant)  # Detect non-word spelling errors
     corrections = {}
 
     print("Misspelled words detected by SpellChecker:")
     print(misspelled_words)
 
-    for i, word in enumerate(words_original):
-        normalized_word = words_normalized[i]  # Get the corresponding normalized word
+    for i, token in track_tokens(report_progress, tokens, "Checking words in context (BERT)..."):
+        word, normalized_word = token.text, token.norm  # Original and normalized word
         prev_word = words_original[i - 1] if i > 0 else None  # Get the previous word
         next_word = words_original[i + 1] if i < len(words_original) - 1 else None  # Get next word
 
         # Check for non-word spelling errors
         if word in misspelled_words:
-            corrections[word] = suggest_corrections(normalized_word, prev_word, next_word)
+            corrections[word] = suggest_corrections(normalized_word, prev_word, next_word, tenant=tenant)
         # Check for real-word spelling errors using BERT
         elif prev_word and next_word and is_real_word_error(prev_word, word, next_word, text):
             # Avoid duplicate detection
             if word not in corrections:
                 misspelled_words.append(word) # Add to list of detected errors
-                corrections[word] = suggest_corrections(normalized_word, prev_word, next_word, text, top_n)
+                corrections[word] = suggest_corrections(normalized_word, prev_word, next_word, text, top_n, tenant)
+
+    report_progress(1.0, "Spelling check done!")
 
     return misspelled_words, corrections
 
@@ -9,7 +9,18 @@ from spellchecker import SpellChecker
 from Levenshtein import distance
 
 from collections import Counter, defaultdict
-import re
+
+# Custom (user / organisation) dictionaries
+from spelling_sys.custom_dictionary import DictionaryOverlay
+
+# Opt-in hot-path instrumentation
+from spelling_sys import profiling
+
+# Shared tokenizer (precompiled pattern, tokens with spans)
+from spelling_sys.tokenizer import normalize, tokenize
+
+# Throttled progress reporting
+from spelling_sys.progress import progress_reporter, track_tokens
 
 # Ensure necessary downloads
 nltk.download("punkt")
@@ -72,68 +83,83 @@ for w1, w2 in bigrams(tokens):
 spell = SpellChecker()
 spell.word_frequency.load_words(list(word_freq.keys()))  # Load Reuters words
 
-# Add Custom Word List
-spell.word_frequency.load_words(["cutting-edge"])
+# Custom dictionaries layered over the Reuters vocabulary (hot reloaded from spelling_sys/dictionaries)
+custom_dictionary = DictionaryOverlay()
 
 # Function to detect misspelled words while preserving original input formatting
-def detect_misspellings(text):
-    # Extract words while keeping their original form
-    words = re.findall(r"\b\w+['-]?\w*\b", text)  # Keeps contractions & hyphenated words
-
-    # Normalize words to lowercase for SpellChecker lookup
-    normalized_words = [word.lower().strip(".,!?") for word in words]
+@profiling.instrument("detect_misspellings")
+def detect_misspellings(text, tenant=None):
+    with profiling.stage("tokenize"):
+        # Extract words (original form + normalized form for SpellChecker lookup), keeps contractions & hyphenated words
+        tokens = tokenize(text)
 
     # Find misspelled words using normalized text
-    unknown_words = spell.unknown(normalized_words)
+    with profiling.stage("spell.unknown"):
+        unknown_words = spell.unknown([token.norm for token in tokens])
+
+    # Words in the user / organisation dictionary are not misspelled
+    unknown_words = custom_dictionary.filter_unknown(unknown_words, tenant)
 
     # Return original words from the input (not the normalized version)
-    misspelled_words = [words[i] for i, norm_word in enumerate(normalized_words) if norm_word in unknown_words]
+    misspelled_words = [token.text for token in tokens if token.norm in unknown_words]
 
     return misspelled_words
 
 # Function to suggest corrections with optional bigram probability ranking
-def suggest_corrections(word, prev_word=None, top_n=5):
+@profiling.instrument("suggest_corrections")
+def suggest_corrections(word, prev_word=None, top_n=5, tenant=None):
 
     original_word = word  # Store original word
-    word = word.lower().strip(".,!?")  # Normalize word for lookup
+    word = normalize(word)  # Normalize word for lookup
     
-    try:
-        candidates = list(spell.candidates(word)) or ['']
-    except Exception as e:
-        print(f"Error: {e} | Problematic word: '{word}'")
-        candidates = ['']  # Return an empty list instead of failing
+    with profiling.stage("spell.candidates"):
+        try:
+            candidates = list(spell.candidates(word)) or ['']
+        except Exception as e:
+            print(f"Error: {e} | Problematic word: '{word}'")
+            candidates = ['']  # Return an empty list instead of failing
+
+    # Add user / organisation dictionary words within one edit of the misspelled word
+    custom_candidates = custom_dictionary.candidates(word, spell, tenant)
+    if custom_candidates:
+        candidates = [w for w in candidates if w] + sorted(custom_candidates.difference(candidates))
+
+    profiling.count("spell.candidates", len(candidates))
 
     # If there's a previous word, rank suggestions using bigram probabilities
     if prev_word:
-        candidates = sorted(
-            candidates,
-            key=lambda w: (
-                distance(word, w),
-                -word_freq.get(w, 0),  # Prioritize common words in Reuters
-                -bigram_counts.get((prev_word, w), 0)
-                )
-        )
+        with profiling.stage("ngram_scoring"):
+            candidates = sorted(
+                candidates,
+                key=lambda w: (
+                    distance(word, w),
+                    -word_freq.get(w, 0),  # Prioritize common words in Reuters
+                    -bigram_counts.get((prev_word, w), 0)
+                    )
+            )
 
     return candidates[:top_n]
 
 # Function to detect and suggest corrections in one step
-def detect_and_suggest_corrections(text, top_n=5):
+@profiling.instrument("detect_and_suggest_corrections", new_request=True)
+def detect_and_suggest_corrections(text, top_n=5, tenant=None, progress=None):
+    report_progress = progress_reporter(progress)
 
-    # Extract original words as they appear in the input text
-    words_original = re.findall(r"\b\w+['-]?\w*\b", text)
-    
-    # Normalize words to lowercase for SpellChecker lookup
-    words_normalized = [word.lower().strip(".,!?") for word in words_original]
+    # Extract original words as they appear in the input text (tokens keep both the original and normalized word)
+    tokens = tokenize(text)
+    words_original = [token.text for token in tokens]
 
-    misspelled_words = detect_misspellings(text)  # Detect misspelled words
+    report_progress(0.0, "Detecting misspelled words...")
+    misspelled_words = detect_misspellings(text, tenant)  # Detect misspelled words
+    misspelled_set = set(misspelled_words)
     corrections = {}
 
-    for i, word in enumerate(words_original):
-        normalized_word = words_normalized[i]  # Get the corresponding normalized word
-
-        if word in misspelled_words:
+    for i, token in track_tokens(report_progress, tokens, "Finding corrections..."):
+        if token.text in misspelled_set:
             prev_word = words_original[i - 1] if i > 0 else None  # Get the previous word
-            corrections[word] = suggest_corrections(normalized_word, prev_word, top_n)
+            corrections[token.text] = suggest_corrections(token.norm, prev_word, top_n, tenant)
+
+    report_progress(1.0, "Spelling check done!")
 
     return misspelled_words, corrections
 
@@ -12,7 +12,15 @@ from Levenshtein import distance
 import language_tool_python
 
 from collections import Counter, defaultdict
-import re
+
+# Opt-in hot-path instrumentation
+from spelling_sys import profiling
+
+# Shared tokenizer (precompiled pattern, tokens with spans)
+from spelling_sys.tokenizer import normalize, tokenize
+
+# Throttled progress reporting
+from spelling_sys.progress import progress_reporter, track_tokens
 
 # Ensure necessary downloads
 nltk.download("punkt")
@@ -98,24 +106,27 @@ spell = SpellChecker()
 spell.word_frequency.load_words(list(word_freq.keys()))  # Load Reuters words
 
 # Function to detect misspelled words while preserving original input formatting
+@profiling.instrument("detect_misspellings")
 def detect_misspellings(text):
-    # Extract words while keeping their original form
-    words = re.findall(r"\b\w+['-]?\w*\b", text)  # Keeps contractions & hyphenated words
-
-    # Normalize words to lowercase for SpellChecker lookup
-    normalized_words = [word.lower().strip(".,!?") for word in words]
+    with profiling.stage("tokenize"):
+        # Extract words (original form + normalized form for SpellChecker lookup), keeps contractions & hyphenated words
+        tokens = tokenize(text)
 
     # Find misspelled words using normalized text
-    unknown_words = spell.unknown(normalized_words)
+    with profiling.stage("spell.unknown"):
+        unknown_words = spell.unknown([token.norm for token in tokens])
 
     # Return original words from the input (not the normalized version)
-    misspelled_words = [words[i] for i, norm_word in enumerate(normalized_words) if norm_word in unknown_words]
+    misspelled_words = [token.text for token in tokens if token.norm in unknown_words]
 
     return misspelled_words
 
 # Function to detect real-world spelling errors using LanguageTool + N-grams
+@profiling.instrument("detect_real_word_errors")
 def detect_real_word_errors(text, top_n=5):
-    matches = lt_tool.check(text)
+    with profiling.stage("language_tool"):
+        matches = lt_tool.check(text)
+    profiling.count("language_tool", len(matches))
     real_word_errors = {}
 
     # Store errors detected by LanguageTool
@@ -137,74 +148,88 @@ def detect_real_word_errors(text, top_n=5):
             continue
 
         # Compute probabilities
-        bigram_prob = get_bigram_probability(prev_word, word)
-        trigram_prob = get_trigram_probability(prev_word, word, next_word)
+        with profiling.stage("ngram_scoring"):
+            bigram_prob = get_bigram_probability(prev_word, word)
+            trigram_prob = get_trigram_probability(prev_word, word, next_word)
 
         # If both probabilities are **very low**, flag as real-word error
         if bigram_prob < 0.001 and trigram_prob < 0.0005:  # Adjust thresholds based on corpus
-            try:
-                real_word_errors[word] = list(spell.candidates(word))[:top_n] or [''] # Use spellchecker for suggestions
-            except Exception as e:
-                real_word_errors[word] = ['']
+            with profiling.stage("spell.candidates"):
+                try:
+                    real_word_errors[word] = list(spell.candidates(word))[:top_n] or [''] # Use spellchecker for suggestions
+                except Exception as e:
+                    real_word_errors[word] = ['']
+
+            profiling.count("spell.candidates", len(real_word_errors[word]))
 
     return real_word_errors
 
 # Function to suggest corrections with optional bigram & trigram probability ranking
+@profiling.instrument("suggest_corrections")
 def suggest_corrections(word, prev_word=None, next_word=None, top_n=5):
 
     original_word = word  # Store original word
-    word = word.lower().strip(".,!?")  # Normalize word for lookup
+    word = normalize(word)  # Normalize word for lookup
     
-    try:
-        candidates = list(spell.candidates(word)) or ['']
-    except Exception as e:
-        print(f"Error: {e} | Problematic word: '{word}'")
-        candidates = ['']  # Return an empty list instead of failing
+    with profiling.stage("spell.candidates"):
+        try:
+            candidates = list(spell.candidates(word)) or ['']
+        except Exception as e:
+            print(f"Error: {e} | Problematic word: '{word}'")
+            candidates = ['']  # Return an empty list instead of failing
+
+    profiling.count("spell.candidates", len(candidates))
 
     # If there's a previous word, rank suggestions using bigram probabilities
     if prev_word or next_word:
-        candidates = sorted(
-            candidates,
-            key=lambda w: (
-                distance(word, w),
-                -word_freq.get(w, 0),  # Prioritize common words in Reuters
-                -bigram_counts.get((prev_word, w), 0),
-                -trigram_counts.get((prev_word, w, next_word), 0) if prev_word and next_word else 0  # Trigram probability
-                )
-        )
+        with profiling.stage("ngram_scoring"):
+            candidates = sorted(
+                candidates,
+                key=lambda w: (
+                    distance(word, w),
+                    -word_freq.get(w, 0),  # Prioritize common words in Reuters
+                    -bigram_counts.get((prev_word, w), 0),
+                    -trigram_counts.get((prev_word, w, next_word), 0) if prev_word and next_word else 0  # Trigram probability
+                    )
+            )
 
     return candidates[:top_n]
 
 # Function to detect and suggest corrections in one step
-def detect_and_suggest_corrections(text, top_n=5):
+@profiling.instrument("detect_and_suggest_corrections", new_request=True)
+def detect_and_suggest_corrections(text, top_n=5, progress=None):
+    report_progress = progress_reporter(progress)
 
-    # Extract original words as they appear in the input text
-    words_original = re.findall(r"\b\w+['-]?\w*\b", text)
-    
-    # Normalize words to lowercase for SpellChecker lookup
-    words_normalized = [word.lower().strip(".,!?") for word in words_original]
+    # Extract original words as they appear in the input text (tokens keep both the original and normalized word)
+    tokens = tokenize(text)
+    words_original = [token.text for token in tokens]
 
     # Detect non-word spelling errors
+    report_progress(0.0, "Detecting misspelled words...")
     misspelled_words = detect_misspellings(text) 
+    misspelled_set = set(misspelled_words)
     
     # Detect real-world errors using LanguageTool
+    report_progress(0.1, "Detecting real-word errors (LanguageTool)...")
     real_word_errors = detect_real_word_errors(text)
     
     corrections = {}
 
-    for i, word in enumerate(words_original):
-        normalized_word = words_normalized[i]  # Get the corresponding normalized word
+    for i, token in track_tokens(report_progress, tokens, "Finding corrections..."):
+        word, normalized_word = token.text, token.norm  # Original and normalized word
         prev_word = words_original[i - 1] if i > 0 else None  # Get the previous word
         next_word = words_original[i + 1] if i < len(words_original) - 1 else None  # Get the next word
 
         # Handle non-word spelling errors using SpellChecker
-        if word in misspelled_words:
+        if word in misspelled_set:
             corrections[word] = suggest_corrections(normalized_word, prev_word, next_word, top_n)
         
         # Handle real-word errors using LanguageTool
         elif word in real_word_errors:
             corrections[word] = real_word_errors[word]
 
+    report_progress(1.0, "Spelling check done!")
+
     print("Misspelled word:")
     print(misspelled_words)
     print("Real-world error:")
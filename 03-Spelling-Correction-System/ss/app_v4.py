@@ -1,11 +1,13 @@
 import streamlit as st
-import time
-import re
 
-from spelling_sys.SpellCheckerHybridNGram_LanguageToolPython_v4 import detect_and_suggest_corrections
+from spelling_sys import tokenizer
+from spelling_sys.registry import load_engine
 
 def main_app():
 
+    # Spell checker engine (loaded once per process and shared across sessions)
+    engine = load_engine("v4")
+
     # NOTE: Spelling Error Tracker & Styling
 
     # Function to move between errors
@@ -31,12 +33,9 @@ def main_app():
         if st.session_state["remaining_errors"]:
             current_word = st.session_state["remaining_errors"][st.session_state["current_index"]]
             
-            # Use regex to find and replace the misspelled word while keeping punctuation
-            pattern = rf'\b{re.escape(current_word)}(\W*)'  # Matches word + optional punctuation
-            st.session_state["corrected_text"] = re.sub(
-                pattern, 
-                lambda m: selected_correction + m.group(1),  # Retains punctuation
-                st.session_state["corrected_text"]
+            # Replace the misspelled word by its token spans (whole words only, punctuation is kept)
+            st.session_state["corrected_text"] = tokenizer.replace_word(
+                st.session_state["corrected_text"], current_word, selected_correction
             )
             
             # Remove the corrected word from the error list
@@ -50,18 +49,14 @@ def main_app():
 
     # Function to highlight misspelled words dynamically
     def highlight_text(text, selected_word, misspelled_words):
-        def replacement(match):
-            word = match.group(0)  # Extract matched word
-            if word == selected_word:
-                return f"<span class='misspelled selected'>{word}</span>"
+        def replacement(token):
+            if token.text == selected_word:
+                return f"<span class='misspelled selected'>{token.text}</span>"
             else:
-                return f"<span class='misspelled'>{word}</span>"
-
-        # Ensure the regex properly matches the last word without space issues
-        pattern = r'\b(' + '|'.join(re.escape(word) for word in misspelled_words) + r')(?!\w)'
-        text = re.sub(pattern, replacement, text)
+                return f"<span class='misspelled'>{token.text}</span>"
 
-        return text
+        # Wrap the misspelled words using the (cached) token spans of the text
+        return tokenizer.render_tokens(text, misspelled_words, replacement)
         
     # Function to get the currently selected misspelled word & highlight text dynamically
     def get_highlight_word(misspelled_words):
@@ -155,9 +150,23 @@ def main_app():
     if "file_upload" not in st.session_state:
         st.session_state["file_upload"] = None
 
-    # Ensure loading session state exists
-    if "loading" not in st.session_state:
-        st.session_state["loading"] = False
+    # NOTE: Spell Check Runner
+
+    # Function to run the spell check with a progress bar driven by the checker's own stages
+    def run_spell_check(text, placeholder):
+        progress_bar = placeholder.progress(0.0, text="Checking for spelling errors...")
+
+        misspelled_words, corrections_dict = engine.check(
+            text,
+            progress=lambda fraction, message: progress_bar.progress(fraction, text=message)
+        )
+
+        placeholder.empty()
+
+        if len(text) > 0:
+            st.toast("Spelling Check Done!", icon="✅")
+
+        return misspelled_words, corrections_dict
 
     # NOTE: Input Section
 
@@ -194,20 +203,20 @@ def main_app():
     # Create column for "Analyze Text" and "Reset Text" buttons
     col1, col2, col3  = st.columns([1.1, 1, 4])
 
+    # Placeholder for the spell check progress bar (full width, below the buttons)
+    progress_placeholder = st.empty()
+
     with col1:
         # Click button and display output as expander
         if st.button("Analyze Text"):
             
             # NOTE: Text Analysis
-            misspelled_words, corrections_dict = detect_and_suggest_corrections(text_input)
+            misspelled_words, corrections_dict = run_spell_check(text_input, progress_placeholder)
 
             # Store results in session state
             st.session_state["misspelled_words"] = misspelled_words
             st.session_state["corrections_dict"] = corrections_dict
 
-            # Start loading
-            st.session_state["loading"] = True
-            
             # Mark that analyze button was clicked
             st.session_state["analyze_clicked"] = True
             st.session_state["expander_open"] = False
@@ -215,15 +224,6 @@ def main_app():
             # Reset spelling state to initial state on each analysis
             reset_spelling_state(text_input, misspelled_words)
 
-    if st.session_state["loading"]:
-        # Add spinner
-        with st.spinner("Checking for spelling errors...", show_time=True):
-            time.sleep(1)
-            st.toast("Spelling Check Done!", icon="✅")
-
-        # Stop loading after the process completes
-        st.session_state["loading"] = False
-
     with col2:
         # Reset button
         if st.button("Reset"):
@@ -273,7 +273,7 @@ def main_app():
                             replace_word(selected_correction)
 
                             # NOTE: Rerun Text Analysis Again (Taking correlation between words into consideration)
-                            misspelled_words, corrections_dict = detect_and_suggest_corrections(st.session_state["corrected_text"])
+                            misspelled_words, corrections_dict = engine.check(st.session_state["corrected_text"])
 
                             # Store results in session state
                             st.session_state["misspelled_words"] = misspelled_words
@@ -0,0 +1,157 @@
+# Libraries for Sentiment Analysis
+from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Libraries for Batch Processing
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# Sentiment Labels
+from sentiment_labels import textblob_label, vader_label
+
+# NOTE: Batch document sentiment scoring (TextBlob polarity / subjectivity + VADER compound)
+# A CSV column of documents is read in chunks, every chunk is scored in a process pool (each worker builds its
+# own VADER analyzer once) and the results are appended to the output CSV as soon as their chunk is done, so
+# large comment dumps are scored with bounded memory. Progress is reported after every chunk.
+
+SCORE_FIELDS = ["textblob_polarity", "textblob_subjectivity", "textblob_sentiment", "vader_compound", "vader_sentiment"]
+
+
+# Function to score a list of documents, returns one dict of scores per document
+def score_texts(texts, analyzer=None):
+    analyzer = analyzer or SentimentIntensityAnalyzer()
+    scores = []
+
+    for text in texts:
+        sentiment = TextBlob(text).sentiment
+        compound = analyzer.polarity_scores(text)["compound"]
+
+        scores.append({
+            "textblob_polarity": sentiment.polarity,
+            "textblob_subjectivity": sentiment.subjectivity,
+            "textblob_sentiment": textblob_label(sentiment.polarity),
+            "vader_compound": compound,
+            "vader_sentiment": vader_label(compound),
+        })
+
+    return scores
+
+
+# NOTE: Process pool workers
+
+_worker_analyzer = None
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = SentimentIntensityAnalyzer()
+
+def _score_chunk(texts):
+    return score_texts(texts, _worker_analyzer)
+
+
+# Function to split an iterable into lists of chunk_size items
+def batched(iterable, chunk_size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, chunk_size)):
+        yield batch
+
+
+# Function to score chunks of documents, in a process pool when n_jobs > 1 (yields scored chunks in order)
+def score_chunks(chunks, n_jobs=None):
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1:
+        analyzer = SentimentIntensityAnalyzer()
+        for chunk in chunks:
+            yield score_texts(chunk, analyzer)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as executor:
+        # Keep only a few chunks per worker in flight so huge inputs are not read into memory all at once
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_score_chunk, chunk))
+
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+# NOTE: Streaming file input / output
+
+# Function to read the column names of an open CSV file (the names csv.DictReader uses, duplicates are not renamed)
+def read_columns(f):
+    return next(csv.reader(f), [])
+
+
+# Function to stream records (dicts) from a CSV file
+def read_records(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+# Function to count the records of a CSV file (e.g. for a progress bar)
+def count_records(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+
+# Function to score a CSV column of documents into another CSV file, calling progress(chunks, documents, elapsed_s) per chunk
+def score_file(input_path, output_path, text_column="text", chunk_size=500, n_jobs=None, progress=None):
+    with open(input_path, encoding="utf-8", newline="") as f:
+        columns = read_columns(f)
+    if text_column not in columns:
+        raise ValueError(f"Column '{text_column}' not found in {input_path}. Available columns: {', '.join(columns)}")
+
+    # Records are kept only until their chunk is scored (the text column is what the workers receive)
+    in_flight = deque()
+
+    def text_chunks():
+        for chunk in batched(read_records(input_path), chunk_size):
+            in_flight.append(chunk)
+            yield ["" if record[text_column] is None else record[text_column] for record in chunk]
+
+    start = time.perf_counter()
+    n_chunks = n_documents = 0
+
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns + [field for field in SCORE_FIELDS if field not in columns], extrasaction="ignore")
+        writer.writeheader()
+
+        for scores in score_chunks(text_chunks(), n_jobs):
+            records = in_flight.popleft()
+            writer.writerows({**record, **score} for record, score in zip(records, scores))
+            f.flush()
+
+            n_chunks += 1
+            n_documents += len(records)
+            if progress:
+                progress(n_chunks, n_documents, time.perf_counter() - start)
+
+    return {"chunks": n_chunks, "documents": n_documents, "elapsed_s": time.perf_counter() - start}
+
+
+# Function to print per-chunk progress to stderr (CLI)
+def print_progress(n_chunks, n_documents, elapsed_s):
+    print(f"Chunk {n_chunks:,}: {n_documents:,} documents scored ({n_documents / max(elapsed_s, 1e-9):,.0f} documents/second)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a CSV column of documents with TextBlob (polarity / subjectivity) and VADER (compound).")
+    parser.add_argument("input", help="Input CSV file")
+    parser.add_argument("output", help="Output CSV file (input columns + scores)")
+    parser.add_argument("--text-column", default="text", help="Column with the documents (default: text)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Documents per chunk (default: 500)")
+    parser.add_argument("--jobs", type=int, default=None, help="Scoring processes (default: all cores, 1 = no pool)")
+    args = parser.parse_args()
+
+    summary = score_file(args.input, args.output, args.text_column, args.chunk_size, args.jobs, print_progress)
+    print(f"Done: {summary['documents']:,} documents in {summary['elapsed_s']:.1f}s -> {args.output}", file=sys.stderr)
@@ -0,0 +1,154 @@
+# Libraries for Sentiment Analysis
+from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+# Sentiment Labels
+from sentiment_labels import vader_label
+
+# NOTE: Sentence-level sentiment for long documents
+# A document is split into sentences (at ., ! or ? followed by whitespace, and at line breaks), every sentence
+# is scored on its own with TextBlob and VADER (so VADER sees punctuation, negations and boosters in context),
+# and the document scores are the word-count weighted means of the sentence scores. Sentence scores are
+# cached by a hash of the sentence text, so after editing a long document only the changed sentences are
+# rescored. Scores are yielded sentence by sentence, so a page can show them while the rest is scored.
+
+# A sentence ends at its terminal punctuation (plus closing quotes / brackets) followed by whitespace, or at a line break
+SENTENCE_PATTERN = re.compile(r".+?(?:[.!?]+[\"')\]]*(?=\s|$)|(?=\n)|$)")
+
+# Function to split a text into sentences (yields them in order)
+def split_sentences(text):
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = match.group().strip()
+        if sentence:
+            yield sentence
+
+
+# Function to get the cache key of a sentence
+def sentence_hash(sentence):
+    return hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SentenceScorer:
+
+    def __init__(self, analyzer=None, cache_size=50_000):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+
+        # LRU cache of sentence scores keyed by sentence hash
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Function to score one sentence with TextBlob and VADER
+    def _score(self, sentence):
+        sentiment = TextBlob(sentence).sentiment
+        return {
+            "polarity": sentiment.polarity,
+            "subjectivity": sentiment.subjectivity,
+            "vader_compound": self.analyzer.polarity_scores(sentence)["compound"],
+            "words": len(sentence.split()),
+        }
+
+    # Function to get the scores of one sentence (cached by hash), returns (scores, cached)
+    def score_sentence(self, sentence):
+        key = sentence_hash(sentence)
+
+        with self._lock:
+            scores = self._cache.get(key)
+            if scores is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return scores, True
+            self.misses += 1
+
+        scores = self._score(sentence)
+
+        with self._lock:
+            self._cache[key] = scores
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return scores, False
+
+    # Function to stream the sentence scores of a text (yields one dict per sentence, in order)
+    def iter_scores(self, text):
+        for index, sentence in enumerate(split_sentences(text)):
+            scores, cached = self.score_sentence(sentence)
+            yield {"index": index, "sentence": sentence, **scores, "cached": cached}
+
+    # Function to get hit / miss statistics of the sentence cache
+    def cache_info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+
+# Function to aggregate sentence scores into document scores (word-count weighted means)
+def aggregate(sentence_scores):
+    total_words = sum(scores["words"] for scores in sentence_scores)
+    if not sentence_scores or total_words == 0:
+        return {"sentences": len(sentence_scores), "words": 0, "polarity": 0.0, "subjectivity": 0.0, "vader_compound": 0.0,
+                "positive_sentences": 0, "negative_sentences": 0, "neutral_sentences": len(sentence_scores)}
+
+    def weighted_mean(field):
+        return sum(scores[field] * scores["words"] for scores in sentence_scores) / total_words
+
+    labels = [vader_label(scores["vader_compound"]) for scores in sentence_scores]
+
+    return {
+        "sentences": len(sentence_scores),
+        "words": total_words,
+        "polarity": weighted_mean("polarity"),
+        "subjectivity": weighted_mean("subjectivity"),
+        "vader_compound": weighted_mean("vader_compound"),
+        "positive_sentences": labels.count("Positive"),
+        "negative_sentences": labels.count("Negative"),
+        "neutral_sentences": labels.count("Neutral"),
+    }
+
+
+# Function to analyze a whole text, returns the sentence scores and the document scores
+def analyze(text, scorer=None):
+    scorer = scorer or SentenceScorer()
+    sentence_scores = list(scorer.iter_scores(text))
+    return sentence_scores, aggregate(sentence_scores)
+
+
+# NOTE: Benchmark (rescoring a long document after a small edit)
+
+# Function to time a full analysis and a re-analysis after editing a few sentences
+def benchmark(n_sentences=2_000, n_edits=20, seed=36):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    sentences = ["I love this product!", "The delivery was late and the box was damaged.", "Customer service was okay.",
+                 "Honestly, it is not bad at all.", "Would I buy it again? Maybe.", "The price is way too high!!"]
+    document = [f"{rng.choice(sentences)[:-1]} (item {i}){rng.choice(['.', '!', '?'])}" for i in range(n_sentences)]  # Some split into 2 sentences
+
+    scorer = SentenceScorer()
+
+    start = time.perf_counter()
+    _, document_scores = analyze(" ".join(document), scorer)
+    first_s = time.perf_counter() - start
+
+    # Edit a few sentences and analyze the whole document again
+    for i in rng.sample(range(n_sentences), n_edits):
+        document[i] = document[i].replace("item", "edited item")
+
+    hits, misses = scorer.hits, scorer.misses
+    start = time.perf_counter()
+    _, edited_scores = analyze(" ".join(document), scorer)
+    edited_s = time.perf_counter() - start
+
+    print(f"{document_scores['sentences']:,} sentences: first analysis {first_s * 1000:.0f} ms, after editing {n_edits} sentences {edited_s * 1000:.0f} ms "
+          f"({scorer.misses - misses} rescored, {scorer.hits - hits} from cache)")
+    print(f"Document scores: {document_scores}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -3,12 +3,21 @@ import streamlit as st
 # Libraries for Sentiment Analysis
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from word_sentiment import WordScorer
+from batch_scoring import count_records, read_columns, score_file
+from sentence_sentiment import SentenceScorer, aggregate, split_sentences
+from sentiment_labels import vader_label
 
 # Libraries for Data Processing & Data Visualization
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+import csv
+import io
+import os
+import tempfile
+
 # Set Default Wide Screen Mode in Streamlit
 st.set_page_config(layout="wide")
 
@@ -25,27 +34,20 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# NOTE: Function to analyze token sentiments
-def analyze_sentiments_vader(text):
-    
-    analyzer = SentimentIntensityAnalyzer()
-
-    pos_lst = []
-    neg_lst = []
-    neu_lst = []
+# NOTE: Function to load the VADER word scorer once (the lexicon is parsed once and token scores are shared across sessions)
+@st.cache_resource
+def load_word_scorer():
+    return WordScorer(SentimentIntensityAnalyzer())
 
-    for word in text.split():
-        res = analyzer.polarity_scores(word)["compound"]
+# NOTE: Function to load the sentence scorer once (sentence scores are cached by hash, so edits only rescore changed sentences)
+@st.cache_resource
+def load_sentence_scorer():
+    return SentenceScorer(SentimentIntensityAnalyzer())
 
-        if res >= 0.1:
-            pos_lst.append([word, res])
-
-        elif res <= -0.1:
-            neg_lst.append([word, res])
-        else:
-            neu_lst.append([word])
+# NOTE: Function to analyze token sentiments
+def analyze_sentiments_vader(text):
 
-    result = {"positive": pos_lst, "negative": neg_lst, "neutral": neu_lst}
+    result = load_word_scorer().breakdown(text)
 
     # Convert to dataframe
     df_positive = pd.DataFrame(result["positive"], columns=["Word", "Score"]) if result["positive"] else pd.DataFrame(columns=["Word", "Score"])
@@ -183,6 +185,148 @@ def main_page():
                 analyze_sentiments_vader(user_input)
 
 
+def document_page():
+
+    st.title("Document Sentiment Analysis 📄")
+    st.write("Analyze long texts **sentence by sentence**: every sentence is scored with TextBlob and VADER, and the document scores are the word-weighted averages of the sentence scores. After editing a document, only the changed sentences are rescored.")
+
+    document = st.text_area("Enter Document:", key="document_input", height=250, max_chars=50_000)
+
+    if not st.button("Analyze Document", type="primary") or len(document.strip()) == 0:
+        return
+
+    st.markdown("#### Analysis Results 📤")
+
+    scorer = load_sentence_scorer()
+    n_total = sum(1 for _ in split_sentences(document))
+    columns = ["sentence", "polarity", "subjectivity", "vader_compound"]
+
+    progress_bar = st.progress(0.0, text=f"Scoring {n_total:,} sentences...")
+    table = st.empty()
+
+    # Sentences are scored one by one and the table is refreshed while the rest of the document is scored
+    sentence_scores = []
+    for sentence_score in scorer.iter_scores(document):
+        sentence_scores.append(sentence_score)
+
+        if len(sentence_scores) % 25 == 0 or len(sentence_scores) == n_total:
+            progress_bar.progress(len(sentence_scores) / n_total, text=f"Scored {len(sentence_scores):,} / {n_total:,} sentences")
+            table.dataframe(pd.DataFrame(sentence_scores)[columns], height=250, use_container_width=True)
+
+    n_cached = sum(sentence_score["cached"] for sentence_score in sentence_scores)
+    progress_bar.progress(1.0, text=f"Scored {n_total:,} sentences ({n_total - n_cached:,} scored, {n_cached:,} reused from earlier analyses)")
+
+    document_scores = aggregate(sentence_scores)
+
+    # Document-level scores
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Polarity (TextBlob)", f"{document_scores['polarity']:.3f}")
+    col2.metric("Subjectivity (TextBlob)", f"{document_scores['subjectivity']:.3f}")
+    col3.metric("Compound (VADER)", f"{document_scores['vader_compound']:.3f}")
+
+    document_sentiment = vader_label(document_scores["vader_compound"])
+    if document_sentiment == "Positive":
+        st.success("Document Sentiment: Positive 😁")
+    elif document_sentiment == "Negative":
+        st.error("Document Sentiment: Negative 😢")
+    else:
+        st.warning("Document Sentiment: Neutral 😶")
+
+    with st.expander("Sentence Sentiment Breakdown"):
+        st.dataframe(pd.DataFrame([{
+            "Positive Sentences": document_scores["positive_sentences"],
+            "Negative Sentences": document_scores["negative_sentences"],
+            "Neutral Sentences": document_scores["neutral_sentences"],
+        }], index=["Count"]).T, use_container_width=True)
+
+        # Plot the sentence scores through the document
+        df_sentences = pd.DataFrame(sentence_scores)
+
+        fig, ax = plt.subplots(figsize=(8, 3))
+        sns.lineplot(data=df_sentences, x="index", y="polarity", ax=ax, label="Polarity (TextBlob)")
+        sns.lineplot(data=df_sentences, x="index", y="vader_compound", ax=ax, label="Compound (VADER)")
+        ax.axhline(0, color="grey", linewidth=0.8)
+        ax.set_xlabel("Sentence")
+        ax.set_ylabel("Score")
+
+        st.pyplot(fig)
+
+
+def batch_page():
+
+    st.title("Batch Sentiment Analysis 📂")
+    st.write("Upload a CSV file of documents (e.g. a comment dump) to score every row with **TextBlob** polarity & subjectivity and the **VADER** compound score.")
+
+    uploaded_file = st.file_uploader("Upload documents (CSV)", type=["csv"])
+
+    if uploaded_file is None:
+        st.session_state.pop("batch_result", None)
+        return
+
+    # Column names as the batch scorer reads them (csv module, so duplicate names are not renamed like in pandas)
+    try:
+        columns = read_columns(io.TextIOWrapper(io.BytesIO(uploaded_file.getvalue()), encoding="utf-8", newline=""))
+    except (UnicodeDecodeError, csv.Error) as e:
+        st.error(f"⚠️ Could not read the documents: {e}")
+        return
+
+    if not columns:
+        st.error("⚠️ The uploaded file is empty.")
+        return
+
+    text_column = st.selectbox("Text Column", columns, index=columns.index("text") if "text" in columns else 0)
+
+    if st.button("Analyze File", type="primary"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "documents.csv")
+            output_path = os.path.join(tmp_dir, "documents_scored.csv")
+
+            with open(input_path, "wb") as f:
+                f.write(uploaded_file.getvalue())
+
+            try:
+                n_total = count_records(input_path)
+                progress_bar = st.progress(0.0, text=f"Scoring {n_total:,} documents...")
+
+                # Called after every scored chunk (chunks are scored in a process pool and streamed to disk)
+                def update_progress(n_chunks, n_documents, elapsed_s):
+                    progress_bar.progress(min(n_documents / max(n_total, 1), 1.0),
+                                          text=f"Chunk {n_chunks:,}: {n_documents:,} / {n_total:,} documents scored ({n_documents / max(elapsed_s, 1e-9):,.0f} documents/second)")
+
+                summary = score_file(input_path, output_path, text_column, progress=update_progress)
+            except (ValueError, csv.Error) as e:
+                # ValueError includes UnicodeDecodeError (non UTF-8 files) and a missing text column
+                st.error(f"⚠️ Could not read the documents: {e}")
+                return
+
+            with open(output_path, "rb") as f:
+                st.session_state["batch_result"] = {"file_name": uploaded_file.name, "csv": f.read(), "summary": summary}
+
+    # NOTE: Batch Results (kept in session state, so downloading does not rescore the file)
+    batch_result = st.session_state.get("batch_result")
+
+    if batch_result and batch_result["file_name"] == uploaded_file.name:
+        st.markdown("#### Analysis Results 📤")
+        st.write(f"Scored **{batch_result['summary']['documents']:,}** documents in {batch_result['summary']['elapsed_s']:.1f}s.")
+
+        df_scored = pd.read_csv(io.BytesIO(batch_result["csv"]))
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            with st.expander("TextBlob Sentiment Distribution", expanded=True):
+                st.dataframe(df_scored["textblob_sentiment"].value_counts(), use_container_width=True)
+
+        with col2:
+            with st.expander("VADER Sentiment Distribution", expanded=True):
+                st.dataframe(df_scored["vader_sentiment"].value_counts(), use_container_width=True)
+
+        with st.expander("Scored Documents"):
+            st.dataframe(df_scored.head(1000), height=350, use_container_width=True)
+
+        st.download_button("Download Results (CSV)", batch_result["csv"], file_name=os.path.splitext(uploaded_file.name)[0] + "_sentiment.csv", mime="text/csv")
+
+
 def about_page():
     st.title("📖 About Sentiment Analysis NLP App")
 
@@ -210,6 +354,8 @@ def about_page():
         - **Analyze sentiment of user-input text**
         - **Visualize polarity and subjectivity scores**
         - **Break down individual word sentiments using VADER**
+        - **Sentence-by-sentence analysis of long documents (only edited sentences are rescored)**
+        - **Batch analysis of CSV files (TextBlob + VADER) with downloadable results**
         - **User-friendly interface with real-time processing**
         """
     )
@@ -238,8 +384,10 @@ def about_page():
 
 # Create Page
 main_pg = st.Page(main_page, title="Sentiment Analysis NLP App", icon="😶‍🌫️")
+document_pg = st.Page(document_page, title="Document Analysis", icon="📄")
+batch_pg = st.Page(batch_page, title="Batch Analysis", icon="📂")
 about_pg = st.Page(about_page, title="About", icon="📖")
 
 # Create Navigation
-nav = st.navigation([main_pg, about_pg])
+nav = st.navigation([main_pg, document_pg, batch_pg, about_pg])
 nav.run()
\ No newline at end of file
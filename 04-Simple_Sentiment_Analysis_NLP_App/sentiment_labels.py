@@ -0,0 +1,24 @@
+# NOTE: Document / sentence sentiment labels
+# Shared by the sentence-level document analysis and the batch scoring, so both label scores the same way.
+
+# VADER's recommended thresholds on the compound score
+VADER_POSITIVE_THRESHOLD = 0.05
+VADER_NEGATIVE_THRESHOLD = -0.05
+
+
+# Function to label a TextBlob polarity (as on the main page)
+def textblob_label(polarity):
+    if polarity > 0:
+        return "Positive"
+    if polarity < 0:
+        return "Negative"
+    return "Neutral"
+
+
+# Function to label a VADER compound score
+def vader_label(compound):
+    if compound >= VADER_POSITIVE_THRESHOLD:
+        return "Positive"
+    if compound <= VADER_NEGATIVE_THRESHOLD:
+        return "Negative"
+    return "Neutral"
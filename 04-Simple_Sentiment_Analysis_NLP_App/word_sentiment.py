@@ -0,0 +1,119 @@
+# Libraries for Sentiment Analysis
+from vaderSentiment.vaderSentiment import BOOSTER_DICT, SentimentIntensityAnalyzer, normalize
+
+import string
+from functools import lru_cache
+
+# NOTE: Word-level VADER scores
+# The word breakdown scores every whitespace token on its own, which for a single token reduces to a lexicon
+# lookup (after VADER's punctuation stripping) plus its !/? emphasis. WordScorer does that lookup directly on
+# one shared analyzer and memoises each distinct token, so long texts cost one dictionary lookup per word.
+# Tokens with non-ASCII characters (e.g. emojis, which VADER expands into words) use polarity_scores.
+
+POSITIVE_THRESHOLD = 0.1
+NEGATIVE_THRESHOLD = -0.1
+
+
+class WordScorer:
+
+    def __init__(self, analyzer=None, cache_size=100_000):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+        self.lexicon = self.analyzer.lexicon
+
+        # Memoised per instance (lru_cache is thread-safe, so one scorer can be shared across sessions)
+        self.score = lru_cache(maxsize=cache_size)(self._score_token)
+
+    # Function to get the VADER compound score of one token (same value as polarity_scores(token)["compound"])
+    def _score_token(self, token):
+        if not token.isascii():
+            return self.analyzer.polarity_scores(token)["compound"]
+
+        # Leading / trailing punctuation is stripped, unless that leaves 2 characters or fewer (emoticons like ":)")
+        stripped = token.strip(string.punctuation)
+        word = (token if len(stripped) <= 2 else stripped).lower()
+
+        # Booster words ("very", "extremely", ...) only modify their neighbours, on their own they score 0
+        valence = 0.0 if word in BOOSTER_DICT else self.lexicon.get(word, 0.0)
+        if valence == 0:
+            return 0.0
+
+        emphasis = self.analyzer._punctuation_emphasis(token)
+        return round(normalize(valence + emphasis if valence > 0 else valence - emphasis), 4)
+
+    # Function to split a text into positive / negative / neutral words with their scores
+    def breakdown(self, text):
+        result = {"positive": [], "negative": [], "neutral": []}
+
+        for word in text.split():
+            score = self.score(word)
+
+            if score >= POSITIVE_THRESHOLD:
+                result["positive"].append([word, score])
+            elif score <= NEGATIVE_THRESHOLD:
+                result["negative"].append([word, score])
+            else:
+                result["neutral"].append([word])
+
+        return result
+
+    # Function to get hit / miss statistics of the token cache
+    def cache_info(self):
+        return self.score.cache_info()
+
+
+# NOTE: Parity check & benchmark
+
+# Function to check that the fast path gives the same scores as polarity_scores for every token
+def check_parity(tokens, scorer=None):
+    scorer = scorer or WordScorer()
+    mismatches = [token for token in tokens if scorer._score_token(token) != scorer.analyzer.polarity_scores(token)["compound"]]
+    return {"tokens": len(tokens), "mismatches": len(mismatches), "examples": mismatches[:10]}
+
+
+# Function to build a long test text from lexicon words, fillers and punctuation variants
+def _sample_text(n_words, lexicon, seed=36):
+    import random
+
+    rng = random.Random(seed)
+    words = list(lexicon)[:2000] + ["the", "a", "movie", "was", "and", "but", "very", "I", "it", "today", "service", "food"] * 100
+    decorations = ["", "", "", "", ",", ".", "!", "!!", "?", "??"]
+    return " ".join(rng.choice(words) + rng.choice(decorations) for _ in range(n_words))
+
+
+# Function to compare the original breakdown (new analyzer per call, polarity_scores per word) with WordScorer
+def benchmark(word_counts=(40, 1_000, 10_000, 50_000)):
+    import time
+
+    scorer = WordScorer()
+
+    # Parity on every single-word lexicon entry, with punctuation, capitalisation and emoji variants
+    # (multi-word entries such as "fed up" can never be one whitespace token)
+    words = [word for word in scorer.lexicon if " " not in word]
+    variants = [variant for word in words for variant in (word, word.upper(), word + "!", word + "!!!", word + "??", f"({word}),")]
+    print(check_parity(variants + list(BOOSTER_DICT) + ["😀", "great😀", "café", ":)", ":-(", "!!!", "??"], scorer))
+
+    for n_words in word_counts:
+        text = _sample_text(n_words, scorer.lexicon)
+
+        start = time.perf_counter()
+        analyzer = SentimentIntensityAnalyzer()
+        expected = [analyzer.polarity_scores(word)["compound"] for word in text.split()]
+        original_s = time.perf_counter() - start
+
+        cold = WordScorer(scorer.analyzer)
+        start = time.perf_counter()
+        cold.breakdown(text)
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cold.breakdown(text)
+        warm_s = time.perf_counter() - start
+
+        assert [cold.score(word) for word in text.split()] == expected
+
+        print(f"{n_words:>7,} words: original {original_s * 1000:8.1f} ms | WordScorer {cold_s * 1000:7.1f} ms (cold cache), "
+              f"{warm_s * 1000:6.1f} ms (warm cache) | {original_s / cold_s:5.1f}x / {original_s / warm_s:5.1f}x faster")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -12,9 +12,10 @@ home_pg = st.Page(info_app.home_page, title='Home', icon='🏠')
 eda_des_pg = st.Page(eda_app.eda_des_page, title='Descriptive Analysis', icon='📑')
 eda_plot_pg = st.Page(eda_app.eda_plot_page, title='Plots', icon='📊')
 ml_pg = st.Page(ml_app.ml_page, title='Diabetes Prediction (ML)', icon='🩺')
+ml_batch_pg = st.Page(ml_app.ml_batch_page, title='Batch Prediction (CSV)', icon='📂')
 about_pg = st.Page(info_app.about_page, title='About', icon='📖')
 
 # Create navigation
 nav = st.navigation({"Home": [home_pg], "Exploratory Data Analysis (EDA)": [eda_des_pg, eda_plot_pg], 
-                     "Machine Learning Prediction": [ml_pg],"About": [about_pg]})
+                     "Machine Learning Prediction": [ml_pg, ml_batch_pg],"About": [about_pg]})
 nav.run()
\ No newline at end of file
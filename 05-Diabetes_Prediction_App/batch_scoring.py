@@ -0,0 +1,61 @@
+# Load ML Packages
+from portable_model import load_scorer
+
+# Load EDA Packages
+import pandas as pd
+
+import argparse
+import sys
+import time
+
+# Load Feature Encoding
+from encoding import encode_frame
+
+# NOTE: Batch scoring of patient records with the diabetes model
+# A whole CSV of records (same columns as diabetes_data_upload.csv) is encoded into one feature matrix and
+# scored with a single predict_proba call. The served model is used by default (the model recorded by
+# compare_models.py, else the original logistic regression); the portable export of a logistic regression is
+# scored with numpy, so such a batch job never imports sklearn. Any fitted classifier can still be passed in.
+
+
+# Class labels of the model's 0 / 1 predictions
+CLASS_LABELS = {0: "Negative", 1: "Positive"}
+
+
+# Function to score a DataFrame of patient records, returns the records with probability & predicted class
+def score_frame(df, model=None):
+    model = model or load_scorer()
+    features = encode_frame(df)
+
+    # sklearn rejects empty inputs, so a header-only CSV gives an empty result
+    if len(features) == 0:
+        return df.assign(positive_probability=pd.Series(dtype="float64"), predicted_class=pd.Series(dtype="object"))
+
+    # Classes come from the model's own decision rule, not a threshold on the probability
+    return df.assign(
+        positive_probability=model.predict_proba(features)[:, 1],
+        predicted_class=pd.Series(model.predict(features), index=df.index).map(CLASS_LABELS),
+    )
+
+
+# Function to score a CSV file of patient records into another CSV file
+def score_file(input_path, output_path, model=None):
+    start = time.perf_counter()
+
+    df = pd.read_csv(input_path)
+    scored = score_frame(df, model)
+    scored.to_csv(output_path, index=False)
+
+    elapsed = time.perf_counter() - start
+    print(f"Scored {len(scored):,} records in {elapsed:.2f}s ({len(scored) / max(elapsed, 1e-9):,.0f} records/second)", file=sys.stderr)
+
+    return scored
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score patient records in a CSV file with the diabetes model.")
+    parser.add_argument("input", help="Input CSV (columns as in diabetes_data_upload.csv)")
+    parser.add_argument("output", help="Output CSV (input columns + positive_probability, predicted_class)")
+    args = parser.parse_args()
+
+    score_file(args.input, args.output)
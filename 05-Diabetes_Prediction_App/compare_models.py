@@ -0,0 +1,175 @@
+# Load ML Packages
+import model_store
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, recall_score, roc_auc_score
+from sklearn.model_selection import RepeatedStratifiedKFold
+from sklearn.naive_bayes import BernoulliNB
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+# Load Batch Processing Packages
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+# Load Data Store & Feature Encoding
+import data_store
+from encoding import FEATURE_COLUMNS
+from portable_model import export_model, save_serving_model
+
+# NOTE: Cross-validated model comparison for the diabetes data (replaces the notebook's cross_val_score cells)
+# Every classifier is evaluated on diabetes_data_upload_clean.csv with the same repeated stratified K-fold
+# splits, which are cached on disk (rebuilt when the data changes). All (model, fold) fits run in parallel
+# across cores. Accuracy, recall and ROC AUC plus fit / predict times are recorded per fold, and the winner is
+# refit on all records and saved with a dated name and recorded in models/serving.json for ml_app / batch_scoring (a logistic
+# regression is also exported to the portable format, so the app scores it without sklearn).
+
+SEED = 42
+SOURCE_PATH = os.path.join(data_store.DATA_DIR, data_store.DATASETS["diabetes_clean"]["file"])
+
+# Candidate classifiers (the notebook's models plus a few common baselines)
+MODELS = {
+    "Logistic Regression": LogisticRegression(max_iter=2000),
+    "Decision Tree": DecisionTreeClassifier(random_state=SEED),
+    "Random Forest": RandomForestClassifier(n_estimators=200, random_state=SEED),
+    "Extra Trees": ExtraTreesClassifier(n_estimators=200, random_state=SEED),
+    "Gradient Boosting": GradientBoostingClassifier(random_state=SEED),
+    "K-Nearest Neighbors": make_pipeline(StandardScaler(), KNeighborsClassifier()),
+    "Naive Bayes": BernoulliNB(),
+}
+
+METRICS = ["accuracy", "recall", "roc_auc"]
+
+
+# Function to load the encoded features and labels (columns in the model's feature order)
+def load_data():
+    df = data_store.load_dataset("diabetes_clean")
+    return df[FEATURE_COLUMNS].to_numpy(dtype=np.float64), df["class"].to_numpy(dtype=int)
+
+
+# Function to get the repeated stratified K-fold splits (cached on disk, rebuilt when the data changes)
+def load_splits(y, n_splits=5, n_repeats=3):
+    path = os.path.join(data_store.CACHE_DIR, f"cv_splits.v{data_store.CACHE_VERSION}.k{n_splits}.r{n_repeats}.s{SEED}.joblib")
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(SOURCE_PATH):
+        return joblib.load(path)
+
+    cv = RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=SEED)
+    splits = [(train_idx.astype(np.int32), test_idx.astype(np.int32)) for train_idx, test_idx in cv.split(np.zeros(len(y)), y)]
+
+    os.makedirs(data_store.CACHE_DIR, exist_ok=True)
+    joblib.dump(splits, path)
+
+    return splits
+
+
+# Function to fit and score one model on one fold (runs in a worker process)
+def _run_fold(estimator, X, y, train_idx, test_idx):
+    model = clone(estimator)
+
+    start = time.perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_time_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    probabilities = model.predict_proba(X[test_idx])[:, 1]
+    predictions = model.predict(X[test_idx])
+    predict_time_s = time.perf_counter() - start
+
+    return {
+        "accuracy": accuracy_score(y[test_idx], predictions),
+        "recall": recall_score(y[test_idx], predictions),
+        "roc_auc": roc_auc_score(y[test_idx], probabilities),
+        "fit_time_s": fit_time_s,
+        "predict_time_s": predict_time_s,
+    }
+
+
+# Function to cross-validate every model on the same folds, returns per-fold records and the per-model summary
+def compare_models(models=None, n_splits=5, n_repeats=3, n_jobs=-1, metric="roc_auc"):
+    models = models or MODELS
+    X, y = load_data()
+    splits = load_splits(y, n_splits, n_repeats)
+
+    tasks = [(name, fold) for name in models for fold in range(len(splits))]
+
+    start = time.perf_counter()
+    outputs = Parallel(n_jobs=n_jobs)(delayed(_run_fold)(models[name], X, y, *splits[fold]) for name, fold in tasks)
+    print(f"{len(models)} models x {len(splits)} folds in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    records = pd.DataFrame([{"model": name, "fold": fold, **output} for (name, fold), output in zip(tasks, outputs)])
+
+    summary = records.groupby("model", sort=False).agg(
+        **{f"{name}_mean": (name, "mean") for name in METRICS},
+        **{f"{name}_std": (name, "std") for name in METRICS},
+        fit_time_ms=("fit_time_s", lambda times: 1000 * times.mean()),
+        predict_time_ms=("predict_time_s", lambda times: 1000 * times.mean()),
+    )
+    summary = summary.sort_values([f"{metric}_mean", "accuracy_mean"], ascending=False)
+
+    return records, summary
+
+
+# Function to refit the best model on all records and save it with a dated name (plus its portable export)
+def export_winner(name, models=None, prefix=None):
+    models = models or MODELS
+    prefix = prefix or date.today().strftime("%Y%m%d")
+    X, y = load_data()
+
+    model = clone(models[name]).fit(X, y)
+
+    # Dated artifacts, the served one is recorded for ml_app / batch_scoring (portable_model.serving_model_file)
+    model_file = f"{prefix}_Diabetes_Model.pkl"
+    path = os.path.join(model_store.MODEL_DIR, model_file)
+    joblib.dump(model, path)
+    model_store.register_model(path)
+
+    saved = [model_file]
+    export_file = f"{prefix}_Diabetes_Model.json"
+    if isinstance(model, LogisticRegression):
+        export_model(export_file=export_file, model=model)
+        saved.append(export_file)
+    elif os.path.exists(os.path.join(model_store.MODEL_DIR, export_file)):
+        # Portable export of an earlier winner with the same prefix, no longer matches the saved model
+        os.remove(os.path.join(model_store.MODEL_DIR, export_file))
+        model_store.unregister_model(export_file)
+
+    save_serving_model(saved[-1])
+
+    return saved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-validate and compare classifiers on the diabetes data, then export the best one.")
+    parser.add_argument("--splits", type=int, default=5, help="Folds per repeat (default: 5)")
+    parser.add_argument("--repeats", type=int, default=3, help="Repeats of the stratified K-fold (default: 3)")
+    parser.add_argument("--jobs", type=int, default=-1, help="Parallel fits (default: all cores)")
+    parser.add_argument("--metric", choices=METRICS, default="roc_auc", help="Metric that picks the winner (default: roc_auc)")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=None, help="Subset of models to compare (default: all)")
+    parser.add_argument("--prefix", default=None, help="Artifact file name prefix (default: today's date, YYYYMMDD)")
+    parser.add_argument("--no-export", action="store_true", help="Only compare the models, do not save the winner")
+    args = parser.parse_args()
+
+    models = {name: MODELS[name] for name in args.models} if args.models else MODELS
+    records, summary = compare_models(models, args.splits, args.repeats, args.jobs, args.metric)
+
+    prefix = args.prefix or date.today().strftime("%Y%m%d")
+    results_path = os.path.join(model_store.MODEL_DIR, f"{prefix}_Model_Comparison.csv")
+    records.to_csv(results_path, index=False)
+
+    with pd.option_context("display.width", 250, "display.max_columns", None, "display.float_format", "{:.4f}".format):
+        print(summary)
+    print(f"Per-fold results: {results_path}", file=sys.stderr)
+
+    if not args.no_export:
+        saved = export_winner(summary.index[0], models, prefix)
+        print(f"Best model ({args.metric}): {summary.index[0]} -> saved {', '.join(saved)} to {model_store.MODEL_DIR}", file=sys.stderr)
@@ -0,0 +1,96 @@
+# Load EDA Packages
+import pandas as pd
+
+import os
+import tempfile
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow ships with streamlit, but fall back to plain CSV parsing without it
+    feather = None
+
+# NOTE: Data store
+# Datasets are read from the local data folder (no network). Each CSV is parsed once, typed (low-cardinality
+# text columns become categoricals) and written to an uncompressed Feather file in an on-disk cache. Later loads
+# read the Feather file (memory-mapped, no CSV parsing) into a new DataFrame; the conversion copies the data, so
+# callers cache the loaded frame. The cache is rebuilt whenever the CSV changes.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(APP_DIR, "data")
+CACHE_DIR = os.path.join(APP_DIR, ".data_cache")
+
+# Bump when the typing / conversion below changes, so stale cache files are not reused
+CACHE_VERSION = 1
+
+YES_NO_COLUMNS = ["Polyuria", "Polydipsia", "sudden weight loss", "weakness", "Polyphagia", "Genital thrush", "visual blurring",
+                  "Itching", "Irritability", "delayed healing", "partial paresis", "muscle stiffness", "Alopecia", "Obesity"]
+
+# Dataset name -> source CSV and the columns stored as categoricals
+DATASETS = {
+    "diabetes": {"file": "diabetes_data_upload.csv", "categories": ["Gender", *YES_NO_COLUMNS, "class"]},
+    "diabetes_clean": {"file": "diabetes_data_upload_clean.csv", "categories": []},
+    "age_freq": {"file": "freqdist_of_age_data.csv", "categories": [], "columns": ["Age", "count"]},
+}
+
+
+class DataStoreError(Exception):
+    pass
+
+
+# Function to parse and type a dataset from its source CSV
+def _read_csv(spec):
+    df = pd.read_csv(os.path.join(DATA_DIR, spec["file"]), usecols=spec.get("columns"))
+
+    for column in spec["categories"]:
+        df[column] = df[column].astype("category")
+
+    return df
+
+
+# Function to get the path of the cached columnar copy of a dataset
+def cache_path(name):
+    return os.path.join(CACHE_DIR, f"{name}.v{CACHE_VERSION}.feather")
+
+
+# Function to write the columnar copy of a dataset into the on-disk cache
+def _write_cache(df, path):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Write to a temp file and rename, so an interrupted conversion never leaves a half-written cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        feather.write_feather(df, tmp_path, compression="uncompressed")  # Uncompressed, so it is read without decompressing
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Function to load a dataset by name (cached columnar copy -> local CSV)
+def load_dataset(name):
+    if name not in DATASETS:
+        raise DataStoreError(f"Unknown dataset '{name}'. Available datasets: {', '.join(DATASETS)}")
+
+    spec = DATASETS[name]
+    source_path = os.path.join(DATA_DIR, spec["file"])
+    if not os.path.exists(source_path):
+        raise DataStoreError(f"Data file '{spec['file']}' not found in {DATA_DIR}.")
+
+    if feather is None:
+        return _read_csv(spec)
+
+    path = cache_path(name)
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source_path):
+        _write_cache(_read_csv(spec), path)
+
+    return feather.read_feather(path, memory_map=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    for name in DATASETS:
+        start = time.perf_counter()
+        df = load_dataset(name)
+        print(f"{name:>15}: {df.shape[0]:,} rows x {df.shape[1]} columns in {time.perf_counter() - start:.3f}s")
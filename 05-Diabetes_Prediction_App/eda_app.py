@@ -1,27 +1,50 @@
 import streamlit as st
 
-# Load EDA Packages
-import pandas as pd
-
 # Load Data Viz Packages
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 import seaborn as sns
 import plotly.express as px
+import plotly.graph_objects as go
 
 # Load utils
 from utils import show_banner, expander_formatter
 
+# Load Data Store & EDA Summary
+import data_store
+import eda_summary
+
 # NOTE: Functions
-@st.cache_data
-def load_data(file):
-    df = pd.read_csv(file)
+# Cached as a resource: every rerun gets the same (read-only) DataFrame instead of an unpickled copy
+@st.cache_resource
+def load_data(name):
+    df = data_store.load_dataset(name)
     return df
 
-url_data = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/05-Diabetes_Prediction_App/data/diabetes_data_upload.csv"
-url_clean_data = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/05-Diabetes_Prediction_App/data/diabetes_data_upload_clean.csv"
-url_freq_data = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/05-Diabetes_Prediction_App/data/freqdist_of_age_data.csv"
+# Precomputed tables (built offline by eda_summary.py, rebuilt when the data changes)
+# Keyed on the source data's modification time, so a changed CSV is picked up without restarting the server
+@st.cache_resource(max_entries=1)
+def _load_summary(source_mtime):
+    return eda_summary.load_summary()
+
+def load_summary():
+    return _load_summary(eda_summary.source_mtime())
+
+# Function to build the age box plot from precomputed statistics (one box + its outliers per gender)
+def age_box_plot(box_stats):
+    fig = go.Figure()
+    colors = px.colors.qualitative.D3
+
+    for i, row in enumerate(box_stats.itertuples(index=False)):
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(name=row.Gender, y=[row.Gender], q1=[row.q1], median=[row.median], q3=[row.q3],
+                             lowerfence=[row.lowerfence], upperfence=[row.upperfence], orientation='h', marker_color=color))
+        fig.add_trace(go.Scatter(x=row.outliers, y=[row.Gender] * len(row.outliers), mode='markers', marker_color=color,
+                                 showlegend=False, name=row.Gender))
+
+    fig.update_layout(xaxis_title='Age', yaxis_title='Gender', legend_title_text='Gender')
+    return fig
 
 # NOTE: Apps
 def eda_des_page():
@@ -32,8 +55,8 @@ def eda_des_page():
     st.write("This section provides a descriptive analysis of the Early Stage Diabetes Risk Prediction dataset.")
 
     # Load dataset
-    df = load_data(url_data)
-    df_encoded = load_data(url_clean_data)
+    df = load_data("diabetes")
+    summary = load_summary()
 
     # Format expander font size
     expander_formatter(16)
@@ -48,13 +71,13 @@ def eda_des_page():
         st.dataframe(df_types, use_container_width=True)
 
     with st.expander("Descriptive Summary"): 
-        st.dataframe(df_encoded.describe(), use_container_width=True)
+        st.dataframe(summary["describe"], use_container_width=True)
 
     with st.expander("Class Distribution"):
-        st.dataframe(df['class'].value_counts(), use_container_width=True)
+        st.dataframe(summary["class_counts"], hide_index=True, use_container_width=True)
 
     with st.expander("Gender Distribution"):
-        st.dataframe(df['Gender'].value_counts(), use_container_width=True)
+        st.dataframe(summary["gender_counts"], hide_index=True, use_container_width=True)
 
 def eda_plot_page():
     show_banner()
@@ -63,10 +86,8 @@ def eda_plot_page():
     st.subheader("Data Visualization 📊")
     st.write("This section provides various data visualization plots to help understand the Early Stage Diabetes Risk Prediction dataset.")
 
-    # Load dataset
-    df = load_data(url_data)
-    df_encoded = load_data(url_clean_data)
-    df_freq = load_data(url_freq_data)[['Age', 'count']]
+    # Load precomputed summary (figures are built from small tables, not the full dataset)
+    summary = load_summary()
 
     # Format expander font size
     expander_formatter(16)
@@ -78,8 +99,7 @@ def eda_plot_page():
 
         with st.expander("Dist Plot of Gender"):
 
-            gen_df = df["Gender"].value_counts().reset_index()
-            gen_df.columns = ["Gender", "Count"]
+            gen_df = summary["gender_counts"]
 
             p1 = px.pie(gen_df, names='Gender', values='Count', color_discrete_sequence=px.colors.qualitative.D3)
             st.plotly_chart(p1, use_container_width=True)
@@ -95,8 +115,7 @@ def eda_plot_page():
 
         with st.expander("Dist Plot of Class"):
 
-            class_df = df["class"].value_counts().reset_index()
-            class_df.columns = ["Class", "Count"]
+            class_df = summary["class_counts"]
 
             p2 = px.bar(class_df, x='Class', y='Count', color='Class', color_discrete_sequence=px.colors.qualitative.D3)
             st.plotly_chart(p2, use_container_width=True)
@@ -109,18 +128,16 @@ def eda_plot_page():
     # Freq Dist
     with st.expander("Frequency Distribution of Age"):
 
-        p3 = px.bar(df_freq, x='Age', y='count', color_discrete_sequence=px.colors.qualitative.D3)
+        p3 = px.bar(summary["age_freq"], x='Age', y='count', color_discrete_sequence=px.colors.qualitative.D3)
         st.plotly_chart(p3, use_container_width=True)
 
     # Outlier Detection
     with st.expander("Outlier Detection Plot"):
 
-        p4 = px.box(df, x='Age', color='Gender', color_discrete_sequence=px.colors.qualitative.D3)
+        p4 = age_box_plot(summary["age_box_stats"])
         st.plotly_chart(p4, use_container_width=True)
 
     # Correlation 
     with st.expander("Correlation Matrix"):
-        corr_matrix = df_encoded.corr()
-
-        p5 = px.imshow(corr_matrix, color_continuous_scale="Plasma")
+        p5 = px.imshow(summary["correlation"], color_continuous_scale="Plasma")
         st.plotly_chart(p5, use_container_width=True)
\ No newline at end of file
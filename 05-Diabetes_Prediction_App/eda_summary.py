@@ -0,0 +1,107 @@
+# Load EDA Packages
+import numpy as np
+import pandas as pd
+import joblib
+
+import os
+import tempfile
+import time
+
+# Load Data Store
+import data_store
+
+# NOTE: Offline EDA aggregation for the diabetes dashboard
+# The tables behind every EDA plot (distributions, age frequency, box-plot statistics, correlation matrix) are
+# computed once from the local data and stored in a single summary artifact next to the data cache. The pages
+# build their figures from these small tables; the artifact is rebuilt when any source CSV changes (or by
+# running this module: python eda_summary.py).
+
+SUMMARY_PATH = os.path.join(data_store.CACHE_DIR, f"eda_summary.v{data_store.CACHE_VERSION}.joblib")
+SOURCE_PATHS = [os.path.join(data_store.DATA_DIR, spec["file"]) for spec in data_store.DATASETS.values()]
+
+
+# Function to count the values of a column into a table
+def _value_counts(values, label):
+    counts = values.value_counts().reset_index()
+    counts.columns = [label, "Count"]
+    return counts
+
+
+# Function to compute box-plot statistics of a numeric column per group (same quartiles / fences as plotly's box)
+def _box_stats(df, value, group):
+    rows = []
+
+    for name, values in df.groupby(group, observed=True, sort=False)[value]:
+        values = np.sort(values.to_numpy(dtype=np.float64))
+        q1, median, q3 = np.percentile(values, [25, 50, 75], method="hazen")  # plotly.js' default "linear" quartile method
+        iqr = q3 - q1
+
+        # Whiskers end at the most extreme values within 1.5 IQR, everything beyond is an outlier
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        outliers = values[(values < inside[0]) | (values > inside[-1])]
+
+        rows.append({
+            group: name,
+            "count": len(values),
+            "mean": values.mean(),
+            "lowerfence": inside[0],
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "upperfence": inside[-1],
+            "outliers": np.unique(outliers).tolist(),
+        })
+
+    return pd.DataFrame(rows)
+
+
+# Function to compute every table of the EDA pages
+def build_summary():
+    df = data_store.load_dataset("diabetes")
+    df_encoded = data_store.load_dataset("diabetes_clean")
+
+    return {
+        "describe": df_encoded.describe(),
+        "class_counts": _value_counts(df["class"], "Class"),
+        "gender_counts": _value_counts(df["Gender"], "Gender"),
+        "age_freq": data_store.load_dataset("age_freq"),
+        "age_box_stats": _box_stats(df, "Age", "Gender"),
+        "correlation": df_encoded.corr(),
+    }
+
+
+# Function to build the summary and write it into the cache
+def write_summary(path=SUMMARY_PATH):
+    summary = build_summary()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temp file and rename, so an interrupted build never leaves a half-written summary
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(summary, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return summary
+
+
+# Function to get the latest modification time of the source CSVs (e.g. as a cache key for the loaded summary)
+def source_mtime():
+    return max(os.path.getmtime(source) for source in SOURCE_PATHS)
+
+
+# Function to load the summary, rebuilding it when it is missing or older than any source CSV
+def load_summary(path=SUMMARY_PATH):
+    if not os.path.exists(path) or os.path.getmtime(path) < source_mtime():
+        return write_summary(path)
+
+    return joblib.load(path)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    write_summary()
+    print(f"EDA summary written to {SUMMARY_PATH} in {time.perf_counter() - start:.2f}s")
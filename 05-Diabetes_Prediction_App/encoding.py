@@ -0,0 +1,66 @@
+# Load EDA Packages
+import numpy as np
+import pandas as pd
+
+# NOTE: Feature encoding for the diabetes model
+# Patient records (the columns of diabetes_data_upload.csv, or their snake_case names as in the clean data)
+# are mapped to the model's 16 features with one vectorised lookup per column, so a single form submission
+# and a CSV of thousands of records go through the same code.
+
+# Model features, in training order
+FEATURE_COLUMNS = ["age", "gender", "polyuria", "polydipsia", "sudden_weight_loss", "weakness", "polyphagia", "genital_thrush",
+                   "visual_blurring", "itching", "irritability", "delayed_healing", "partial_paresis", "muscle_stiffness",
+                   "alopecia", "obesity"]
+
+# Accepted values (case-insensitive), incl. already encoded 0 / 1
+_YES_NO_VALUES = {"no": 0, "yes": 1, "0": 0, "1": 1}
+_GENDER_VALUES = {"female": 0, "male": 1, "0": 0, "1": 1}
+
+
+class EncodingError(ValueError):
+    pass
+
+
+# Function to normalise column names ("sudden weight loss" / "Sudden Weight Loss" -> "sudden_weight_loss")
+def normalize_columns(df):
+    return df.rename(columns=lambda column: str(column).strip().lower().replace(" ", "_"))
+
+
+# Function to map one categorical column with a lookup table (vectorised), reporting unknown values
+def _encode_column(values, mapping, column):
+    keys = values.astype(str).str.strip().str.lower().str.replace(r"\.0$", "", regex=True)
+    encoded = keys.map(mapping)
+
+    invalid = encoded.isna()
+    if invalid.any():
+        examples = ", ".join(repr(value) for value in values[invalid].unique()[:5])
+        raise EncodingError(f"Column '{column}' has {invalid.sum()} invalid value(s): {examples}")
+
+    return encoded.to_numpy(dtype=np.float64)
+
+
+# Function to encode a DataFrame of patient records into the model's feature matrix (n_records x 16)
+def encode_frame(df):
+    df = normalize_columns(df)
+
+    missing = [column for column in FEATURE_COLUMNS if column not in df.columns]
+    if missing:
+        raise EncodingError(f"Missing column(s): {', '.join(missing)}")
+
+    features = np.empty((len(df), len(FEATURE_COLUMNS)), dtype=np.float64)
+
+    age = pd.to_numeric(df["age"], errors="coerce")
+    if age.isna().any():
+        raise EncodingError(f"Column 'age' has {age.isna().sum()} non-numeric value(s).")
+    features[:, 0] = age.to_numpy(dtype=np.float64)
+
+    features[:, 1] = _encode_column(df["gender"], _GENDER_VALUES, "gender")
+    for j, column in enumerate(FEATURE_COLUMNS[2:], start=2):
+        features[:, j] = _encode_column(df[column], _YES_NO_VALUES, column)
+
+    return features
+
+
+# Function to encode a single record (dict of column -> value), e.g. the prediction form
+def encode_record(record):
+    return encode_frame(pd.DataFrame([record]))
@@ -1,15 +1,15 @@
 import streamlit as st
 
 # Load ML Packages
-import joblib
-import os
-import requests
-from io import BytesIO
+from portable_model import load_scorer, serving_model_file
 
 # Load EDA Packages
-import numpy as np
 import pandas as pd
 
+# Load Feature Encoding & Batch Scoring
+from encoding import encode_record, EncodingError
+from batch_scoring import score_frame
+
 # Load utils
 from utils import show_banner, expander_formatter
 
@@ -33,31 +33,13 @@ attribute_info = """
 1. Class: 1.Positive, 2.Negative.		
 """
 
-label_dict = {"No":0, "Yes":1}
-gender_map = {"Female":0, "Male":1}
-target_label_map = {"Negative":0, "Positive":1}
-
-# NOTE: Function for input conversion
-def get_fvalue(val):
-    feature_dict = {"No":0, "Yes":1}
-
-    for key, value in feature_dict.items():
-        if val == key:
-            return value
-        
-def get_value(val, my_dict):
-    for key, value in my_dict.items():
-        if val == key:
-            return value
-
-# NOTE: Function to Lead ML MOdels
+# NOTE: Function to Lead ML MOdels (portable logistic regressions are scored with numpy, no sklearn import / unpickling)
 @st.cache_resource
 def load_model(model_file):
-    response = requests.get(model_file)
-    loaded_model = joblib.load(BytesIO(response.content))
-    return loaded_model
+    return load_scorer(model_file)
 
-url_model = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/05-Diabetes_Prediction_App/models/logistic_regression_model_diabetes.pkl"
+# Newest model from compare_models.py, else the original logistic regression
+model_file = serving_model_file()
 
 # NOTE: ML Page
 def ml_page():
@@ -128,21 +110,11 @@ def ml_page():
 
             st.dataframe(df_result, use_container_width=True)
 
-            encoded_result = []
-            for i in result.values():
-                if type(i) == int:
-                    encoded_result.append(i)
-                elif i in ["Female", "Male"]:
-                    res = get_value(i, gender_map)
-                    encoded_result.append(res)
-                else:
-                    encoded_result.append(get_fvalue(i))
-
         # Prediction Result
         with st.expander("Prediction Result"):
-            single_sample = np.array(encoded_result).reshape(1, -1)
+            single_sample = encode_record(result)
 
-            model = load_model(url_model)
+            model = load_model(model_file)
             prediction = model.predict(single_sample)
             pred_prob = model.predict_proba(single_sample)
 
@@ -155,4 +127,39 @@ def ml_page():
                 st.dataframe(score_df, use_container_width=True)
             else:
                 st.success("✅ Your results indicate a **low risk of diabetes**")
-                st.dataframe(score_df, use_container_width=True)
\ No newline at end of file
+                st.dataframe(score_df, use_container_width=True)
+
+# NOTE: Batch Prediction Page
+def ml_batch_page():
+    show_banner()
+    st.title("Batch Diabetes Prediction 📂")
+    st.write("Upload a CSV of patient records (same columns as the Early Stage Diabetes Risk Prediction dataset) to score them all at once.")
+
+    expander_formatter(16)
+
+    with st.expander("Attribute Information"):
+        st.write(attribute_info)
+
+    uploaded_file = st.file_uploader("Upload patient records (CSV)", type=["csv"])
+
+    if uploaded_file is not None:
+        try:
+            df = pd.read_csv(uploaded_file)
+
+            # All records are encoded and scored with one predict_proba call
+            scored_df = score_frame(df, load_model(model_file))
+        except (EncodingError, pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+            st.error(f"⚠️ Could not read the patient records: {e}")
+            return
+
+        n_positive = int((scored_df["predicted_class"] == "Positive").sum())
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Records", f"{len(scored_df):,}")
+        col2.metric("High Diabetes Risk", f"{n_positive:,}")
+        col3.metric("Low Diabetes Risk", f"{len(scored_df) - n_positive:,}")
+
+        with st.expander("Prediction Results", expanded=True):
+            st.dataframe(scored_df, height=350, use_container_width=True)
+
+        st.download_button("Download Results (CSV)", scored_df.to_csv(index=False), file_name="diabetes_predictions.csv", mime="text/csv")
@@ -0,0 +1,154 @@
+# Load ML Packages
+import model_store
+import numpy as np
+
+import json
+import os
+
+# Load Feature Encoding
+from encoding import FEATURE_COLUMNS
+
+# NOTE: Portable logistic regression format
+# The diabetes model is a 16-feature logistic regression, so everything inference needs is one coefficient
+# per feature plus the intercept. The exporter writes them to a small JSON file next to the pickle, and
+# LogisticScorer computes the same probabilities with plain numpy - no sklearn / joblib import and no
+# unpickling when the prediction page or a batch job starts.
+
+MODEL_FILE = "logistic_regression_model_diabetes.pkl"
+EXPORT_FILE = "logistic_regression_model_diabetes.json"
+
+# Names the model file to serve (written by compare_models.py when it saves a winner)
+SERVING_FILE = "serving.json"
+
+
+# Function to export a (pickled or freshly fitted) logistic regression into the portable format (file is registered in checksums.json)
+def export_model(model_file=MODEL_FILE, export_file=EXPORT_FILE, model=None):
+    model = model if model is not None else model_store.load_model(model_file)
+
+    if len(model.classes_) != 2 or model.coef_.shape != (1, len(FEATURE_COLUMNS)):
+        raise ValueError(f"Only binary logistic regressions on the {len(FEATURE_COLUMNS)} encoded features can be exported.")
+
+    # Python floats are written with round-trip precision, so the exported weights are exact
+    exported = {
+        "model_type": "logistic_regression",
+        "features": FEATURE_COLUMNS,
+        "classes": model.classes_.tolist(),
+        "coef": model.coef_[0].tolist(),
+        "intercept": float(model.intercept_[0]),
+    }
+
+    export_path = os.path.join(model_store.MODEL_DIR, export_file)
+    with open(export_path, "w", encoding="utf-8") as f:
+        json.dump(exported, f, indent=2)
+        f.write("\n")
+
+    model_store.register_model(export_path)
+
+    return exported
+
+
+class LogisticScorer:
+
+    def __init__(self, coef, intercept, classes=(0, 1), features=FEATURE_COLUMNS):
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.classes_ = np.asarray(classes)
+        self.features = list(features)
+
+    # Function to load an exported model (verified through the model store)
+    @classmethod
+    def load(cls, export_file=EXPORT_FILE):
+        export_path, _ = model_store.resolve_model_path(export_file)
+        with open(export_path, encoding="utf-8") as f:
+            exported = json.load(f)
+
+        if exported["features"] != FEATURE_COLUMNS:
+            raise ValueError(f"'{export_file}' was exported for different features than encoding.FEATURE_COLUMNS.")
+
+        return cls(exported["coef"], exported["intercept"], exported["classes"], exported["features"])
+
+    # Function to get the log-odds of the positive class for an encoded feature matrix
+    def decision_function(self, features):
+        return np.asarray(features, dtype=np.float64) @ self.coef + self.intercept
+
+    # Function to get [negative, positive] probabilities (same layout as sklearn's predict_proba)
+    def predict_proba(self, features):
+        positive_probability = 1 / (1 + np.exp(-self.decision_function(features)))
+        return np.column_stack([1 - positive_probability, positive_probability])
+
+    # Function to predict the class (positive when the log-odds are above 0, as in sklearn)
+    def predict(self, features):
+        return self.classes_[(self.decision_function(features) > 0).astype(int)]
+
+
+# NOTE: Model selection for the prediction page & batch jobs
+
+# Function to record which model file ml_app / batch_scoring serve (e.g. the winner of compare_models.py)
+def save_serving_model(model_file):
+    with open(os.path.join(model_store.MODEL_DIR, SERVING_FILE), "w", encoding="utf-8") as f:
+        json.dump({"model_file": model_file}, f, indent=2)
+        f.write("\n")
+
+
+# Function to pick the model to serve: the recorded model file, else the original model's portable export
+def serving_model_file():
+    path = os.path.join(model_store.MODEL_DIR, SERVING_FILE)
+    if not os.path.exists(path):
+        return EXPORT_FILE
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["model_file"]
+
+
+# Function to load a model for scoring encoded features (portable .json -> LogisticScorer, otherwise the pickled estimator)
+def load_scorer(model_file=None):
+    model_file = model_file or serving_model_file()
+    if model_file.endswith(".json"):
+        return LogisticScorer.load(model_file)
+
+    return model_store.load_model(model_file)
+
+
+# NOTE: Parity check against the pickled model
+
+# Function to compare probabilities / classes of the portable scorer with the pickled model on the diabetes data
+def check_parity():
+    import time
+    import data_store
+    from encoding import encode_frame
+
+    features = encode_frame(data_store.load_dataset("diabetes"))
+
+    start = time.perf_counter()
+    model = model_store.load_model(MODEL_FILE)
+    pickled_load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer = LogisticScorer.load()
+    portable_load_s = time.perf_counter() - start
+
+    expected = model.predict_proba(features)
+    actual = scorer.predict_proba(features)
+
+    return {
+        "records": len(features),
+        "max_probability_diff": float(np.abs(expected - actual).max()),
+        "class_mismatches": int((model.predict(features) != scorer.predict(features)).sum()),
+        "pickled_load_s": pickled_load_s,
+        "portable_load_s": portable_load_s,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the diabetes logistic regression to the portable format and check parity.")
+    parser.add_argument("--skip-export", action="store_true", help="Only run the parity check on the existing export")
+    args = parser.parse_args()
+
+    if not args.skip_export:
+        export_model()
+        print(f"Exported {EXPORT_FILE}")
+
+    for key, value in check_parity().items():
+        print(f"{key:>22}: {value}")
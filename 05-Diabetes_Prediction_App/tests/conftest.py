@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The app modules import each other by name (as when running `streamlit run app.py` from the app folder)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
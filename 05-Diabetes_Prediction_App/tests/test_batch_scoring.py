@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+import data_store
+from batch_scoring import CLASS_LABELS, score_frame
+from encoding import encode_frame
+
+
+def test_header_only_frame_gives_empty_result():
+    df = data_store.load_dataset("diabetes").iloc[:0]
+    model = DecisionTreeClassifier(random_state=0).fit(np.zeros((2, 16)), [0, 1])
+
+    scored = score_frame(df, model)
+
+    assert scored.empty
+    assert list(scored.columns) == list(df.columns) + ["positive_probability", "predicted_class"]
+
+
+def test_predicted_class_follows_model_predict():
+    df = data_store.load_dataset("diabetes")
+    features = encode_frame(df)
+    model = DecisionTreeClassifier(max_depth=3, random_state=0).fit(features, (df["class"] == "Positive").to_numpy(dtype=int))
+
+    scored = score_frame(df, model)
+
+    expected = pd.Series(model.predict(features), index=df.index).map(CLASS_LABELS)
+    pd.testing.assert_series_equal(scored["predicted_class"], expected, check_names=False)
+    np.testing.assert_allclose(scored["positive_probability"], model.predict_proba(features)[:, 1])
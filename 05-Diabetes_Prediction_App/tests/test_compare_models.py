@@ -0,0 +1,32 @@
+import os
+
+import pytest
+from sklearn.naive_bayes import BernoulliNB
+
+import model_store
+from compare_models import MODELS, export_winner
+from portable_model import EXPORT_FILE, LogisticScorer, load_scorer, serving_model_file
+
+
+@pytest.fixture
+def model_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_store, "MODEL_DIR", str(tmp_path))
+    monkeypatch.setattr(model_store, "CHECKSUM_FILE", str(tmp_path / "checksums.json"))
+    return tmp_path
+
+
+def test_original_model_is_served_without_a_recorded_winner(model_dir):
+    assert serving_model_file() == EXPORT_FILE
+
+
+def test_later_non_logistic_winner_replaces_same_prefix_export(model_dir):
+    export_winner("Logistic Regression", MODELS, prefix="99990101")
+    assert serving_model_file() == "99990101_Diabetes_Model.json"
+    assert isinstance(load_scorer(), LogisticScorer)
+
+    export_winner("Naive Bayes", MODELS, prefix="99990101")
+
+    assert serving_model_file() == "99990101_Diabetes_Model.pkl"
+    assert isinstance(load_scorer(), BernoulliNB)
+    assert not os.path.exists(model_dir / "99990101_Diabetes_Model.json")
+    assert "99990101_Diabetes_Model.json" not in model_store.load_checksums()
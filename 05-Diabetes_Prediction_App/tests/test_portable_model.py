@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+import data_store
+from encoding import FEATURE_COLUMNS, encode_frame
+from portable_model import LogisticScorer, check_parity
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    df = data_store.load_dataset("diabetes")
+    return encode_frame(df), (df["class"] == "Positive").to_numpy(dtype=int)
+
+
+def test_shipped_export_matches_pickled_model():
+    parity = check_parity()
+    assert parity["max_probability_diff"] < 1e-12
+    assert parity["class_mismatches"] == 0
+
+
+@pytest.mark.parametrize("C", [0.01, 1.0, 100.0])
+def test_scorer_matches_fitted_logistic_regression(dataset, C):
+    features, labels = dataset
+    model = LogisticRegression(C=C, max_iter=5000).fit(features, labels)
+    scorer = LogisticScorer(model.coef_[0], model.intercept_[0], model.classes_, FEATURE_COLUMNS)
+
+    np.testing.assert_allclose(scorer.decision_function(features), model.decision_function(features), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(scorer.predict_proba(features), model.predict_proba(features), rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(scorer.predict(features), model.predict(features))
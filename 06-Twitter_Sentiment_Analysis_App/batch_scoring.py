@@ -0,0 +1,181 @@
+# Load ML Packages
+import model_store
+
+# Load Batch Processing Packages
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice, tee
+
+# Load Preprocessing & Sentiment Pipeline
+from preprocessing import TweetPreprocessor
+from pipeline import SentimentPipeline
+from xgb_inference import load_inference_config, make_scorer, serving_files
+
+# NOTE: Batch scoring of tweets with the TF-IDF + XGBoost model
+# Tweets are cleaned in a process pool, each batch is vectorized into one sparse matrix and scored with a
+# single native booster call. Results are streamed, so inputs of any size can be scored with bounded memory.
+
+SCORE_FIELDS = ["cleaned_text", "negative_probability", "predicted_sentiment"]
+
+
+# Function to load the sentiment pipeline (vectorizer + model) once per process and model file
+# (default: the TWEET_SENTIMENT_MODEL environment variable or the newest tuned model, see xgb_inference.serving_files)
+@lru_cache(maxsize=None)
+def load_pipeline(model_file=None):
+    model_file, vectorizer_file = serving_files(model_file)
+    model = make_scorer(model_store.load_model(model_file), model_file)
+    return SentimentPipeline(model_store.load_model(vectorizer_file, mmap_mode="r"), model, threshold=load_inference_config(model_file)["threshold"])
+
+
+# NOTE: Process pool workers
+
+_worker_preprocessor = None
+
+def _init_worker():
+    global _worker_preprocessor
+    _worker_preprocessor = TweetPreprocessor()
+
+def _clean_chunk(texts):
+    return _worker_preprocessor.clean_many(texts)
+
+
+# Function to split an iterable into lists of batch_size items
+def batched(iterable, batch_size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+# Function to clean batches of tweets, in a process pool when n_jobs > 1 (yields cleaned batches in order)
+# cleaner: anything with clean_many(texts) used when n_jobs == 1 (a SentimentPipeline or a TweetPreprocessor)
+def clean_batches(batches, n_jobs, cleaner):
+    if n_jobs == 1:
+        for batch in batches:
+            yield cleaner.clean_many(batch)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as executor:
+        # Keep only a few batches in flight so huge inputs are not read into memory all at once
+        pending = deque()
+        for batch in batches:
+            # Split each batch across the workers
+            chunk_size = -(-len(batch) // n_jobs)
+            pending.append([executor.submit(_clean_chunk, chunk) for chunk in batched(batch, chunk_size)])
+
+            if len(pending) >= 2:
+                yield [text for future in pending.popleft() for text in future.result()]
+
+        while pending:
+            yield [text for future in pending.popleft() for text in future.result()]
+
+
+# Function to score raw tweets, yields one result dict per tweet in input order
+def score_tweets(texts, batch_size=1000, n_jobs=None, threshold=None, model_file=None):
+    pipeline = load_pipeline(model_file)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    threshold = pipeline.threshold if threshold is None else threshold
+
+    texts = ("" if text is None else str(text) for text in texts)
+
+    for cleaned_batch in clean_batches(batched(texts, batch_size), n_jobs, pipeline):
+        # One sparse matrix and one prediction call per batch
+        features = pipeline.featurize(cleaned_batch)
+        negative_probabilities = pipeline.predict_negative_proba(features)
+
+        for cleaned_text, probability in zip(cleaned_batch, negative_probabilities):
+            yield {
+                "cleaned_text": cleaned_text,
+                "negative_probability": float(probability),
+                "predicted_sentiment": "negative" if probability >= threshold else "non-negative",
+            }
+
+
+# NOTE: Streaming file input / output
+
+# Function to stream records from a CSV or JSONL file
+def read_records(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+# Function to get the CSV output columns: the input columns followed by the added fields
+# (JSONL input has no header, so the columns then come from the first record)
+def output_fieldnames(input_path, added_fields):
+    if input_path.endswith(".jsonl"):
+        return None
+
+    with open(input_path, encoding="utf-8", newline="") as f:
+        columns = next(csv.reader(f), [])
+    return columns + [field for field in added_fields if field not in columns]
+
+
+# Function to stream records into a CSV or JSONL file
+# CSV columns are fixed by fieldnames (or the first record); keys outside them are ignored, missing ones left blank
+def write_records(path, records, fieldnames=None):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
+
+        writer = None
+        for record in records:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=fieldnames or list(record), extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow(record)
+
+        # Empty input: still write the header
+        if writer is None and fieldnames:
+            csv.DictWriter(f, fieldnames=fieldnames).writeheader()
+
+
+# Function to score a CSV / JSONL file of tweets into another CSV / JSONL file, reporting throughput
+def score_file(input_path, output_path, text_column="text", batch_size=1000, n_jobs=None, threshold=None, report_every=10_000, model_file=None):
+    records, records_for_text = tee(read_records(input_path))
+    texts = (record.get(text_column) for record in records_for_text)
+
+    start = time.perf_counter()
+    scored = 0
+
+    def scored_records():
+        nonlocal scored
+        for record, scores in zip(records, score_tweets(texts, batch_size, n_jobs, threshold, model_file)):
+            scored += 1
+            if scored % report_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"Scored {scored:,} tweets ({scored / elapsed:,.0f} tweets/second)", file=sys.stderr)
+            yield {**record, **scores}
+
+    write_records(output_path, scored_records(), output_fieldnames(input_path, SCORE_FIELDS))
+
+    elapsed = time.perf_counter() - start
+    print(f"Done: {scored:,} tweets in {elapsed:.1f}s ({scored / max(elapsed, 1e-9):,.0f} tweets/second)", file=sys.stderr)
+
+    return scored
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score tweets in a CSV / JSONL file with the Twitter sentiment model.")
+    parser.add_argument("input", help="Input file (.csv or .jsonl)")
+    parser.add_argument("output", help="Output file (.csv or .jsonl)")
+    parser.add_argument("--text-column", default="text", help="Column / key with the tweet text (default: text)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Tweets per vectorize + predict batch (default: 1000)")
+    parser.add_argument("--jobs", type=int, default=None, help="Preprocessing processes (default: all cores, 1 = no pool)")
+    parser.add_argument("--threshold", type=float, default=None, help="Negative probability threshold (default: stored with the model)")
+    parser.add_argument("--model-file", default=None, help="Model file in the model folder, e.g. a streaming model (default: newest tuned model)")
+    args = parser.parse_args()
+
+    score_file(args.input, args.output, args.text_column, args.batch_size, args.jobs, args.threshold, model_file=args.model_file)
@@ -0,0 +1,116 @@
+# Load EDA Packages
+import pandas as pd
+
+import os
+import tempfile
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow ships with streamlit, but fall back to plain CSV parsing without it
+    feather = None
+
+# Load Preprocessing Pipeline
+from preprocessing import TweetPreprocessor
+
+# NOTE: Data store
+# Datasets are read from the local data folder (no network). Each CSV is parsed once, typed (low-cardinality
+# text columns become categoricals) and written to an uncompressed Feather file in an on-disk cache. Later loads
+# read the Feather file (memory-mapped, no CSV parsing) into a new DataFrame; the conversion copies the data, so
+# callers cache the loaded frame. The cache is rebuilt whenever the CSV changes.
+# Derived datasets (e.g. the preprocessed tweets used for training) are built from their source CSV the same way.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(APP_DIR, "data")
+CACHE_DIR = os.path.join(APP_DIR, ".data_cache")
+
+# Bump when the typing / conversion below changes, so stale cache files are not reused
+CACHE_VERSION = 1
+
+
+# Function to drop the record with missing values (there's only 1, as in the training notebook)
+def _drop_missing(df):
+    return df.dropna().reset_index(drop=True)
+
+
+# Function to rebuild the preprocessed tweets of the training notebook (grouped labels + stemmed text)
+def _preprocess_tweets(df):
+    df = _drop_missing(df)
+
+    # Combine positive and neutral sentiment into one class, i.e. non-negative
+    df["sentiment"] = df["sentiment"].replace({"neutral": "non-negative", "positive": "non-negative"})
+    df["stemmed_text"] = TweetPreprocessor().clean_many(df["text"].tolist())
+
+    return df
+
+
+# Dataset name -> source CSV, optional build step and the columns stored as categoricals
+DATASETS = {
+    "tweets": {"file": "Tweets.csv", "build": _drop_missing, "categories": ["sentiment"]},
+    "tweets_processed": {"file": "Tweets.csv", "build": _preprocess_tweets, "categories": ["sentiment"]},
+}
+
+
+class DataStoreError(Exception):
+    pass
+
+
+# Function to parse, build and type a dataset from its source CSV
+def _read_csv(spec):
+    df = pd.read_csv(os.path.join(DATA_DIR, spec["file"]), usecols=spec.get("columns"))
+
+    if "build" in spec:
+        df = spec["build"](df)
+
+    for column in spec["categories"]:
+        df[column] = df[column].astype("category")
+
+    return df
+
+
+# Function to get the path of the cached columnar copy of a dataset
+def cache_path(name):
+    return os.path.join(CACHE_DIR, f"{name}.v{CACHE_VERSION}.feather")
+
+
+# Function to write the columnar copy of a dataset into the on-disk cache
+def _write_cache(df, path):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Write to a temp file and rename, so an interrupted conversion never leaves a half-written cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        feather.write_feather(df, tmp_path, compression="uncompressed")  # Uncompressed, so it is read without decompressing
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Function to load a dataset by name (cached columnar copy -> local CSV)
+def load_dataset(name):
+    if name not in DATASETS:
+        raise DataStoreError(f"Unknown dataset '{name}'. Available datasets: {', '.join(DATASETS)}")
+
+    spec = DATASETS[name]
+    source_path = os.path.join(DATA_DIR, spec["file"])
+    if not os.path.exists(source_path):
+        raise DataStoreError(f"Data file '{spec['file']}' not found in {DATA_DIR}.")
+
+    if feather is None:
+        return _read_csv(spec)
+
+    path = cache_path(name)
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source_path):
+        _write_cache(_read_csv(spec), path)
+
+    return feather.read_feather(path, memory_map=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    for name in DATASETS:
+        start = time.perf_counter()
+        df = load_dataset(name)
+        print(f"{name:>16}: {df.shape[0]:,} rows x {df.shape[1]} columns in {time.perf_counter() - start:.3f}s")
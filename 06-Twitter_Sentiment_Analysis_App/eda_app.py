@@ -1,29 +1,37 @@
 import streamlit as st
 
-# Load EDA Packages
-import pandas as pd
-import re
-from collections import Counter
-from nltk.corpus import stopwords
-import string
-
 # Load Data Viz Packages
-import matplotlib.pyplot as plt
 import plotly.express as px
-from wordcloud import WordCloud
 
 # Load utils
 from utils import show_banner, expander_formatter
 
-url_tweets = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/06-Twitter_Sentiment_Analysis_App/data/Tweets.csv"
-url_tweets_processed = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/06-Twitter_Sentiment_Analysis_App/data/Preprocessed_Tweets.csv"
+# Load Data Store & EDA Summary
+import data_store
+import eda_summary
 
 # NOTE: Functions
-@st.cache_data
-def load_data(file):
-    df = pd.read_csv(file)
+# Cached as a resource: every rerun gets the same (read-only) DataFrame instead of an unpickled copy,
+# so the pages must not modify it in place
+@st.cache_resource
+def load_data(name):
+    df = data_store.load_dataset(name)
     return df
 
+# Precomputed tables & word clouds (built offline by eda_summary.py, rebuilt when the data changes)
+# Keyed on the source data's modification time, so a changed CSV is picked up without restarting the server
+@st.cache_resource(max_entries=1)
+def _load_summary(source_mtime):
+    return eda_summary.load_summary()
+
+def load_summary():
+    return _load_summary(eda_summary.source_mtime())
+
+# Function to show a precomputed word cloud for a given sentiment
+def show_wordcloud(summary, sentiment, text_type):
+    st.write(f"**WordCloud for {sentiment.capitalize()} Sentiment**")
+    st.image(summary["wordclouds"][(text_type, sentiment)], use_container_width=True)
+
 # NOTE: Apps
 def eda_des_page():
     show_banner()
@@ -33,9 +41,8 @@ def eda_des_page():
     st.write("This section provides a descriptive analysis of the Twitter Tweets dataset.")
 
     # Load dataset
-    df = load_data(url_tweets)
-    df.dropna(inplace=True) # Drop record with missing value
-    df_processed = load_data(url_tweets_processed)
+    df = load_data("tweets") # Record with missing value already dropped
+    summary = load_summary()
 
     # Format expander font size
     expander_formatter(16)
@@ -44,74 +51,41 @@ def eda_des_page():
         st.dataframe(df, height=250)
 
     with st.expander("Sentiment Distribution"): 
-        st.dataframe(df['sentiment'].value_counts(), use_container_width=True)
+        st.dataframe(summary["sentiment_counts"], use_container_width=True, hide_index=True)
 
         st.warning("""For this project, to simplify the classification task, neutral and positive tweets are combined into a single category - ***non-negative***.
                    This results in a binary sentiment classification: ***negative*** vs. ***non-negative***.
                    """)
 
     with st.expander("Sentiment Distribution (After Label Grouping)"):
-        st.dataframe(df_processed['sentiment'].value_counts(), use_container_width=True)
+        st.dataframe(summary["grouped_sentiment_counts"], use_container_width=True, hide_index=True)
 
         st.warning("""After label grouping, the sentiment distribution became significantly imbalanced. Therefore, a class balancing technique (SMOTE)
                    will be applied during model development.
                    """)
 
     with st.expander("Descriptive Statistics of Tweets Length"):
-        # Calculate tweet length by word counts
-        df['tweet_length_words'] = df['text'].apply(lambda x: len(x.split()))
         st.write("**Tweet Length (Word Count)**")
-        st.dataframe(df['tweet_length_words'].describe().drop('count'), use_container_width=True)
+        st.dataframe(summary["length_words_stats"], use_container_width=True)
 
-        # Calculate tweet length by characters
-        df['tweet_length_chars'] = df['text'].apply(len)
         st.write("**Tweet Length (Characters)**")
-        st.dataframe(df['tweet_length_chars'].describe().drop('count'), use_container_width=True)
+        st.dataframe(summary["length_chars_stats"], use_container_width=True)
 
     with st.expander("Distributions of Hashtags and Mentions"):
-        # Extract hashtags and mentions
-        df['hashtags'] = df['text'].apply(lambda x: re.findall(r'#\w+', x))
-        df['mentions'] = df['text'].apply(lambda x: re.findall(r'@\w+', x))
-
-        # Count hashtags and mentions
-        all_hashtags = [tag.lower() for tags in df['hashtags'] for tag in tags]
-        all_mentions = [mention.lower() for mentions in df['mentions'] for mention in mentions]
-
-        hashtag_counts = Counter(all_hashtags)
-        mention_counts = Counter(all_mentions)
-
-        hashtags_df = pd.DataFrame(hashtag_counts.most_common(10), columns=['Hashtag', 'Count'])
-        mentions_df = pd.DataFrame(mention_counts.most_common(10), columns=['Mention', 'Count'])
-
         st.write("**Top 10 Commonly Used Hashtags**")
-        st.dataframe(hashtags_df, use_container_width=True, hide_index=True)
+        st.dataframe(summary["top_hashtags"], use_container_width=True, hide_index=True)
         st.write("**Top 10 Commonly Used Mentions**")
-        st.dataframe(mentions_df, use_container_width=True, hide_index=True)
+        st.dataframe(summary["top_mentions"], use_container_width=True, hide_index=True)
 
         st.warning("""Both hashtags and mentions are considered noise for the development of the text classification model.
                    They will be removed during the data preprocessing steps.
                    """)
 
     with st.expander("Distributions of Stopwords and Punctuations"):
-        # Define stopwords and punctuation
-        stop_words = set(stopwords.words('english'))
-        punctuations = set(string.punctuation)
-
-        stopword_counts = Counter()
-        punctuation_counts = Counter()
-
-        for tweet in df['text']:
-            words = tweet.split()
-            stopword_counts.update([word.lower() for word in words if word.lower() in stop_words])
-            punctuation_counts.update([char for char in tweet if char in punctuations])
-
-        stopword_df = pd.DataFrame(stopword_counts.most_common(20), columns=['Stopword', 'Count'])
-        punctuation_df = pd.DataFrame(punctuation_counts.most_common(10), columns=['Punctuation', 'Count'])
-
         st.write("**Top 20 Commonly Used Stopwords**")
-        st.dataframe(stopword_df, use_container_width=True, hide_index=True)
+        st.dataframe(summary["top_stopwords"], use_container_width=True, hide_index=True)
         st.write("**Top 10 Commonly Used Punctuations**")
-        st.dataframe(punctuation_df, use_container_width=True, hide_index=True)
+        st.dataframe(summary["top_punctuations"], use_container_width=True, hide_index=True)
 
         st.warning("""Both stopwords and punctuations are considered noise for the development of the text classification model.
                    They will be removed during the data preprocessing steps.
@@ -124,10 +98,8 @@ def eda_plot_page():
     st.subheader("Data Visualization 📊")
     st.write("This section provides various data visualization plots to help understand the Twitter Tweets dataset.")
 
-    # Load dataset
-    df = load_data(url_tweets)
-    df.dropna(inplace=True) # Drop record with missing value
-    df_processed = load_data(url_tweets_processed)
+    # Load precomputed summary
+    summary = load_summary()
 
     # Format expander font size
     expander_formatter(16)
@@ -142,54 +114,30 @@ def eda_plot_page():
 
     with st.expander("Sentiment Distribution"):
 
-        sentiment_df = df["sentiment"].value_counts().reset_index()
-        sentiment_df.columns = ["Sentiment", "Count"]
-
-        p1 = px.pie(sentiment_df, names='Sentiment', values='Count', color='Sentiment', color_discrete_map=color_map)
+        p1 = px.pie(summary["sentiment_counts"], names='Sentiment', values='Count', color='Sentiment', color_discrete_map=color_map)
         st.plotly_chart(p1, use_container_width=True)
 
     with st.expander("Sentiment Distribution (After Label Grouping)"):
 
-        sentiment_df = df_processed["sentiment"].value_counts().reset_index()
-        sentiment_df.columns = ["Sentiment", "Count"]
-
-        p2 = px.pie(sentiment_df, names='Sentiment', values='Count', color='Sentiment', color_discrete_map=color_map)
+        p2 = px.pie(summary["grouped_sentiment_counts"], names='Sentiment', values='Count', color='Sentiment', color_discrete_map=color_map)
         st.plotly_chart(p2, use_container_width=True)
 
     with st.expander("Tweet Length Distribution"):
-        # Calculate tweet length by word counts
-        df['tweet_length_words'] = df['text'].apply(lambda x: len(x.split()))
+        # Histograms from precomputed length frequencies (summed per bin)
         st.write("**Tweet Length (Word Count)**")
-        p3 = px.histogram(df, x='tweet_length_words', opacity=0.5)
+        p3 = px.histogram(summary["length_words_freq"], x='tweet_length_words', y='count', opacity=0.5)
         p3.update_traces(marker_line_color='black', marker_line_width=1)
         st.plotly_chart(p3, use_container_width=True)
 
-        # Calculate tweet length by characters
-        df['tweet_length_chars'] = df['text'].apply(len)
         st.write("**Tweet Length (Characters)**")
-        p4 = px.histogram(df, x='tweet_length_chars', opacity=0.5)
+        p4 = px.histogram(summary["length_chars_freq"], x='tweet_length_chars', y='count', opacity=0.5)
         p4.update_traces(marker_line_color='black', marker_line_width=1)
         st.plotly_chart(p4, use_container_width=True)
 
     with st.expander("WordCloud (Before Data Preprocessing)"):
-        # Combine positive and neutral sentiment into one class, i.e. non-negative
-        df['sentiment'] = df['sentiment'].replace({'neutral': 'non-negative', 'positive': 'non-negative'})
-
-        # Function to generate a WordCloud for a given sentiment
-        def generate_wordcloud(df, sentiment, text_type):
-            text = " ".join(df[(df['sentiment'] == sentiment) & (df[text_type].apply(lambda x: isinstance(x, str)))][text_type])
-            wordcloud = WordCloud(width=600, height=300, background_color="white").generate(text)
-
-            # Display the word cloud
-            fig = plt.figure(figsize=(8, 4))
-            plt.imshow(wordcloud, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"WordCloud for {sentiment.capitalize()} Sentiment", fontsize=12)
-            st.pyplot(fig)
-
-        generate_wordcloud(df, "negative", "text")
-        generate_wordcloud(df, "non-negative", "text")
+        show_wordcloud(summary, "negative", "text")
+        show_wordcloud(summary, "non-negative", "text")
 
     with st.expander("WordCloud (After Data Preprocessing)"):
-        generate_wordcloud(df_processed, "negative", "stemmed_text")
-        generate_wordcloud(df_processed, "non-negative", "stemmed_text")
\ No newline at end of file
+        show_wordcloud(summary, "negative", "stemmed_text")
+        show_wordcloud(summary, "non-negative", "stemmed_text")
@@ -0,0 +1,128 @@
+# Load EDA Packages
+import pandas as pd
+import joblib
+import re
+import string
+from nltk.corpus import stopwords
+
+# Load Data Viz Packages
+from wordcloud import WordCloud
+
+import io
+import os
+import tempfile
+import time
+
+# Load Data Store
+import data_store
+
+# NOTE: Offline EDA aggregation for the Twitter dashboard
+# Every table and word cloud shown on the EDA pages is computed once with vectorised pandas .str operations
+# and stored in a single summary artifact next to the data cache. The pages only read the artifact; it is
+# rebuilt when the source CSV changes (or by running this module: python eda_summary.py).
+
+SUMMARY_PATH = os.path.join(data_store.CACHE_DIR, f"eda_summary.v{data_store.CACHE_VERSION}.joblib")
+SOURCE_PATH = os.path.join(data_store.DATA_DIR, data_store.DATASETS["tweets"]["file"])
+
+PUNCTUATION_PATTERN = "[" + re.escape(string.punctuation) + "]"
+
+
+# Function to count the values of an exploded Series into a top-n table
+def _top_counts(values, n, label):
+    counts = values.dropna().value_counts().head(n).reset_index()
+    counts.columns = [label, "Count"]
+    return counts
+
+
+# Function to count how often each value (e.g. a tweet length) occurs, for histograms
+def _value_frequencies(values, label):
+    frequencies = values.value_counts().sort_index().reset_index()
+    frequencies.columns = [label, "count"]
+    return frequencies
+
+
+# Function to count sentiment labels into a table
+def _sentiment_counts(sentiment):
+    counts = sentiment.value_counts().reset_index()
+    counts.columns = ["Sentiment", "Count"]
+    return counts
+
+
+# Function to render a word cloud for one sentiment into PNG bytes
+def _wordcloud_png(df, sentiment, text_type):
+    text = " ".join(df.loc[df["sentiment"] == sentiment, text_type])
+    image = WordCloud(width=600, height=300, background_color="white").generate(text).to_image()
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# Function to compute every table and image of the EDA pages
+def build_summary():
+    df = data_store.load_dataset("tweets")
+    df_processed = data_store.load_dataset("tweets_processed")
+    text = df["text"]
+
+    # Tweet lengths
+    tweet_length_words = text.str.split().str.len().rename("tweet_length_words")
+    tweet_length_chars = text.str.len().rename("tweet_length_chars")
+
+    # Hashtags, mentions, stopwords and punctuations (one exploded Series each)
+    words = text.str.lower().str.split().explode()
+    stop_words = set(stopwords.words("english"))
+
+    return {
+        "sentiment_counts": _sentiment_counts(df["sentiment"]),
+        "grouped_sentiment_counts": _sentiment_counts(df_processed["sentiment"]),
+        "length_words_stats": tweet_length_words.describe().drop("count").to_frame(),
+        "length_chars_stats": tweet_length_chars.describe().drop("count").to_frame(),
+        "length_words_freq": _value_frequencies(tweet_length_words, "tweet_length_words"),
+        "length_chars_freq": _value_frequencies(tweet_length_chars, "tweet_length_chars"),
+        "top_hashtags": _top_counts(text.str.findall(r"#\w+").explode().str.lower(), 10, "Hashtag"),
+        "top_mentions": _top_counts(text.str.findall(r"@\w+").explode().str.lower(), 10, "Mention"),
+        "top_stopwords": _top_counts(words[words.isin(stop_words)], 20, "Stopword"),
+        "top_punctuations": _top_counts(text.str.findall(PUNCTUATION_PATTERN).explode(), 10, "Punctuation"),
+        "wordclouds": {
+            (text_type, sentiment): _wordcloud_png(df_processed, sentiment, text_type)
+            for text_type in ["text", "stemmed_text"]
+            for sentiment in ["negative", "non-negative"]
+        },
+    }
+
+
+# Function to build the summary and write it into the cache
+def write_summary(path=SUMMARY_PATH):
+    summary = build_summary()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temp file and rename, so an interrupted build never leaves a half-written summary
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(summary, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return summary
+
+
+# Function to get the modification time of the source CSV (e.g. as a cache key for the loaded summary)
+def source_mtime():
+    return os.path.getmtime(SOURCE_PATH)
+
+
+# Function to load the summary, rebuilding it when it is missing or older than the source CSV
+def load_summary(path=SUMMARY_PATH):
+    if not os.path.exists(path) or os.path.getmtime(path) < source_mtime():
+        return write_summary(path)
+
+    return joblib.load(path)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    write_summary()
+    print(f"EDA summary written to {SUMMARY_PATH} in {time.perf_counter() - start:.1f}s")
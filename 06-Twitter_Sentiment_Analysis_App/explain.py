@@ -0,0 +1,152 @@
+# Load ML Packages
+import numpy as np
+import xgboost as xgb
+from xgb_inference import best_iteration_range
+
+import argparse
+import json
+import threading
+from collections import OrderedDict
+
+# NOTE: Per-tweet explanations from the XGBoost booster (SHAP values via pred_contribs)
+# Contributions are in log-odds of the negative class (positive = pushes towards negative). They are computed
+# for whole batches of cleaned tweets (in small row chunks, since pred_contribs returns one dense row per
+# tweet) and cached by cleaned text, so the Streamlit page, batch exports and repeated tweets reuse them.
+# Only n-grams that occur in the tweet are listed; the contribution of all absent n-grams (e.g. the tweet
+# *not* containing "love") is reported as one combined value.
+
+CONTRIBS_CHUNK_SIZE = 32
+
+
+class TweetExplainer:
+
+    def __init__(self, vectorizer, booster, top_n=5, cache_size=10_000):
+        self.vectorizer = vectorizer
+        self.booster = booster
+        self.iteration_range = best_iteration_range(booster)  # Same rounds as the scores
+        self.top_n = top_n
+        self.feature_names = vectorizer.get_feature_names_out()
+
+        # LRU cache of explanations keyed by cleaned text
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Function to check whether a SentimentPipeline can be explained (XGBoost model + vectorizer with n-gram names;
+    # e.g. the streaming models' hashing vectorizer has no vocabulary)
+    @staticmethod
+    def supports(pipeline):
+        model = pipeline.model
+        return (hasattr(model, "booster") or hasattr(model, "get_booster")) and hasattr(pipeline.vectorizer, "vocabulary_")
+
+    # Function to build an explainer from a SentimentPipeline (XGBoostScorer or XGBClassifier model)
+    @classmethod
+    def from_pipeline(cls, pipeline, **kwargs):
+        model = pipeline.model
+        booster = model.booster if hasattr(model, "booster") else model.get_booster()
+        return cls(pipeline.vectorizer, booster, **kwargs)
+
+    # Function to turn one row of contributions into the top contributing n-grams of the tweet
+    def _summarise(self, features_row, contributions):
+        present = features_row.indices
+        present_contributions = contributions[present]
+
+        # Largest absolute contributions first (n-grams the trees never split on contribute exactly 0)
+        order = [i for i in np.argsort(-np.abs(present_contributions))[:self.top_n] if present_contributions[i] != 0]
+        bias = float(contributions[-1])
+        margin = float(contributions.sum())
+
+        return {
+            "top_ngrams": [
+                {"ngram": str(self.feature_names[present[i]]), "contribution": float(present_contributions[i])}
+                for i in order
+            ],
+            "absent_ngrams_contribution": float(contributions[:-1].sum() - present_contributions.sum()),
+            "bias": bias,
+            "margin": margin,
+            "negative_probability": float(1 / (1 + np.exp(-margin))),
+        }
+
+    # Function to compute explanations for cleaned tweets that are not cached yet
+    def _compute(self, cleaned_texts):
+        features = self.vectorizer.transform(cleaned_texts)
+        explanations = []
+
+        for start in range(0, features.shape[0], CONTRIBS_CHUNK_SIZE):
+            chunk = features[start:start + CONTRIBS_CHUNK_SIZE]
+            contributions = self.booster.predict(xgb.DMatrix(chunk), pred_contribs=True, iteration_range=self.iteration_range)
+            explanations.extend(self._summarise(chunk[i], contributions[i]) for i in range(chunk.shape[0]))
+
+        return explanations
+
+    # Function to explain a batch of cleaned tweets (cached by cleaned text)
+    def explain_many(self, cleaned_texts):
+        with self._lock:
+            missing = list(dict.fromkeys(text for text in cleaned_texts if text not in self._cache))
+            self.hits += len(cleaned_texts) - len(missing)
+            self.misses += len(missing)
+
+        computed = dict(zip(missing, self._compute(missing))) if missing else {}
+
+        with self._lock:
+            explanations = []
+            for text in cleaned_texts:
+                # (a cached entry evicted by another thread meanwhile is recomputed)
+                explanation = computed.get(text) or self._cache.get(text) or self._compute([text])[0]
+                self._cache[text] = explanation
+                self._cache.move_to_end(text)
+                explanations.append(explanation)
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return explanations
+
+    # Function to explain one cleaned tweet
+    def explain(self, cleaned_text):
+        return self.explain_many([cleaned_text])[0]
+
+    # Function to get hit / miss statistics of the explanation cache
+    def cache_info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+
+# NOTE: Batch export
+
+# Function to explain a CSV / JSONL file of tweets into another CSV / JSONL file
+def explain_file(input_path, output_path, text_column="text", batch_size=256, top_n=5):
+    from batch_scoring import SCORE_FIELDS, batched, load_pipeline, output_fieldnames, read_records, write_records
+
+    pipeline = load_pipeline()
+    explainer = TweetExplainer.from_pipeline(pipeline, top_n=top_n)
+
+    def explained_records():
+        for batch in batched(read_records(input_path), batch_size):
+            cleaned_texts = pipeline.clean_many(["" if record.get(text_column) is None else str(record.get(text_column)) for record in batch])
+            for record, cleaned_text, explanation in zip(batch, cleaned_texts, explainer.explain_many(cleaned_texts)):
+                yield {
+                    **record,
+                    "cleaned_text": cleaned_text,
+                    "negative_probability": explanation["negative_probability"],
+                    "predicted_sentiment": "negative" if explanation["negative_probability"] >= pipeline.threshold else "non-negative",
+                    "top_ngrams": json.dumps(explanation["top_ngrams"]) if not output_path.endswith(".jsonl") else explanation["top_ngrams"],
+                    "absent_ngrams_contribution": explanation["absent_ngrams_contribution"],
+                }
+
+    write_records(output_path, explained_records(), output_fieldnames(input_path, SCORE_FIELDS + ["top_ngrams", "absent_ngrams_contribution"]))
+
+    return explainer.cache_info()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explain Twitter sentiment predictions (top contributing n-grams) for a file of tweets.")
+    parser.add_argument("input", help="Input file (.csv or .jsonl)")
+    parser.add_argument("output", help="Output file (.csv or .jsonl)")
+    parser.add_argument("--text-column", default="text", help="Column / key with the tweet text (default: text)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Tweets per explanation batch (default: 256)")
+    parser.add_argument("--top-n", type=int, default=5, help="Top contributing n-grams per tweet (default: 5)")
+    args = parser.parse_args()
+
+    print(explain_file(args.input, args.output, args.text_column, args.batch_size, args.top_n))
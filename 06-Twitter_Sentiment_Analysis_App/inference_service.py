@@ -0,0 +1,221 @@
+# Load Service Packages
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+# Load Sentiment Pipeline (same vectorizer + model as batch scoring) & Sentiment Engine
+from batch_scoring import load_pipeline
+from sentiment_engine import SentimentEngine, XGBoostBackend
+
+# NOTE: HTTP inference service for the Twitter sentiment model (standard library only)
+# Every request thread puts its tweets on a queue; one batcher thread collects them into micro-batches of up
+# to max_batch_size tweets (waiting at most max_wait_ms for more to arrive) and scores them with one call to
+# the sentiment engine's model backend (cleaned texts cached by the engine). Latency / throughput / batch size metrics are served at /metrics.
+#
+#   POST /predict   {"text": "..."} or {"texts": ["...", ...]}
+#   GET  /metrics   service metrics
+#   GET  /health    liveness check
+
+MAX_BATCH_SIZE = 64
+MAX_WAIT_MS = 5.0
+
+
+class ServiceMetrics:
+
+    def __init__(self, window=10_000):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.tweets = 0
+        self.batches = 0
+        self.errors = 0
+
+        # Recent request latencies (ms) and batch sizes
+        self.latencies_ms = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+
+    # Function to record one finished request
+    def record_request(self, n_tweets, latency_ms, error=False):
+        with self._lock:
+            self.requests += 1
+            self.tweets += n_tweets
+            self.errors += int(error)
+            self.latencies_ms.append(latency_ms)
+
+    # Function to record one predicted batch
+    def record_batch(self, size):
+        with self._lock:
+            self.batches += 1
+            self.batch_sizes.append(size)
+
+    # Function to summarise the metrics
+    def snapshot(self):
+        with self._lock:
+            uptime = time.time() - self.started
+            latencies = np.array(self.latencies_ms) if self.latencies_ms else np.zeros(1)
+            batch_sizes = np.array(self.batch_sizes) if self.batch_sizes else np.zeros(1)
+
+            return {
+                "uptime_s": round(uptime, 1),
+                "requests": self.requests,
+                "tweets": self.tweets,
+                "errors": self.errors,
+                "batches": self.batches,
+                "tweets_per_second": round(self.tweets / max(uptime, 1e-9), 1),
+                "latency_ms": {f"p{p}": round(float(np.percentile(latencies, p)), 3) for p in (50, 90, 99)},
+                "batch_size": {"mean": round(float(batch_sizes.mean()), 2), "max": int(batch_sizes.max())},
+            }
+
+
+class MicroBatcher:
+
+    def __init__(self, pipeline, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS, metrics=None):
+        self.pipeline = pipeline
+        self.engine = SentimentEngine([XGBoostBackend(pipeline)])
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self.metrics = metrics or ServiceMetrics()
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    # Function to submit one tweet, returns a Future of (cleaned text, negative probability)
+    def submit(self, text):
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    # Function to score tweets through the batcher (blocks until their batch is predicted)
+    def score(self, texts):
+        return [future.result() for future in [self.submit(text) for text in texts]]
+
+    # Function to collect the next micro-batch: wait for one tweet, then up to max_wait for more
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_s
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                # One vectorize + predict call per micro-batch
+                cleaned_texts, negative_probabilities, _ = self.engine.predict(texts)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.metrics.record_batch(len(batch))
+            for (_, future), cleaned_text, probability in zip(batch, cleaned_texts, negative_probabilities):
+                future.set_result((cleaned_text, float(probability)))
+
+
+# Function to build the HTTP request handler around a micro-batcher
+def make_handler(batcher):
+    pipeline = batcher.pipeline
+    metrics = batcher.metrics
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            elif self.path == "/metrics":
+                self._send_json(200, metrics.snapshot())
+            else:
+                self._send_json(404, {"error": "Not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send_json(404, {"error": "Not found"})
+                return
+
+            start = time.perf_counter()
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                texts = payload["texts"] if "texts" in payload else [payload["text"]]
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise ValueError("'text' must be a string and 'texts' a list of strings.")
+                threshold = float(payload.get("threshold", pipeline.threshold))
+            except (ValueError, KeyError, TypeError) as e:
+                metrics.record_request(0, (time.perf_counter() - start) * 1000, error=True)
+                self._send_json(400, {"error": f"Invalid request: {e}"})
+                return
+
+            try:
+                scores = batcher.score(texts)
+            except Exception as e:
+                # Model / featurisation failures surface through the batch futures
+                metrics.record_request(len(texts), (time.perf_counter() - start) * 1000, error=True)
+                self._send_json(500, {"error": f"Prediction failed: {e}"})
+                return
+
+            results = [
+                {
+                    "cleaned_text": cleaned_text,
+                    "negative_probability": probability,
+                    "predicted_sentiment": "negative" if probability >= threshold else "non-negative",
+                }
+                for cleaned_text, probability in scores
+            ]
+
+            metrics.record_request(len(texts), (time.perf_counter() - start) * 1000)
+            self._send_json(200, {"results": results} if "texts" in payload else results[0])
+
+        # Keep the console quiet under load (metrics are served at /metrics)
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+# Function to start the service (blocks until interrupted)
+def serve(host="127.0.0.1", port=8000, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS):
+    batcher = MicroBatcher(load_pipeline(), max_batch_size, max_wait_ms)
+    server = ThreadingHTTPServer((host, port), make_handler(batcher))
+
+    print(f"Serving on http://{host}:{port} (max batch size {max_batch_size}, max wait {max_wait_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP inference service for the Twitter sentiment model.")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE, help=f"Tweets per micro-batch (default: {MAX_BATCH_SIZE})")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help=f"Max wait to fill a micro-batch (default: {MAX_WAIT_MS})")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.max_batch_size, args.max_wait_ms)
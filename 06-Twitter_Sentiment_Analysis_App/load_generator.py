@@ -0,0 +1,74 @@
+# Load Load-Testing Packages
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+# Load Data Store
+import data_store
+
+# NOTE: Load generator for the inference service (python inference_service.py)
+# Concurrent clients send single-tweet requests (sampled from Tweets.csv) for a fixed duration, then the
+# client-side latency percentiles / throughput and the service's own /metrics are printed.
+
+
+# Function to send one JSON request and return the decoded response
+def _request(url, payload=None, timeout=30):
+    data = None if payload is None else json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+# Function to run concurrent clients against the service for a number of seconds
+def run_load(url="http://127.0.0.1:8000", clients=16, duration_s=10.0, seed=36):
+    tweets = data_store.load_dataset("tweets")["text"].tolist()
+    latencies_ms, errors = [], 0
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration_s
+
+    def client(client_id):
+        nonlocal errors
+        rng = random.Random(seed + client_id)
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                _request(url + "/predict", {"text": rng.choice(tweets)})
+                latency = (time.perf_counter() - start) * 1000
+                with lock:
+                    latencies_ms.append(latency)
+            except Exception:
+                with lock:
+                    errors += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies_ms) if latencies_ms else np.zeros(1)
+    return {
+        "clients": clients,
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "requests_per_second": round(len(latencies_ms) / elapsed, 1),
+        "latency_ms": {f"p{p}": round(float(np.percentile(latencies, p)), 3) for p in (50, 90, 99)},
+        "service_metrics": _request(url + "/metrics"),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the Twitter sentiment inference service.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Service base URL (default: http://127.0.0.1:8000)")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients (default: 16)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds (default: 10)")
+    args = parser.parse_args()
+
+    print(json.dumps(run_load(args.url, args.clients, args.duration), indent=2))
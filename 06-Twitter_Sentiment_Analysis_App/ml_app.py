@@ -1,109 +1,55 @@
 import streamlit as st
 
 # Load ML Packages
-import joblib
-import os
-import requests
-from io import BytesIO
+import model_store
 
 # Load EDA Packages
 import numpy as np
 import pandas as pd
 
 # Load Data Preprocessing Packages
-import re
-import string
-from nltk.corpus import stopwords
-from nltk.stem.porter import PorterStemmer
 import nltk
+from pipeline import SentimentPipeline
+from xgb_inference import load_inference_config, make_scorer, serving_files
+from explain import TweetExplainer
+from sentiment_engine import SentimentEngine, XGBoostBackend
+
+# Load Data Viz Packages
+import plotly.express as px
 
 # Load utils 
 from utils import show_banner, expander_formatter
-import time
 
-# NOTE: Function to Load ML MOdels
+# NOTE: Function to Load ML MOdels (local model folder first, GitHub download only as a fallback)
 @st.cache_resource
-def load_model(model_file):
-    response = requests.get(model_file)
-    loaded_model = joblib.load(BytesIO(response.content))
-    return loaded_model
+def load_model(model_file, mmap_mode=None):
+    return model_store.load_model(model_file, mmap_mode=mmap_mode)
 
 # Download stopwords from nltk
 nltk.download("stopwords")
 
-# URL from github
-url_vec = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/06-Twitter_Sentiment_Analysis_App/model/20250322_TFIDFVectorizer.pkl"
-url_model = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/06-Twitter_Sentiment_Analysis_App/model/20250322_Tuned_XGBoost_Model.pkl"
-
-# Function to preprocess the input text
-def preprocess_text(text):
-
-    # Emoticons Handling
-    # Define positive and negative emoticons
-    positive_emoticons = {":)", ":D", "XD", ":-)", "=)", ":-D", "(:", "(-:", ": D", ";D", ";-D", "(;", "(-;", "<3", "^-^", "^_^", "=D" }
-    negative_emoticons = {":(", ":-(", ":**-(", ":@", ":-@", ":\\", ":-\\", ":,(", ":'(" }
-
-    for emo in positive_emoticons:
-        text = re.sub(re.escape(emo), "emo_happy", text)
-    for emo in negative_emoticons:
-        text = re.sub(re.escape(emo), "emo_sad", text)
-
-    # Convert Text to Lowercase
-    text = " ".join(word.lower() for word in text.split())
-
-    # Conversion of Common Abbreviations
-    # Common abbreviations
-    abbreviation_dict = {
-        "lol": "laughing out loud",
-        "omg": "oh my god",
-        "jk": "just kidding",
-        "lmao": "laughing my ass off",
-        "idk": "i don't know",
-        "brb": "be right back",
-        "btw": "by the way",
-        "ttyl": "talk to you later",
-        "imo": "in my opinion",
-        "tbh": "to be honest",
-        "u": "you",
-        "tks": "thanks",
-        "thnx": "thanks",
-        "thks": "thanks"
-    }
-    text = " ".join([abbreviation_dict[word.lower()] if word.lower() in abbreviation_dict else word for word in text.split()])
-
-    # Reduction of Repetitive Letters
-    text = re.sub(r'(.)\1{2,}', r'\1\1', text)
-
-    # Removing Noise (URL, Punctuations, Hashtags, Mentions, etc.)
-    text = re.sub(r"http\S+|www\S+", "", text)  # Remove URLs
-    text = re.sub(r"@\w+", "", text)  # Remove mentions (@user)
-    text = re.sub(r"#\w+", "", text)  # Remove hashtags (#topic)
-
-    punctuation_to_remove = string.punctuation.replace("!", "").replace("?", "")  # Remove all punctuation except ! and ?
-    text = text.translate(str.maketrans('', '', punctuation_to_remove))
-
-    text = re.sub(r'\.{2,}', '.', text)  # Replace multiple dots ".." or "..." with a single dot
-    text = re.sub(r'\s+', ' ', text).strip()  # Replace multiple spaces with a single space
-
-    # Stopwords Removal
-    stop_words = set(stopwords.words('english')) - {"not", "no", "never", "don't", "won't", "isn't", "wasn't", "but", "although", "why", "how", "what", "who", "where", "when"}
-    text = " ".join([word for word in text.split() if word not in stop_words])
-
-    # Tokenization
-    text = text.split()
-
-    # Stemming
-    stemmer = PorterStemmer()
-    text = [stemmer.stem(word) for word in text]
-
-    # Join the stemmed text into a string
-    text = " ".join(text)
-
-    # Vectorization
-    vectorizer = load_model(url_vec)
-    text_vec = vectorizer.transform([text])
-
-    return text, text_vec
+# Model files in the model folder (newest tuned model from tune_model.py, or the model named by the
+# TWEET_SENTIMENT_MODEL environment variable, e.g. a streaming model; each with the vectorizer it was trained with)
+model_file, vec_file = serving_files()
+
+# NOTE: Function to Load the Sentiment Pipeline (built once per process)
+@st.cache_resource
+def load_pipeline():
+    # The vectorizer's IDF weights are memory-mapped instead of copied into memory; the model is scored with its
+    # native booster on a single thread (one tweet per request) at the threshold stored alongside the model
+    model = make_scorer(load_model(model_file), model_file, n_jobs=1)
+    return SentimentPipeline(load_model(vec_file, mmap_mode="r"), model, threshold=load_inference_config(model_file)["threshold"])
+
+# NOTE: Function to Load the Explainer (explanations cached by cleaned tweet, None when the model has no n-gram explanations)
+@st.cache_resource
+def load_explainer():
+    pipeline = load_pipeline()
+    return TweetExplainer.from_pipeline(pipeline) if TweetExplainer.supports(pipeline) else None
+
+# NOTE: Function to Load the Sentiment Engine (tweet model + VADER + TextBlob, cleaned texts cached by raw tweet)
+@st.cache_resource
+def load_engine():
+    return SentimentEngine([XGBoostBackend(load_pipeline()), "vader", "textblob"])
 
 # NOTE: ML Page
 def ml_page():
@@ -145,30 +91,35 @@ def ml_page():
     # Actions After Click Check Tweet Sentiment Button
     if submit_info and len(input_text) > 0:
         
-        # Add spinner
-        with st.spinner("Checking for tweet sentiment...", show_time=True):
-            time.sleep(2)
-            st.toast("Sentiment analysis complete!", icon="✅")
+        engine = load_engine()
+
+        # Progress bar driven by the actual engine stages
+        progress_bar = st.progress(0.0, text="Cleaning tweet...")
+
+        # Processed Input for ML (cleaned once into the engine's cache, shared by all backends)
+        text_no_vec = engine.clean_many([input_text])["model"][0]
+
+        progress_bar.progress(0.4, text="Vectorizing & predicting tweet sentiment...")
+        _, is_negative = engine.backends["xgboost"].score_batch([text_no_vec])
+
+        progress_bar.progress(0.8, text="Scoring with VADER & TextBlob...")
+        lexicon_results = engine.score([input_text], ["vader", "textblob"])
+
+        prediction = int(is_negative[0])
+
+        progress_bar.empty()
+        st.toast("Sentiment analysis complete!", icon="✅")
 
         expander_formatter(16)
 
         st.subheader("Tweet Sentiment Breakdown 🗣️")
 
-        # Processed Input for ML
-        text_no_vec, single_sample = preprocess_text(input_text)
-
         with st.expander("Cleaned Tweet for Prediction"):
             st.write("Your tweet, prepped for analysis:")
             st.info(text_no_vec)
 
         # Prediction Result
         with st.expander("Final Sentiment Prediction"):
-
-            model = load_model(url_model)
-
-            pred_prob = model.predict_proba(single_sample)[0][1]
-
-            prediction = (pred_prob >= 0.3).astype(int)
             
             if prediction == 1:
                 st.error("🙁 Hmm... this tweet sounds a bit negative.")
@@ -176,6 +127,37 @@ def ml_page():
             else:
                 st.success("😄 This tweet seems non-negative!")
                 st.write("ℹ️It's either positive or neutral in tone — nothing too harsh here.")
+
+        # Lexicon-based models on the same tweet (negative / non-negative, like the ML model)
+        with st.expander("Lexicon Models (VADER & TextBlob)"):
+            lexicon_df = pd.DataFrame({
+                "Model": ["VADER (compound)", "TextBlob (polarity)"],
+                "Score": [lexicon_results["vader_score"][0], lexicon_results["textblob_score"][0]],
+                "Sentiment": [lexicon_results["vader_label"][0], lexicon_results["textblob_label"][0]],
+            })
+            st.dataframe(lexicon_df, hide_index=True, use_container_width=True)
+
+        # Explanation (top contributing n-grams)
+        explainer = load_explainer()
+        with st.expander("Why This Prediction?"):
+            if explainer is None:
+                st.info("Explanations are only available for XGBoost models with a TF-IDF vocabulary.")
+            else:
+                explanation = explainer.explain(text_no_vec)
+
+                if explanation["top_ngrams"]:
+                    contrib_df = pd.DataFrame(explanation["top_ngrams"])
+                    contrib_df["direction"] = np.where(contrib_df["contribution"] > 0, "towards negative", "towards non-negative")
+
+                    p1 = px.bar(contrib_df, x="contribution", y="ngram", color="direction", orientation="h",
+                                color_discrete_map={"towards negative": "#FF6961", "towards non-negative": "#ADD8E6"})
+                    p1.update_layout(yaxis={"categoryorder": "total ascending"})
+                    st.plotly_chart(p1, use_container_width=True)
+                else:
+                    st.info("None of the words in this tweet are used by the model.")
+
+                st.caption(f"Contributions are in log-odds of a negative tweet. Words not in the tweet contribute "
+                           f"{explanation['absent_ngrams_contribution']:+.3f} in total.")
     
     elif submit_info and len(input_text) == 0:
         st.error("⚠️ Please enter a tweet before checking its sentiment.")
\ No newline at end of file
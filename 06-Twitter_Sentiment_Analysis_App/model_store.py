@@ -0,0 +1,128 @@
+# Load ML Packages
+import joblib
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+import requests
+
+# NOTE: Model store
+# Models are loaded from the local model folder first. Files are verified against the SHA-256 checksums in
+# checksums.json; if a file is missing or does not match, it is downloaded from GitHub (with a timeout) into
+# an on-disk cache and verified again. Array-heavy artifacts can be memory-mapped with joblib's mmap_mode.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.join(APP_DIR, "model")
+CACHE_DIR = os.path.join(APP_DIR, ".model_cache")
+CHECKSUM_FILE = os.path.join(MODEL_DIR, "checksums.json")
+
+REMOTE_BASE_URL = "https://raw.githubusercontent.com/WeiZhenLim/MachineLearning_DeepLearning_Projects/main/06-Twitter_Sentiment_Analysis_App/model/"
+
+
+class ModelStoreError(Exception):
+    pass
+
+
+# Function to compute the SHA-256 checksum of a file
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+# Function to read the expected checksums of the model files
+def load_checksums():
+    if not os.path.exists(CHECKSUM_FILE):
+        return {}
+    with open(CHECKSUM_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Function to record the checksum of a (newly written) model file
+def register_model(path):
+    checksums = load_checksums()
+    checksums[os.path.basename(path)] = file_sha256(path)
+
+    with open(CHECKSUM_FILE, "w", encoding="utf-8") as f:
+        json.dump(checksums, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+# Function to find the newest dated model file ("YYYYMMDD_<suffix>") in the model folder, e.g. after retraining
+def latest_model(suffix, default=None):
+    dated = [name for name in os.listdir(MODEL_DIR) if re.fullmatch(r"\d{8}_" + re.escape(suffix), name)]
+    return max(dated) if dated else default
+
+
+# Function to check a file against its expected checksum (files without a recorded checksum are accepted)
+def _is_valid(path, expected_sha256):
+    if not os.path.exists(path):
+        return False
+    if expected_sha256 is None:
+        return True
+    return file_sha256(path) == expected_sha256
+
+
+# Function to download a model file into the on-disk cache
+def _download(file_name, expected_sha256, timeout):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_path = os.path.join(CACHE_DIR, file_name)
+
+    response = requests.get(REMOTE_BASE_URL + file_name, timeout=timeout, stream=True)
+    response.raise_for_status()
+
+    # Write to a temp file and rename, so a failed download never leaves a half-written cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+
+        if not _is_valid(tmp_path, expected_sha256):
+            raise ModelStoreError(f"Checksum mismatch for downloaded model '{file_name}'.")
+
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return cache_path
+
+
+# Function to find a verified copy of a model file (local folder -> cache -> remote download)
+def resolve_model_path(file_name, remote_fallback=True, timeout=10):
+    expected_sha256 = load_checksums().get(file_name)
+
+    local_path = os.path.join(MODEL_DIR, file_name)
+    if _is_valid(local_path, expected_sha256):
+        return local_path, "local"
+
+    cache_path = os.path.join(CACHE_DIR, file_name)
+    if _is_valid(cache_path, expected_sha256):
+        return cache_path, "cache"
+
+    if not remote_fallback:
+        raise ModelStoreError(f"Model '{file_name}' not found (or checksum mismatch) in {MODEL_DIR}.")
+
+    try:
+        return _download(file_name, expected_sha256, timeout), "remote"
+    except requests.RequestException as e:
+        raise ModelStoreError(f"Model '{file_name}' is not available locally and the download failed: {e}")
+
+
+# Function to load a model file, memory-mapping its numpy arrays when mmap_mode is given (e.g. "r")
+def load_model(file_name, mmap_mode=None, remote_fallback=True, timeout=10):
+    start = time.perf_counter()
+
+    path, source = resolve_model_path(file_name, remote_fallback, timeout)
+    model = joblib.load(path, mmap_mode=mmap_mode)
+
+    print(f"Loaded model '{file_name}' from {source} in {time.perf_counter() - start:.2f}s")
+
+    return model
@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+# Load Preprocessing Pipeline
+from preprocessing import TweetPreprocessor
+
+# NOTE: Shared tweet sentiment pipeline (cleaning -> featurisation -> prediction)
+# Cleaning is pure text processing and is cached by raw tweet; featurisation and prediction work on whole
+# batches, so the Streamlit page (batch of one), batch scoring and other services all go through the same stages.
+
+# Default decision threshold on the probability of the negative class (models can store their own, see xgb_inference.py)
+THRESHOLD = 0.3
+
+
+class SentimentPipeline:
+
+    def __init__(self, vectorizer, model=None, preprocessor=None, clean_cache_size=100_000, threshold=None):
+        self.vectorizer = vectorizer
+        self.model = model
+        self.preprocessor = preprocessor or TweetPreprocessor()
+
+        # Decision threshold: given explicitly, stored with the model (XGBoostScorer) or the default
+        self.threshold = threshold if threshold is not None else getattr(model, "threshold", THRESHOLD)
+
+        # Cache of cleaned text keyed by raw tweet
+        self._clean_cached = lru_cache(maxsize=clean_cache_size)(self.preprocessor.clean)
+
+    # NOTE: Cleaning Stage
+
+    # Function to clean one raw tweet (cached)
+    def clean(self, text):
+        return self._clean_cached(text)
+
+    # Function to clean many raw tweets (cached per tweet)
+    def clean_many(self, texts):
+        return [self._clean_cached(text) for text in texts]
+
+    # Function to get hit / miss statistics of the cleaned text cache
+    def cache_info(self):
+        return self._clean_cached.cache_info()
+
+    # NOTE: Featurisation Stage
+
+    # Function to vectorize a batch of cleaned tweets into one sparse matrix
+    def featurize(self, cleaned_texts):
+        return self.vectorizer.transform(cleaned_texts)
+
+    # NOTE: Prediction Stage
+
+    # Function to get the probability of the negative class for a feature matrix
+    def predict_negative_proba(self, features):
+        # Native booster path (XGBoostScorer), otherwise any sklearn-API classifier
+        if hasattr(self.model, "predict_negative_proba"):
+            return self.model.predict_negative_proba(features)
+        return self.model.predict_proba(features)[:, 1]
+
+    # Function to clean, vectorize and score a batch of raw tweets
+    def score(self, texts, threshold=None):
+        threshold = self.threshold if threshold is None else threshold
+        cleaned_texts = self.clean_many(texts)
+        negative_probabilities = self.predict_negative_proba(self.featurize(cleaned_texts))
+
+        return cleaned_texts, negative_probabilities, negative_probabilities >= threshold
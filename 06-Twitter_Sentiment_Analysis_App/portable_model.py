@@ -0,0 +1,227 @@
+# Load ML Packages
+import model_store
+import numpy as np
+import scipy.sparse as sp
+import xgboost as xgb
+
+import json
+import os
+import re
+
+# Load XGBoost Inference Helpers
+from xgb_inference import best_iteration_range, load_inference_config
+
+# NOTE: Portable TF-IDF + XGBoost inference format
+# The exporter writes the fitted TfidfVectorizer as plain arrays (vocabulary terms + IDF weights in one .npz)
+# and the XGBoost model in its own JSON / UBJ format, plus a small JSON manifest with the tokenizer settings
+# and decision threshold. PortableScorer rebuilds the same TF-IDF features with numpy / scipy and scores them
+# with a bare xgboost Booster, so inference no longer unpickles sklearn object graphs.
+
+VECTORIZER_FILE = "20250322_TFIDFVectorizer.pkl"
+MODEL_FILE = "20250322_Tuned_XGBoost_Model.pkl"
+MANIFEST_FILE = "20250322_Portable_Pipeline.json"
+
+
+# Function to check that a vectorizer only uses settings the portable scorer reproduces
+def _check_vectorizer(vectorizer):
+    params = vectorizer.get_params()
+
+    if params["analyzer"] != "word" or params["tokenizer"] or params["preprocessor"] or params["stop_words"] or params["strip_accents"]:
+        raise ValueError("Only word n-gram vectorizers with the default tokenizer / preprocessor can be exported.")
+    if not params["use_idf"] or params["binary"] or params["norm"] not in ("l1", "l2", None):
+        raise ValueError("Only TF-IDF vectorizers (use_idf=True, binary=False, norm l1 / l2 / None) can be exported.")
+
+
+# Function to get the tokenizer / weighting settings of a vectorizer, as stored in the manifest
+def _vectorizer_settings(vectorizer):
+    params = vectorizer.get_params()
+    return {
+        "lowercase": params["lowercase"],
+        "token_pattern": params["token_pattern"],
+        "ngram_range": list(params["ngram_range"]),
+        "norm": params["norm"],
+        "sublinear_tf": params["sublinear_tf"],
+    }
+
+
+# Function to export the pickled vectorizer + model into the portable format (files are registered in checksums.json)
+def export_pipeline(vectorizer_file=VECTORIZER_FILE, model_file=MODEL_FILE, manifest_file=MANIFEST_FILE, model_format="ubj"):
+    vectorizer = model_store.load_model(vectorizer_file)
+    model = model_store.load_model(model_file)
+    _check_vectorizer(vectorizer)
+
+    # Vocabulary as one newline-joined UTF-8 buffer ordered by feature index (terms never contain newlines)
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    arrays_file = os.path.splitext(vectorizer_file)[0] + ".npz"
+    arrays_path = os.path.join(model_store.MODEL_DIR, arrays_file)
+    np.savez_compressed(arrays_path, terms=np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8), idf=vectorizer.idf_)
+
+    booster_file = os.path.splitext(model_file)[0] + "." + model_format
+    booster_path = os.path.join(model_store.MODEL_DIR, booster_file)
+    model.get_booster().save_model(booster_path)
+
+    manifest = {
+        "vectorizer": {"arrays": arrays_file, **_vectorizer_settings(vectorizer)},
+        "model": booster_file,
+        "threshold": load_inference_config(model_file)["threshold"],
+    }
+
+    manifest_path = os.path.join(model_store.MODEL_DIR, manifest_file)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    for path in [arrays_path, booster_path, manifest_path]:
+        model_store.register_model(path)
+
+    return manifest
+
+
+class PortableScorer:
+
+    def __init__(self, terms, idf, booster, lowercase=True, token_pattern=r"(?u)\b\w\w+\b", ngram_range=(1, 2),
+                 norm="l2", sublinear_tf=False, threshold=0.3):
+        self.vocabulary = dict(zip(terms, range(len(terms))))
+        self.idf = idf
+        self.booster = booster
+        self.iteration_range = best_iteration_range(booster)  # Same rounds as predict_proba for early-stopped models
+        self.lowercase = lowercase
+        self.token_pattern = re.compile(token_pattern)
+        self.ngram_range = tuple(ngram_range)
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+        self.threshold = threshold
+
+    # Function to load an exported pipeline from its manifest (verified through the model store)
+    @classmethod
+    def load(cls, manifest_file=MANIFEST_FILE, n_jobs=None):
+        manifest_path, _ = model_store.resolve_model_path(manifest_file)
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        settings = dict(manifest["vectorizer"])
+        arrays_path, _ = model_store.resolve_model_path(settings.pop("arrays"))
+        with np.load(arrays_path) as arrays:
+            terms = arrays["terms"].tobytes().decode("utf-8").split("\n")
+            idf = arrays["idf"]
+
+        booster_path, _ = model_store.resolve_model_path(manifest["model"])
+        booster = xgb.Booster(model_file=booster_path)
+        booster.set_param({"nthread": n_jobs or os.cpu_count() or 1})
+
+        return cls(terms, idf, booster, threshold=manifest["threshold"], **settings)
+
+    # Function to build a scorer straight from a fitted vectorizer and booster (e.g. to check parity before exporting)
+    @classmethod
+    def from_vectorizer(cls, vectorizer, booster, threshold=0.3):
+        _check_vectorizer(vectorizer)
+        terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+        return cls(terms, vectorizer.idf_, booster, threshold=threshold, **_vectorizer_settings(vectorizer))
+
+    # Function to split a cleaned tweet into the vectorizer's word n-grams
+    def _ngrams(self, text):
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_pattern.findall(text)
+
+        min_n, max_n = self.ngram_range
+        grams = list(tokens) if min_n == 1 else []  # A copy: tokens is still read for the longer n-grams
+        for n in range(max(min_n, 2), max_n + 1):
+            grams += [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+
+        return grams
+
+    # Function to vectorize a batch of cleaned tweets into the same TF-IDF matrix as the pickled vectorizer
+    def featurize(self, cleaned_texts):
+        vocabulary = self.vocabulary
+        indices, counts, indptr = [], [], [0]
+
+        for text in cleaned_texts:
+            row = {}
+            for gram in self._ngrams(text):
+                j = vocabulary.get(gram)
+                if j is not None:
+                    row[j] = row.get(j, 0) + 1
+            indices.extend(row)
+            counts.extend(row.values())
+            indptr.append(len(indices))
+
+        features = sp.csr_matrix((np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+                                 shape=(len(indptr) - 1, len(self.idf)))
+        features.sort_indices()
+
+        if self.sublinear_tf:
+            np.log(features.data, features.data)
+            features.data += 1
+        features.data *= self.idf[features.indices]
+
+        if self.norm is not None:
+            if self.norm == "l1":
+                norms = np.asarray(abs(features).sum(axis=1)).ravel()
+            else:
+                norms = np.sqrt(np.asarray(features.multiply(features).sum(axis=1)).ravel())
+            norms[norms == 0] = 1  # Empty rows stay all-zero
+            features.data /= np.repeat(norms, np.diff(features.indptr))
+
+        return features
+
+    # Function to get the probability of the negative class for a feature matrix
+    def predict_negative_proba(self, features):
+        return self.booster.inplace_predict(features, iteration_range=self.iteration_range, validate_features=False)
+
+    # Function to vectorize and score a batch of cleaned tweets
+    def score(self, cleaned_texts, threshold=None):
+        threshold = self.threshold if threshold is None else threshold
+        negative_probabilities = self.predict_negative_proba(self.featurize(cleaned_texts))
+        return negative_probabilities, negative_probabilities >= threshold
+
+
+# NOTE: Parity check against the pickled pipeline
+
+# Function to compare features and probabilities of the portable scorer with the pickled vectorizer + model
+def check_parity(n_tweets=None):
+    import time
+    import data_store
+
+    cleaned_texts = data_store.load_dataset("tweets_processed")["stemmed_text"].tolist()[:n_tweets]
+
+    start = time.perf_counter()
+    vectorizer = model_store.load_model(VECTORIZER_FILE)
+    model = model_store.load_model(MODEL_FILE)
+    pickled_load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer = PortableScorer.load()
+    portable_load_s = time.perf_counter() - start
+
+    expected_features = vectorizer.transform(cleaned_texts)
+    actual_features = scorer.featurize(cleaned_texts)
+    feature_diff = abs(expected_features - actual_features).max() if expected_features.nnz else 0.0
+
+    expected = model.predict_proba(expected_features)[:, 1]
+    actual = scorer.predict_negative_proba(actual_features)
+
+    return {
+        "tweets": len(cleaned_texts),
+        "max_feature_diff": float(feature_diff),
+        "max_probability_diff": float(np.abs(expected - actual).max()),
+        "label_mismatches": int(((expected >= scorer.threshold) != (actual >= scorer.threshold)).sum()),
+        "pickled_load_s": pickled_load_s,
+        "portable_load_s": portable_load_s,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the TF-IDF + XGBoost pipeline to the portable format and check parity.")
+    parser.add_argument("--format", choices=["ubj", "json"], default="ubj", help="XGBoost model format (default: ubj)")
+    parser.add_argument("--skip-export", action="store_true", help="Only run the parity check on the existing export")
+    args = parser.parse_args()
+
+    if not args.skip_export:
+        manifest = export_pipeline(model_format=args.format)
+        print(f"Exported {manifest['vectorizer']['arrays']} and {manifest['model']} ({MANIFEST_FILE})")
+
+    for key, value in check_parity().items():
+        print(f"{key:>22}: {value}")
@@ -0,0 +1,168 @@
+# Load Data Preprocessing Packages
+import re
+import string
+from functools import lru_cache
+
+import nltk
+from nltk.corpus import stopwords
+from nltk.stem.porter import PorterStemmer
+
+# NOTE: Tweet preprocessing pipeline (same steps as the training notebook)
+# All tables and regexes are built once at import / construction time instead of on every call,
+# and the tweet is split and joined only once.
+
+# Emoticons Handling
+POSITIVE_EMOTICONS = {":)", ":D", "XD", ":-)", "=)", ":-D", "(:", "(-:", ": D", ";D", ";-D", "(;", "(-;", "<3", "^-^", "^_^", "=D" }
+NEGATIVE_EMOTICONS = {":(", ":-(", ":**-(", ":@", ":-@", ":\\", ":-\\", ":,(", ":'(" }
+
+# Common abbreviations
+ABBREVIATIONS = {
+    "lol": "laughing out loud",
+    "omg": "oh my god",
+    "jk": "just kidding",
+    "lmao": "laughing my ass off",
+    "idk": "i don't know",
+    "brb": "be right back",
+    "btw": "by the way",
+    "ttyl": "talk to you later",
+    "imo": "in my opinion",
+    "tbh": "to be honest",
+    "u": "you",
+    "tks": "thanks",
+    "thnx": "thanks",
+    "thks": "thanks"
+}
+
+# Stopwords that carry sentiment / meaning and are kept
+KEEP_WORDS = {"not", "no", "never", "don't", "won't", "isn't", "wasn't", "but", "although", "why", "how", "what", "who", "where", "when"}
+
+# Function to compile a set of literal strings into one alternation (longest first)
+def _compile_alternation(literals):
+    return re.compile("|".join(re.escape(literal) for literal in sorted(literals, key=len, reverse=True)))
+
+# One combined pattern per polarity (positive emoticons are replaced before negative ones, as in training)
+POSITIVE_PATTERN = _compile_alternation(POSITIVE_EMOTICONS)
+NEGATIVE_PATTERN = _compile_alternation(NEGATIVE_EMOTICONS)
+
+REPEATED_LETTERS_PATTERN = re.compile(r'(.)\1{2,}')  # Reduction of Repetitive Letters
+URL_PATTERN = re.compile(r"http\S+|www\S+")  # URLs
+MENTION_HASHTAG_PATTERN = re.compile(r"@\w+|#\w+")  # Mentions (@user) and hashtags (#topic)
+
+# Remove all punctuation except ! and ? (this also removes ".", so multiple dots never survive)
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation.replace("!", "").replace("?", ""))
+
+
+class TweetPreprocessor:
+
+    def __init__(self, stem_cache_size=100_000):
+        # Stopwords Removal
+        try:
+            english_stopwords = stopwords.words('english')
+        except LookupError:
+            nltk.download("stopwords", quiet=True)
+            english_stopwords = stopwords.words('english')
+
+        self.stop_words = frozenset(english_stopwords) - KEEP_WORDS
+
+        # Stemming (memoised, tweets repeat the same words a lot)
+        self.stem = lru_cache(maxsize=stem_cache_size)(PorterStemmer().stem)
+
+    # Function to clean one tweet into the stemmed text the vectorizer was trained on
+    def clean(self, text):
+        # Emoticons Handling
+        text = POSITIVE_PATTERN.sub("emo_happy", text)
+        text = NEGATIVE_PATTERN.sub("emo_sad", text)
+
+        # Convert Text to Lowercase & Conversion of Common Abbreviations
+        text = " ".join([ABBREVIATIONS.get(word, word) for word in text.lower().split()])
+
+        # Reduction of Repetitive Letters
+        text = REPEATED_LETTERS_PATTERN.sub(r'\1\1', text)
+
+        # Removing Noise (URL, Punctuations, Hashtags, Mentions, etc.)
+        text = URL_PATTERN.sub("", text)
+        text = MENTION_HASHTAG_PATTERN.sub("", text)
+        text = text.translate(PUNCTUATION_TABLE)
+
+        # Stopwords Removal, Tokenization & Stemming
+        stem = self.stem
+        stop_words = self.stop_words
+        return " ".join([stem(word) for word in text.split() if word not in stop_words])
+
+    # Function to clean many tweets
+    def clean_many(self, texts):
+        return [self.clean(text) for text in texts]
+
+
+# NOTE: Verification & Benchmark
+
+# Original per-call implementation, kept only to verify that the pipeline output is identical
+def _reference_clean(text):
+    positive_emoticons = {":)", ":D", "XD", ":-)", "=)", ":-D", "(:", "(-:", ": D", ";D", ";-D", "(;", "(-;", "<3", "^-^", "^_^", "=D" }
+    negative_emoticons = {":(", ":-(", ":**-(", ":@", ":-@", ":\\", ":-\\", ":,(", ":'(" }
+
+    for emo in positive_emoticons:
+        text = re.sub(re.escape(emo), "emo_happy", text)
+    for emo in negative_emoticons:
+        text = re.sub(re.escape(emo), "emo_sad", text)
+
+    text = " ".join(word.lower() for word in text.split())
+    text = " ".join([ABBREVIATIONS[word.lower()] if word.lower() in ABBREVIATIONS else word for word in text.split()])
+    text = re.sub(r'(.)\1{2,}', r'\1\1', text)
+    text = re.sub(r"http\S+|www\S+", "", text)
+    text = re.sub(r"@\w+", "", text)
+    text = re.sub(r"#\w+", "", text)
+    text = text.translate(PUNCTUATION_TABLE)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    stop_words = set(stopwords.words('english')) - KEEP_WORDS
+    text = " ".join([word for word in text.split() if word not in stop_words])
+
+    stemmer = PorterStemmer()
+    return " ".join([stemmer.stem(word) for word in text.split()])
+
+# Function to load the raw tweets used for the golden check / benchmark
+def _load_tweets(path):
+    import pandas as pd
+    return pd.read_csv(path)["text"].dropna().astype(str).tolist()
+
+# Function to check the pipeline against the original implementation on every tweet (returns mismatches)
+def verify_golden(path="data/Tweets.csv"):
+    preprocessor = TweetPreprocessor()
+    mismatches = []
+
+    for text in _load_tweets(path):
+        expected = _reference_clean(text)
+        actual = preprocessor.clean(text)
+        if actual != expected:
+            mismatches.append((text, expected, actual))
+
+    return mismatches
+
+# Function to measure preprocessing throughput in tweets / second
+def benchmark(path="data/Tweets.csv", repeat=3):
+    import time
+
+    tweets = _load_tweets(path)
+    results = {}
+
+    for name, clean in [("reference", _reference_clean), ("pipeline", TweetPreprocessor().clean)]:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for text in tweets:
+                clean(text)
+            best = min(best, time.perf_counter() - start)
+        results[name] = len(tweets) / best
+
+    return results
+
+if __name__ == "__main__":
+    mismatches = verify_golden()
+    print(f"Golden check: {len(mismatches)} mismatches")
+    for text, expected, actual in mismatches[:10]:
+        print(f"  {text!r}\n    expected: {expected!r}\n    actual:   {actual!r}")
+
+    for name, tweets_per_second in benchmark().items():
+        print(f"{name:>10}: {tweets_per_second:,.0f} tweets/second")
@@ -0,0 +1,215 @@
+# Load Sentiment Analysis Packages
+from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Load EDA Packages
+import numpy as np
+import pandas as pd
+
+import html
+import re
+from functools import lru_cache
+
+# Load Sentiment Pipeline & Batching
+from batch_scoring import batched, load_pipeline
+
+# NOTE: Unified sentiment engine (VADER, TextBlob and the TF-IDF + XGBoost tweet model behind one score(texts))
+# Every backend turns a batch of cleaned texts into a score and a negative / non-negative label (the grouping
+# the tweet model is trained on). Texts are cleaned once into a shared cache keyed by raw text: the lexicon
+# backends get a lightly normalised text (URLs, mentions and HTML entities removed, punctuation, case and
+# emoticons kept, since VADER uses them), the model gets the training preprocessing (stemmed, stopwords
+# removed). score() works through the texts in batches, so the model scores one sparse matrix per batch.
+# The ML page and the inference service score the tweet model through an engine as well (predict()).
+
+LIGHT_CLEAN_PATTERN = re.compile(r"http\S+|www\S+|@\w+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+# Function to lightly normalise a raw text for the lexicon-based backends
+def light_clean(text):
+    text = html.unescape(text).replace("`", "'")
+    return WHITESPACE_PATTERN.sub(" ", LIGHT_CLEAN_PATTERN.sub(" ", text)).strip()
+
+
+# NOTE: Backends
+# Each backend has a name, the cleaned text it reads ("light" or "model") and score_batch(cleaned_texts),
+# which returns (scores, is_negative) as numpy arrays.
+
+class VaderBackend:
+    name = "vader"
+    text_field = "light"
+
+    # VADER's recommended negative threshold on the compound score
+    NEGATIVE_THRESHOLD = -0.05
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+
+    def score_batch(self, cleaned_texts):
+        scores = np.array([self.analyzer.polarity_scores(text)["compound"] for text in cleaned_texts], dtype=np.float64)
+        return scores, scores <= self.NEGATIVE_THRESHOLD
+
+
+class TextBlobBackend:
+    name = "textblob"
+    text_field = "light"
+
+    def score_batch(self, cleaned_texts):
+        scores = np.array([TextBlob(text).sentiment.polarity for text in cleaned_texts], dtype=np.float64)
+        return scores, scores < 0
+
+
+class XGBoostBackend:
+    name = "xgboost"
+    text_field = "model"
+
+    def __init__(self, pipeline=None, threshold=None):
+        pipeline = pipeline if pipeline is not None else load_pipeline()
+
+        self.pipeline = pipeline
+        self.threshold = pipeline.threshold if threshold is None else threshold
+
+    # Function to clean one raw text with the training preprocessing (used by the engine's shared cache)
+    def clean(self, text):
+        return self.pipeline.preprocessor.clean(text)
+
+    def score_batch(self, cleaned_texts):
+        # One sparse matrix and one prediction call per batch
+        scores = np.asarray(self.pipeline.predict_negative_proba(self.pipeline.featurize(cleaned_texts)), dtype=np.float64)
+        return scores, scores >= self.threshold
+
+
+BACKENDS = {"vader": VaderBackend, "textblob": TextBlobBackend, "xgboost": XGBoostBackend}
+
+
+class SentimentEngine:
+
+    def __init__(self, backends=None, clean_cache_size=100_000):
+        backends = backends if backends is not None else list(BACKENDS)
+        self.backends = {backend.name: backend for backend in (BACKENDS[b]() if isinstance(b, str) else b for b in backends)}
+
+        # Model preprocessing comes from the model backend (if any), so the model sees exactly its training text
+        model_backend = next((backend for backend in self.backends.values() if backend.text_field == "model"), None)
+        self._model_clean = model_backend.clean if model_backend else None
+        self._light = any(backend.text_field == "light" for backend in self.backends.values())
+
+        # Shared cache of cleaned texts keyed by raw text: (light text, model text), only the texts some backend reads
+        self._clean_cached = lru_cache(maxsize=clean_cache_size)(self._clean)
+
+    def _clean(self, text):
+        return light_clean(text) if self._light else None, self._model_clean(text) if self._model_clean else None
+
+    # Function to clean many raw texts (cached per text), returns {"light": [...], "model": [...]}
+    def clean_many(self, texts):
+        cleaned = [self._clean_cached(text) for text in texts]
+        return {"light": [light for light, _ in cleaned], "model": [model for _, model in cleaned]}
+
+    # Function to get hit / miss statistics of the cleaned text cache
+    def cache_info(self):
+        return self._clean_cached.cache_info()
+
+    # Function to score a batch of raw texts with the selected backends, returns {backend: (scores, is_negative)}
+    def score_batch(self, texts, backends=None):
+        cleaned = self.clean_many(texts)
+        return {name: self.backends[name].score_batch(cleaned[self.backends[name].text_field]) for name in (backends or self.backends)}
+
+    # Function to score one batch of raw texts with a single backend, returns (cleaned texts, scores, is_negative)
+    def predict(self, texts, backend="xgboost"):
+        cleaned_texts = self.clean_many(texts)[self.backends[backend].text_field]
+        return (cleaned_texts, *self.backends[backend].score_batch(cleaned_texts))
+
+    # Function to score raw texts in batches, returns one row per text with <backend>_score / <backend>_label columns
+    def score(self, texts, backends=None, batch_size=1000):
+        texts = ["" if text is None else str(text) for text in texts]
+        backends = list(backends or self.backends)
+        columns = {f"{name}_{field}": [] for name in backends for field in ("score", "label")}
+
+        for batch in batched(texts, batch_size):
+            for name, (scores, is_negative) in self.score_batch(batch, backends).items():
+                columns[f"{name}_score"].append(scores)
+                columns[f"{name}_label"].append(np.where(is_negative, "negative", "non-negative"))
+
+        return pd.DataFrame({"text": texts, **{column: np.concatenate(parts) if parts else [] for column, parts in columns.items()}})
+
+
+# Function to get the default engine (all backends), built once per process
+@lru_cache(maxsize=None)
+def get_engine():
+    return SentimentEngine()
+
+
+# Function to score raw texts with every backend of the default engine
+def score(texts, backends=None, batch_size=1000):
+    return get_engine().score(texts, backends, batch_size)
+
+
+# NOTE: Comparison benchmark on Tweets.csv
+
+# Function to compare the backends: label agreement, accuracy against the grouped labels, latency and throughput
+def benchmark(n_tweets=None, batch_size=1000, n_latency_samples=200, seed=36):
+    import time
+    import data_store
+    from sklearn.metrics import accuracy_score, f1_score
+
+    df = data_store.load_dataset("tweets")[["text", "sentiment"]].iloc[:n_tweets]
+    texts = df["text"].tolist()
+    y_true = (df["sentiment"] == "negative").to_numpy()
+
+    engine = SentimentEngine()
+
+    # Cleaning once into the shared cache (the backends below only read cached texts)
+    start = time.perf_counter()
+    engine.clean_many(texts)
+    print(f"Cleaned {len(texts):,} tweets into the shared cache in {time.perf_counter() - start:.2f}s")
+
+    results, rows = {}, []
+    rng = np.random.default_rng(seed)
+    latency_texts = [texts[i] for i in rng.choice(len(texts), size=min(n_latency_samples, len(texts)), replace=False)]
+
+    for name in engine.backends:
+        start = time.perf_counter()
+        results[name] = engine.score(texts, [name], batch_size)
+        elapsed = time.perf_counter() - start
+
+        # Single-tweet latency (cleaned text already cached, as for repeated requests)
+        latencies = []
+        for text in latency_texts:
+            start = time.perf_counter()
+            engine.score_batch([text], [name])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        y_pred = (results[name][f"{name}_label"] == "negative").to_numpy()
+        rows.append({
+            "backend": name,
+            "tweets_per_second": len(texts) / elapsed,
+            "latency_p50_ms": np.percentile(latencies, 50),
+            "latency_p99_ms": np.percentile(latencies, 99),
+            "accuracy": accuracy_score(y_true, y_pred),
+            "negative_f1": f1_score(y_true, y_pred),
+            "negative_share": y_pred.mean(),
+        })
+
+    names = list(results)
+    agreement = pd.DataFrame(
+        [[(results[a][f"{a}_label"] == results[b][f"{b}_label"]).mean() for b in names] for a in names], index=names, columns=names
+    )
+
+    return pd.DataFrame(rows).set_index("backend"), agreement
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare the VADER, TextBlob and XGBoost sentiment backends on Tweets.csv.")
+    parser.add_argument("--tweets", type=int, default=None, help="Number of tweets to use (default: all)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Tweets per batch (default: 1000)")
+    args = parser.parse_args()
+
+    summary, agreement = benchmark(args.tweets, args.batch_size)
+
+    with pd.option_context("display.width", 200, "display.max_columns", None, "display.float_format", "{:.3f}".format):
+        print(summary)
+        print("\nLabel agreement (negative / non-negative):")
+        print(agreement)
+
+    print("\nNote: the XGBoost model was trained on 80% of Tweets.csv, so its accuracy here is optimistic.")
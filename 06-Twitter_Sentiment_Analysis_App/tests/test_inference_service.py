@@ -0,0 +1,82 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from inference_service import MicroBatcher, make_handler
+
+
+class FakePreprocessor:
+
+    def clean(self, text):
+        return text.lower()
+
+
+class FakePipeline:
+    threshold = 0.5
+    preprocessor = FakePreprocessor()
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def featurize(self, cleaned_texts):
+        if self.fail:
+            raise RuntimeError("model failure")
+        return cleaned_texts
+
+    def predict_negative_proba(self, features):
+        return np.array([0.9 if "bad" in text else 0.1 for text in features])
+
+
+@pytest.fixture
+def service(request):
+    batcher = MicroBatcher(FakePipeline(fail=request.param))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(batcher))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url + "/predict", data=json.dumps(payload).encode("utf-8"), method="POST")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _metrics(url):
+    with urllib.request.urlopen(url + "/metrics") as response:
+        return json.loads(response.read())
+
+
+@pytest.mark.parametrize("service", [False], indirect=True)
+def test_predict_scores_texts(service):
+    status, body = _post(service, {"texts": ["Bad flight", "Nice crew"]})
+
+    assert status == 200
+    assert [result["predicted_sentiment"] for result in body["results"]] == ["negative", "non-negative"]
+    assert _metrics(service)["errors"] == 0
+
+
+@pytest.mark.parametrize("service", [False], indirect=True)
+def test_invalid_request_returns_400(service):
+    status, body = _post(service, {"texts": "not a list"})
+
+    assert status == 400
+    assert _metrics(service)["errors"] == 1
+
+
+@pytest.mark.parametrize("service", [True], indirect=True)
+def test_prediction_failure_returns_500_and_counts_error(service):
+    status, body = _post(service, {"text": "Bad flight"})
+
+    assert status == 500
+    assert "model failure" in body["error"]
+    assert _metrics(service)["errors"] == 1
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+from sklearn.feature_extraction.text import TfidfVectorizer
+from xgboost import XGBClassifier
+
+from portable_model import PortableScorer, check_parity
+from preprocessing import TweetPreprocessor
+
+TWEETS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "Tweets.csv")
+
+# Vectorizer settings the portable scorer has to reproduce (the shipped model uses ngram_range=(1, 2))
+VECTORIZER_SETTINGS = [
+    {"ngram_range": (1, 1)},
+    {"ngram_range": (1, 2)},
+    {"ngram_range": (1, 3)},
+    {"ngram_range": (2, 3)},
+    {"ngram_range": (1, 3), "sublinear_tf": True, "norm": "l1"},
+    {"ngram_range": (1, 2), "norm": None, "lowercase": False},
+]
+
+
+@pytest.fixture(scope="module")
+def tweets():
+    df = pd.read_csv(TWEETS_PATH).dropna().iloc[:3000]
+    cleaned_texts = TweetPreprocessor().clean_many(df["text"].tolist())
+    return cleaned_texts, (df["sentiment"] == "negative").to_numpy(dtype=int)
+
+
+@pytest.mark.parametrize("settings", VECTORIZER_SETTINGS, ids=str)
+def test_features_and_probabilities_match_sklearn(tweets, settings):
+    cleaned_texts, labels = tweets
+    vectorizer = TfidfVectorizer(min_df=2, **settings).fit(cleaned_texts[:2000])
+
+    # Early-stopped model, so the scorer has to predict with the best iteration only
+    features = vectorizer.transform(cleaned_texts)
+    model = XGBClassifier(n_estimators=200, max_depth=4, learning_rate=0.3, early_stopping_rounds=5)
+    model.fit(features[:2000], labels[:2000], eval_set=[(features[2000:], labels[2000:])], verbose=False)
+
+    scorer = PortableScorer.from_vectorizer(vectorizer, model.get_booster())
+    actual_features = scorer.featurize(cleaned_texts)
+
+    assert abs(features - actual_features).max() < 1e-12
+    np.testing.assert_allclose(scorer.predict_negative_proba(actual_features), model.predict_proba(features)[:, 1], atol=1e-6)
+
+
+@pytest.mark.parametrize("settings", VECTORIZER_SETTINGS, ids=str)
+def test_ngrams_match_sklearn_analyzer(tweets, settings):
+    cleaned_texts, _ = tweets
+    vectorizer = TfidfVectorizer(**settings).fit(cleaned_texts[:100])
+    scorer = PortableScorer.from_vectorizer(vectorizer, xgb.Booster())
+    analyzer = vectorizer.build_analyzer()
+
+    for text in cleaned_texts[:500]:
+        assert sorted(scorer._ngrams(text)) == sorted(analyzer(text))
+
+
+def test_shipped_export_matches_pickled_pipeline():
+    parity = check_parity(n_tweets=2000)
+    assert parity["max_feature_diff"] < 1e-12
+    assert parity["label_mismatches"] == 0
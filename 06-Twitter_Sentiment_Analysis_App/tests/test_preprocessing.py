@@ -0,0 +1,36 @@
+import json
+import os
+
+import pytest
+
+from preprocessing import TweetPreprocessor, _reference_clean, verify_golden
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "preprocessing.json")
+TWEETS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "Tweets.csv")
+
+with open(GOLDEN_PATH, encoding="utf-8") as f:
+    GOLDEN_CASES = json.load(f)
+
+
+@pytest.fixture(scope="module")
+def preprocessor():
+    return TweetPreprocessor()
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES, ids=range(len(GOLDEN_CASES)))
+def test_clean_matches_golden_output(preprocessor, case):
+    assert preprocessor.clean(case["text"]) == case["expected"]
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES, ids=range(len(GOLDEN_CASES)))
+def test_golden_output_matches_reference(case):
+    assert _reference_clean(case["text"]) == case["expected"]
+
+
+def test_clean_many_matches_clean(preprocessor):
+    texts = [case["text"] for case in GOLDEN_CASES]
+    assert preprocessor.clean_many(texts) == [preprocessor.clean(text) for text in texts]
+
+
+def test_every_tweet_matches_reference():
+    assert verify_golden(TWEETS_PATH) == []
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from sentiment_engine import SentimentEngine, TextBlobBackend, VaderBackend
+
+
+class FakeModelBackend:
+    name = "xgboost"
+    text_field = "model"
+
+    def __init__(self):
+        self.cleaned = []
+
+    def clean(self, text):
+        self.cleaned.append(text)
+        return text.lower()
+
+    def score_batch(self, cleaned_texts):
+        scores = np.array([0.9 if "bad" in text else 0.1 for text in cleaned_texts])
+        return scores, scores >= 0.5
+
+
+@pytest.fixture
+def model_backend():
+    return FakeModelBackend()
+
+
+@pytest.fixture
+def engine(model_backend):
+    return SentimentEngine([VaderBackend(), TextBlobBackend(), model_backend])
+
+
+COLUMNS = ["text", "vader_score", "vader_label", "textblob_score", "textblob_label", "xgboost_score", "xgboost_label"]
+
+
+def test_score_returns_one_row_per_text_with_backend_columns(engine):
+    result = engine.score(["I love this airline!", "Bad delay, terrible service.", "Flight 42 is at gate 7."], batch_size=2)
+
+    assert list(result.columns) == COLUMNS
+    assert len(result) == 3
+    assert result["xgboost_label"].tolist() == ["non-negative", "negative", "non-negative"]
+    assert result["vader_label"].tolist()[:2] == ["non-negative", "negative"]
+    assert set(result["textblob_label"]) <= {"negative", "non-negative"}
+
+
+def test_score_empty_input(engine):
+    result = engine.score([])
+
+    assert list(result.columns) == COLUMNS
+    assert result.empty
+
+
+def test_score_converts_none_to_empty_string(engine, model_backend):
+    result = engine.score([None, "Bad"])
+
+    assert result["text"].tolist() == ["", "Bad"]
+    assert model_backend.cleaned == ["", "Bad"]
+    assert result["vader_score"][0] == 0.0
+
+
+def test_cleaned_texts_are_cached_across_backends_and_calls(engine, model_backend):
+    texts = ["Bad crew", "Great crew", "Bad crew"]
+    engine.score(texts, batch_size=1)
+    engine.score(texts)
+
+    # Each distinct text is cleaned once, for all backends and both calls
+    assert model_backend.cleaned == ["Bad crew", "Great crew"]
+    assert engine.cache_info().hits == 4
+    assert engine.cache_info().misses == 2
+
+
+def test_predict_scores_one_backend(engine):
+    cleaned_texts, scores, is_negative = engine.predict(["Bad crew", "Great crew"])
+
+    assert cleaned_texts == ["bad crew", "great crew"]
+    np.testing.assert_allclose(scores, [0.9, 0.1])
+    assert is_negative.tolist() == [True, False]
+
+
+def test_model_only_engine_skips_light_cleaning(model_backend):
+    engine = SentimentEngine([model_backend])
+
+    assert engine.clean_many(["@united Bad"]) == {"light": [None], "model": ["@united bad"]}
@@ -0,0 +1,188 @@
+# Load ML Packages
+import model_store
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, f1_score, precision_recall_curve, roc_auc_score
+from sklearn.pipeline import make_pipeline
+from xgboost import XGBClassifier
+
+# Load Batch Processing Packages
+import argparse
+import os
+import sys
+import time
+from itertools import tee
+from datetime import date
+
+# Load Preprocessing & Batch Cleaning
+from preprocessing import TweetPreprocessor
+from batch_scoring import clean_batches
+from xgb_inference import save_inference_config
+from pipeline import THRESHOLD
+
+# NOTE: Streaming (out-of-core) training of the tweet classifier
+# The training CSV is read in chunks and never held in memory. Pass 1 accumulates document frequencies of the
+# hashed word n-grams (out-of-core IDF) and the class counts; pass 2 turns each chunk into TF-IDF features and
+# trains incrementally: XGBoost adds boosting rounds per chunk, the SGD baseline uses partial_fit. Class
+# imbalance is handled with class weights from pass 1 instead of SMOTE (which needs all rows in memory).
+# The vectorizer (hashing + IDF) and the model are written as pickles to the model folder and registered in
+# checksums.json; the model's inference settings name its vectorizer, so ml_app / batch_scoring can serve it
+# (TWEET_SENTIMENT_MODEL=<model file> or batch_scoring.py --model-file).
+
+# Hashed feature space, about the size of the notebook's fitted vocabulary (127,675 n-grams)
+N_FEATURES = 2 ** 17
+SEED = 36
+
+
+# Function to build the hashing vectorizer (raw n-gram counts, same n-grams as the notebook's TfidfVectorizer)
+def make_hashing_vectorizer(n_features=N_FEATURES):
+    return HashingVectorizer(ngram_range=(1, 2), n_features=n_features, alternate_sign=False, norm=None)
+
+
+# Function to stream (cleaned text, label, holdout mask) chunks from the training CSV
+def iter_chunks(path, chunk_size, text_column, label_column, cleaned_column, holdout, n_jobs, preprocessor):
+    reader = pd.read_csv(path, chunksize=chunk_size, usecols=lambda column: column in {text_column, label_column, cleaned_column})
+    chunks, chunks_for_text = tee(chunk.dropna(subset=[label_column, cleaned_column or text_column]) for chunk in reader)
+
+    if cleaned_column:
+        cleaned_batches = (chunk[cleaned_column].astype(str).tolist() for chunk in chunks_for_text)
+    else:
+        # One process pool for the whole file, cleaning the next chunks while the current one is used
+        cleaned_batches = clean_batches((chunk[text_column].astype(str).tolist() for chunk in chunks_for_text), n_jobs, preprocessor)
+
+    for i, (chunk, cleaned_texts) in enumerate(zip(chunks, cleaned_batches)):
+        # Combine positive and neutral sentiment into one class, i.e. non-negative (negative = 1)
+        labels = (chunk[label_column] == "negative").to_numpy(dtype=int)
+
+        # Deterministic per-chunk holdout split, identical in both passes
+        holdout_mask = np.random.default_rng(SEED + i).random(len(labels)) < holdout
+
+        yield cleaned_texts, labels, holdout_mask
+
+
+# Function to accumulate document frequencies and class counts over the training rows (pass 1)
+def fit_idf(chunks, hashing_vectorizer):
+    document_frequency = np.zeros(hashing_vectorizer.n_features, dtype=np.int64)
+    class_counts = np.zeros(2, dtype=np.int64)
+
+    for cleaned_texts, labels, holdout_mask in chunks:
+        train = ~holdout_mask
+        counts = hashing_vectorizer.transform([text for text, keep in zip(cleaned_texts, train) if keep])
+
+        document_frequency += np.bincount(counts.indices, minlength=hashing_vectorizer.n_features)
+        class_counts += np.bincount(labels[train], minlength=2)
+
+    # Smoothed IDF, as TfidfVectorizer(smooth_idf=True)
+    n_documents = class_counts.sum()
+    tfidf = TfidfTransformer()
+    tfidf.idf_ = np.log((1 + n_documents) / (1 + document_frequency)) + 1
+
+    return make_pipeline(hashing_vectorizer, tfidf), class_counts
+
+
+# Function to train the model chunk by chunk (pass 2), returns the model and the holdout predictions
+def train_incremental(chunks, vectorizer, class_counts, model_type, rounds_per_chunk):
+    # Weight the (minority) negative class like "balanced" class weights
+    class_weights = class_counts.sum() / (2 * np.maximum(class_counts, 1))
+
+    model = None
+    holdout_labels, holdout_probabilities = [], []
+
+    for cleaned_texts, labels, holdout_mask in chunks:
+        features = vectorizer.transform(cleaned_texts)
+        train = ~holdout_mask
+
+        if model is not None and holdout_mask.any():
+            # Holdout rows are scored by the model trained on all previous chunks (progressive validation)
+            holdout_labels.append(labels[holdout_mask])
+            holdout_probabilities.append(model.predict_proba(features[holdout_mask])[:, 1])
+
+        # The first model needs both classes
+        if not train.any() or (model is None and len(np.unique(labels[train])) < 2):
+            continue
+
+        sample_weight = class_weights[labels[train]]
+
+        if model_type == "sgd":
+            model = model or SGDClassifier(loss="log_loss", alpha=1e-5, random_state=SEED)
+            model.partial_fit(features[train], labels[train], classes=[0, 1], sample_weight=sample_weight)
+        else:
+            previous = model.get_booster() if model is not None else None
+            model = XGBClassifier(n_estimators=rounds_per_chunk, max_depth=6, learning_rate=0.1, subsample=0.8,
+                                  colsample_bytree=0.8, objective="binary:logistic", eval_metric="logloss", random_state=SEED)
+            model.fit(features[train], labels[train], sample_weight=sample_weight, xgb_model=previous)
+
+    if holdout_labels:
+        holdout_labels, holdout_probabilities = np.concatenate(holdout_labels), np.concatenate(holdout_probabilities)
+
+    return model, holdout_labels, holdout_probabilities
+
+
+# Function to train on a CSV of tweets and write the artifacts into the model folder
+def train(path, model_type="xgboost", chunk_size=20_000, text_column="text", label_column="sentiment", cleaned_column=None,
+          holdout=0.2, rounds_per_chunk=50, n_features=N_FEATURES, n_jobs=None, threshold=None, prefix=None):
+    preprocessor = TweetPreprocessor()
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    def chunks():
+        return iter_chunks(path, chunk_size, text_column, label_column, cleaned_column, holdout, n_jobs, preprocessor)
+
+    start = time.perf_counter()
+    vectorizer, class_counts = fit_idf(chunks(), make_hashing_vectorizer(n_features))
+    print(f"Pass 1 (IDF): {class_counts.sum():,} training tweets ({class_counts[1]:,} negative) in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    start = time.perf_counter()
+    model, holdout_labels, holdout_probabilities = train_incremental(chunks(), vectorizer, class_counts, model_type, rounds_per_chunk)
+    print(f"Pass 2 ({model_type}): trained in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    if len(holdout_labels) and len(np.unique(holdout_labels)) == 2:
+        if threshold is None:
+            # Pick the decision threshold with the best F1 on the holdout rows
+            precision, recall, thresholds = precision_recall_curve(holdout_labels, holdout_probabilities)
+            f1 = 2 * precision * recall / np.maximum(precision + recall, 1e-12)
+            threshold = float(thresholds[np.argmax(f1[:-1])])
+
+        predictions = holdout_probabilities >= threshold
+        print(f"Holdout ({len(holdout_labels):,} tweets): accuracy {accuracy_score(holdout_labels, predictions):.4f}, "
+              f"F1 {f1_score(holdout_labels, predictions):.4f}, ROC AUC {roc_auc_score(holdout_labels, holdout_probabilities):.4f} "
+              f"(threshold {threshold:.3f})", file=sys.stderr)
+
+    threshold = THRESHOLD if threshold is None else threshold
+
+    # Artifacts named like the notebook's (date prefix), loadable with model_store.load_model
+    prefix = prefix or date.today().strftime("%Y%m%d")
+    vectorizer_file = f"{prefix}_HashingTFIDFVectorizer.pkl"
+    model_file = f"{prefix}_Streaming_{'SGD' if model_type == 'sgd' else 'XGBoost'}_Model.pkl"
+
+    for file_name, artifact in [(vectorizer_file, vectorizer), (model_file, model)]:
+        path = os.path.join(model_store.MODEL_DIR, file_name)
+        joblib.dump(artifact, path)
+        model_store.register_model(path)
+
+    save_inference_config(model_file, threshold, vectorizer_file)
+    print(f"Saved {vectorizer_file} and {model_file} to {model_store.MODEL_DIR}", file=sys.stderr)
+
+    return vectorizer_file, model_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the tweet sentiment classifier out-of-core on a CSV of tweets.")
+    parser.add_argument("input", help="Training CSV with tweet text and sentiment labels")
+    parser.add_argument("--model", choices=["xgboost", "sgd"], default="xgboost", help="Incremental model (default: xgboost)")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Rows per CSV chunk (default: 20000)")
+    parser.add_argument("--text-column", default="text", help="Column with the raw tweet text (default: text)")
+    parser.add_argument("--label-column", default="sentiment", help="Column with the sentiment label (default: sentiment)")
+    parser.add_argument("--cleaned-column", default=None, help="Column with already cleaned text (skips preprocessing)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of rows held out for validation (default: 0.2)")
+    parser.add_argument("--rounds-per-chunk", type=int, default=50, help="XGBoost boosting rounds added per chunk (default: 50)")
+    parser.add_argument("--n-features", type=int, default=N_FEATURES, help=f"Hashing vectorizer features (default: {N_FEATURES})")
+    parser.add_argument("--jobs", type=int, default=None, help="Preprocessing processes (default: all cores, 1 = no pool)")
+    parser.add_argument("--threshold", type=float, default=None, help="Decision threshold stored with the model (default: best holdout F1)")
+    parser.add_argument("--prefix", default=None, help="Artifact file name prefix (default: today's date, YYYYMMDD)")
+    args = parser.parse_args()
+
+    train(args.input, args.model, args.chunk_size, args.text_column, args.label_column, args.cleaned_column, args.holdout,
+          args.rounds_per_chunk, args.n_features, args.jobs, args.threshold, args.prefix)
@@ -0,0 +1,244 @@
+# Load ML Packages
+import model_store
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics import f1_score, precision_recall_curve, roc_auc_score
+from sklearn.model_selection import ParameterSampler, StratifiedKFold, train_test_split
+import xgboost as xgb
+from xgboost import XGBClassifier
+
+# Load Batch Processing Packages
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+
+# Load Data Store
+import data_store
+from xgb_inference import save_inference_config
+
+# NOTE: Reproducible hyperparameter search for the tweet model (replaces the notebook's tuning cells)
+# The preprocessed tweets are split and vectorized once (same split and TF-IDF settings as the notebook) and the
+# sparse matrices are cached on disk. Candidates from the notebook's search space are cross-validated in parallel
+# across cores with successive halving: every rung trains on a larger share of the training rows and only the
+# best 1/eta of the candidates move on. Each fit stops early on its validation fold. Every trial is appended
+# to a results file, and the best model is refit and saved with a dated name that ml_app picks up.
+# Class imbalance is handled with scale_pos_weight instead of SMOTE (imbalanced-learn is not a dependency).
+
+SEED = 36
+MATRIX_PATH = os.path.join(data_store.CACHE_DIR, f"tuning_matrix.v{data_store.CACHE_VERSION}.joblib")
+
+# Same search space as the notebook's RandomizedSearchCV (n_estimators is the early-stopping cap)
+PARAM_DISTRIBUTIONS = {
+    "max_depth": np.arange(3, 12),
+    "min_child_weight": np.arange(1, 15),
+    "gamma": np.linspace(0, 5, 15),
+    "learning_rate": np.linspace(0.01, 0.3, 15),
+    "subsample": np.linspace(0.6, 1, 8),
+    "colsample_bytree": np.linspace(0.6, 1, 8),
+    "reg_alpha": np.linspace(0, 1, 5),
+    "reg_lambda": np.linspace(1, 10, 5),
+}
+
+
+# Function to split and vectorize the preprocessed tweets once (cached on disk, rebuilt when Tweets.csv changes)
+def load_matrix():
+    source_path = os.path.join(data_store.DATA_DIR, data_store.DATASETS["tweets_processed"]["file"])
+    if os.path.exists(MATRIX_PATH) and os.path.getmtime(MATRIX_PATH) >= os.path.getmtime(source_path):
+        return joblib.load(MATRIX_PATH)
+
+    df = data_store.load_dataset("tweets_processed")
+    labels = (df["sentiment"] == "negative").to_numpy(dtype=int)
+
+    # 80% Train, 20% Test (as in the notebook)
+    X_train, X_test, y_train, y_test = train_test_split(df["stemmed_text"].tolist(), labels, test_size=0.2, random_state=SEED)
+
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    matrix = {
+        "vectorizer": vectorizer,
+        "X_train": vectorizer.fit_transform(X_train).astype(np.float32),
+        "X_test": vectorizer.transform(X_test).astype(np.float32),
+        "y_train": y_train,
+        "y_test": y_test,
+    }
+
+    os.makedirs(data_store.CACHE_DIR, exist_ok=True)
+    joblib.dump(matrix, MATRIX_PATH)
+
+    return matrix
+
+
+# Function to build the classifier for one candidate (sklearn API, so the saved model works with the app)
+def make_model(params, n_rounds, scale_pos_weight, n_jobs=-1):
+    return XGBClassifier(**params, n_estimators=n_rounds, scale_pos_weight=scale_pos_weight, objective="binary:logistic",
+                         eval_metric="logloss", tree_method="hist", n_jobs=n_jobs, random_state=SEED)
+
+
+# Function to fit and score one candidate on one fold (runs in a worker process)
+def _run_trial(X, y, train_idx, valid_idx, params, max_rounds, early_stopping_rounds, scale_pos_weight):
+    start = time.perf_counter()
+
+    # Native training API: with an eval set on this wide sparse matrix it is much faster than XGBClassifier.fit
+    train_matrix = xgb.DMatrix(X[train_idx], label=y[train_idx])
+    valid_matrix = xgb.DMatrix(X[valid_idx], label=y[valid_idx])
+    booster_params = {**params, "scale_pos_weight": scale_pos_weight, "objective": "binary:logistic", "eval_metric": "logloss",
+                      "tree_method": "hist", "nthread": 1, "seed": SEED}
+
+    booster = xgb.train(booster_params, train_matrix, max_rounds, evals=[(valid_matrix, "valid")],
+                        early_stopping_rounds=early_stopping_rounds, verbose_eval=False)
+    probabilities = booster.predict(valid_matrix, iteration_range=(0, booster.best_iteration + 1))
+
+    return {
+        "f1": f1_score(y[valid_idx], probabilities >= 0.5),
+        "roc_auc": roc_auc_score(y[valid_idx], probabilities),
+        "best_iteration": int(booster.best_iteration),
+        "fit_time_s": time.perf_counter() - start,
+    }
+
+
+# Function to fit one model on a fold and predict its validation rows (runs in a worker process)
+def _fit_predict(X, y, train_idx, valid_idx, params, n_rounds, scale_pos_weight):
+    model = make_model(params, n_rounds, scale_pos_weight, n_jobs=1)
+    model.fit(X[train_idx], y[train_idx])
+    return valid_idx, model.predict_proba(X[valid_idx])[:, 1]
+
+
+# Function to get out-of-fold probabilities for the training rows (every row scored by a model that did not see it)
+def out_of_fold_probabilities(X, y, params, n_rounds, scale_pos_weight, n_folds=3, n_jobs=-1):
+    cv = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=SEED)
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_predict)(X, y, train_idx, valid_idx, params, n_rounds, scale_pos_weight) for train_idx, valid_idx in cv.split(X, y)
+    )
+
+    probabilities = np.empty(len(y), dtype=np.float64)
+    for valid_idx, fold_probabilities in outputs:
+        probabilities[valid_idx] = fold_probabilities
+
+    return probabilities
+
+
+# Function to pick the decision threshold with the best F1
+def best_f1_threshold(labels, probabilities):
+    precision, recall, thresholds = precision_recall_curve(labels, probabilities)
+    return float(thresholds[np.argmax(2 * precision[:-1] * recall[:-1] / np.maximum(precision[:-1] + recall[:-1], 1e-12))])
+
+
+# Function to append trial records to the results file (CSV)
+def _record_trials(results_path, records):
+    pd.DataFrame(records).to_csv(results_path, mode="a", header=not os.path.exists(results_path), index=False)
+
+
+# Function to run the successive-halving search, returns the best candidate's params and number of rounds
+def successive_halving(X, y, n_candidates=27, eta=3, n_folds=3, max_rounds=600, early_stopping_rounds=30, n_jobs=-1, results_path=None):
+    candidates = [
+        {key: value.item() if hasattr(value, "item") else value for key, value in params.items()}
+        for params in ParameterSampler(PARAM_DISTRIBUTIONS, n_candidates, random_state=SEED)
+    ]
+    candidate_ids = list(range(len(candidates)))
+
+    scale_pos_weight = float((y == 0).sum() / max((y == 1).sum(), 1))
+    n_rungs = max(1, int(np.floor(np.log(len(candidates)) / np.log(eta))) + 1)
+    cv = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=SEED)
+
+    with Parallel(n_jobs=n_jobs) as parallel:
+        for rung in range(n_rungs):
+            # Share of the training rows used in this rung (all rows in the last rung)
+            fraction = float(eta) ** (rung - n_rungs + 1)
+            if fraction < 1:
+                rows, _ = train_test_split(np.arange(len(y)), train_size=fraction, stratify=y, random_state=SEED + rung)
+            else:
+                rows = np.arange(len(y))
+
+            folds = [(rows[train_idx], rows[valid_idx]) for train_idx, valid_idx in cv.split(rows, y[rows])]
+            tasks = [(candidate_id, fold) for candidate_id in candidate_ids for fold in range(n_folds)]
+
+            start = time.perf_counter()
+            outputs = parallel(
+                delayed(_run_trial)(X, y, *folds[fold], candidates[candidate_id], max_rounds, early_stopping_rounds, scale_pos_weight)
+                for candidate_id, fold in tasks
+            )
+
+            records = [
+                {"candidate": candidate_id, "rung": rung, "rows": len(rows), "fold": fold, **output, "params": json.dumps(candidates[candidate_id])}
+                for (candidate_id, fold), output in zip(tasks, outputs)
+            ]
+            if results_path:
+                _record_trials(results_path, records)
+
+            scores = pd.DataFrame(records).groupby("candidate").agg(f1=("f1", "mean"), roc_auc=("roc_auc", "mean"), best_iteration=("best_iteration", "mean"))
+            scores = scores.sort_values(["f1", "roc_auc"], ascending=False)
+
+            print(f"Rung {rung + 1}/{n_rungs}: {len(candidate_ids)} candidates x {n_folds} folds on {len(rows):,} tweets in "
+                  f"{time.perf_counter() - start:.1f}s, best F1 {scores['f1'].iloc[0]:.4f}", file=sys.stderr)
+
+            # Keep the best 1 / eta of the candidates for the next rung
+            candidate_ids = scores.index[:max(1, len(candidate_ids) // eta)].tolist()
+
+    best_id = candidate_ids[0]
+    return candidates[best_id], int(round(scores.loc[best_id, "best_iteration"])) + 1
+
+
+# Function to tune, refit and save the best model with a dated name
+def tune(n_candidates=27, eta=3, n_folds=3, max_rounds=600, early_stopping_rounds=30, n_jobs=-1, prefix=None):
+    prefix = prefix or date.today().strftime("%Y%m%d")
+    results_path = os.path.join(model_store.MODEL_DIR, f"{prefix}_Tuning_Trials.csv")
+
+    start = time.perf_counter()
+    matrix = load_matrix()
+    X_train, y_train = matrix["X_train"], matrix["y_train"]
+    print(f"Matrix: {X_train.shape[0]:,} x {X_train.shape[1]:,} training features in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    best_params, n_rounds = successive_halving(X_train, y_train, n_candidates, eta, n_folds, max_rounds, early_stopping_rounds, n_jobs, results_path)
+    print(f"Best parameters ({n_rounds} rounds): {best_params}", file=sys.stderr)
+
+    scale_pos_weight = float((y_train == 0).sum() / max((y_train == 1).sum(), 1))
+
+    # Decision threshold with the best F1 on out-of-fold predictions of the training rows (the test split stays
+    # untouched until the final report), stored alongside the model
+    start = time.perf_counter()
+    oof_probabilities = out_of_fold_probabilities(X_train, y_train, best_params, n_rounds, scale_pos_weight, n_folds, n_jobs)
+    threshold = best_f1_threshold(y_train, oof_probabilities)
+    print(f"Out-of-fold ({n_folds} folds): F1 {f1_score(y_train, oof_probabilities >= threshold):.4f} at threshold {threshold:.3f} "
+          f"in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    # Refit on all training rows with the early-stopped number of rounds
+    model = make_model(best_params, n_rounds, scale_pos_weight, n_jobs)
+    model.fit(X_train, y_train)
+
+    # Test split, scored once at the fixed threshold
+    probabilities = model.predict_proba(matrix["X_test"])[:, 1]
+    print(f"Test split: F1 {f1_score(matrix['y_test'], probabilities >= threshold):.4f}, "
+          f"ROC AUC {roc_auc_score(matrix['y_test'], probabilities):.4f} (threshold {threshold:.3f})", file=sys.stderr)
+
+    # Dated artifacts, picked up by ml_app / batch_scoring through xgb_inference.serving_files
+    vectorizer_file = f"{prefix}_TFIDFVectorizer.pkl"
+    model_file = f"{prefix}_Tuned_XGBoost_Model.pkl"
+
+    for file_name, artifact in [(vectorizer_file, matrix["vectorizer"]), (model_file, model)]:
+        path = os.path.join(model_store.MODEL_DIR, file_name)
+        joblib.dump(artifact, path)
+        model_store.register_model(path)
+
+    save_inference_config(model_file, threshold, vectorizer_file)
+    print(f"Saved {vectorizer_file} and {model_file} to {model_store.MODEL_DIR} (trials: {results_path})", file=sys.stderr)
+
+    return model_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune and train the tweet sentiment XGBoost model.")
+    parser.add_argument("--candidates", type=int, default=27, help="Sampled parameter candidates (default: 27)")
+    parser.add_argument("--eta", type=int, default=3, help="Successive halving factor (default: 3)")
+    parser.add_argument("--folds", type=int, default=3, help="Cross-validation folds (default: 3)")
+    parser.add_argument("--max-rounds", type=int, default=600, help="Boosting rounds cap per fit (default: 600)")
+    parser.add_argument("--early-stopping", type=int, default=30, help="Early stopping rounds (default: 30)")
+    parser.add_argument("--jobs", type=int, default=-1, help="Parallel fits (default: all cores)")
+    parser.add_argument("--prefix", default=None, help="Artifact file name prefix (default: today's date, YYYYMMDD)")
+    args = parser.parse_args()
+
+    tune(args.candidates, args.eta, args.folds, args.max_rounds, args.early_stopping, args.jobs, args.prefix)
@@ -0,0 +1,151 @@
+# Load ML Packages
+import model_store
+import numpy as np
+import scipy.sparse as sp
+
+import json
+import os
+
+# Load Sentiment Pipeline Defaults
+from pipeline import THRESHOLD
+
+# NOTE: XGBoost inference wrapper
+# Scores with the model's native booster (inplace_predict straight on the CSR matrix from the vectorizer),
+# skipping the sklearn-API input checks and DMatrix construction of predict_proba. The decision threshold
+# is stored next to the model file (<model>.inference.json), so retrained models can ship their own threshold
+# and the vectorizer they were trained with.
+
+MODEL_FILE = "20250322_Tuned_XGBoost_Model.pkl"
+
+# Environment variable naming the model file to serve (e.g. a streaming model), instead of the newest tuned model
+SERVING_MODEL_ENV = "TWEET_SENTIMENT_MODEL"
+
+
+# Function to get the path of the inference settings stored alongside a model file
+def config_path(model_file):
+    return os.path.join(model_store.MODEL_DIR, os.path.splitext(model_file)[0] + ".inference.json")
+
+
+# Function to read the inference settings of a model (defaults when none are stored)
+def load_inference_config(model_file):
+    config = {"threshold": THRESHOLD}
+
+    path = config_path(model_file)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config.update(json.load(f))
+
+    return config
+
+
+# Function to get the boosting rounds to predict with: up to the best iteration of an early-stopped booster,
+# otherwise all trees (the same rounds predict_proba uses)
+def best_iteration_range(booster):
+    best_iteration = booster.attr("best_iteration")
+    return (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+
+
+# Function to store the decision threshold (and the vectorizer the model was trained with) alongside a model file
+def save_inference_config(model_file, threshold, vectorizer_file=None):
+    config = {"threshold": float(threshold)}
+    if vectorizer_file:
+        config["vectorizer"] = vectorizer_file
+
+    with open(config_path(model_file), "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+        f.write("\n")
+
+
+# Function to pick the model to serve and its vectorizer: the given model file, the TWEET_SENTIMENT_MODEL
+# environment variable or the newest tuned model (vectorizer from the inference settings, else the same date's TF-IDF)
+def serving_files(model_file=None):
+    model_file = model_file or os.environ.get(SERVING_MODEL_ENV) or model_store.latest_model("Tuned_XGBoost_Model.pkl", MODEL_FILE)
+    vectorizer_file = load_inference_config(model_file).get("vectorizer") or model_file.split("_")[0] + "_TFIDFVectorizer.pkl"
+    return model_file, vectorizer_file
+
+
+class XGBoostScorer:
+
+    # The booster is configured once here (thread count), so predictions never change shared booster state
+    def __init__(self, booster, threshold=THRESHOLD, n_jobs=None):
+        self.booster = booster
+        self.threshold = threshold
+        self.n_jobs = n_jobs
+        self.iteration_range = best_iteration_range(booster)
+        booster.set_param({"nthread": n_jobs or os.cpu_count() or 1})
+
+    # Function to build a scorer from a fitted XGBClassifier (threshold from the stored inference settings)
+    # n_jobs: prediction threads (None = all cores, 1 is best for single tweets)
+    @classmethod
+    def from_model(cls, model, model_file=MODEL_FILE, n_jobs=None):
+        return cls(model.get_booster(), load_inference_config(model_file)["threshold"], n_jobs)
+
+    # Function to load the model through the model store and wrap it
+    @classmethod
+    def load(cls, model_file=MODEL_FILE, n_jobs=None):
+        return cls.from_model(model_store.load_model(model_file), model_file, n_jobs)
+
+    # Function to get the probability of the negative class for a feature matrix
+    def predict_negative_proba(self, features):
+        if sp.issparse(features) and features.format != "csr":
+            features = features.tocsr()
+
+        return self.booster.inplace_predict(features, iteration_range=self.iteration_range, validate_features=False)
+
+    # Function to get the 0 / 1 (negative) predictions at the stored threshold
+    def predict(self, features, threshold=None):
+        threshold = self.threshold if threshold is None else threshold
+        return (self.predict_negative_proba(features) >= threshold).astype(int)
+
+
+# Function to wrap a loaded model for serving: XGBoost models are scored through their native booster, other
+# sklearn-API classifiers (e.g. the streaming SGD baseline) are used as they are
+def make_scorer(model, model_file=MODEL_FILE, n_jobs=None):
+    if hasattr(model, "get_booster"):
+        return XGBoostScorer.from_model(model, model_file, n_jobs)
+    return model
+
+
+# NOTE: Benchmark (sklearn predict_proba vs native booster)
+
+# Function to time single-tweet latency and batch throughput of both prediction paths
+def benchmark(n_single=500, batch_size=1000, n_jobs=None):
+    import time
+    import data_store
+
+    model = model_store.load_model(MODEL_FILE)
+    vectorizer = model_store.load_model("20250322_TFIDFVectorizer.pkl", mmap_mode="r")
+    features = vectorizer.transform(data_store.load_dataset("tweets_processed")["stemmed_text"])
+
+    # One scorer per thread setting (each on its own copy of the booster, as separately loaded models would be)
+    single_scorer = XGBoostScorer(model.get_booster().copy(), n_jobs=1)
+    batch_scorer = XGBoostScorer(model.get_booster().copy(), n_jobs=n_jobs)
+    paths = {
+        "sklearn": (lambda X: model.predict_proba(X)[:, 1], lambda X: model.predict_proba(X)[:, 1]),
+        "booster": (single_scorer.predict_negative_proba, batch_scorer.predict_negative_proba),
+    }
+
+    # Both paths must give the same probabilities
+    max_diff = np.abs(paths["sklearn"][1](features) - paths["booster"][1](features)).max()
+    print(f"Max probability difference: {max_diff:.2e}")
+
+    for name, (predict_single, predict_batch) in paths.items():
+        # Single-row latency (one tweet per call, as on the Streamlit page)
+        latencies = []
+        for i in range(n_single):
+            start = time.perf_counter()
+            predict_single(features[i:i + 1])
+            latencies.append(time.perf_counter() - start)
+
+        # Batch throughput
+        start = time.perf_counter()
+        for i in range(0, features.shape[0], batch_size):
+            predict_batch(features[i:i + batch_size])
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:>8}: single-row p50 {np.median(latencies) * 1000:.3f} ms, p99 {np.percentile(latencies, 99) * 1000:.3f} ms | "
+              f"batch {features.shape[0] / elapsed:,.0f} tweets/second")
+
+
+if __name__ == "__main__":
+    benchmark()